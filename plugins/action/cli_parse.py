@@ -11,6 +11,10 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import json
+import os
+import sys
+import time
+from contextlib import contextmanager
 from importlib import import_module
 
 from ansible.errors import AnsibleActionFail
@@ -19,6 +23,7 @@ from ansible.module_utils.connection import (
     Connection,
     ConnectionError as AnsibleConnectionError,
 )
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.plugins.action import ActionBase
 from ansible_collections.ansible.utils.plugins.modules.cli_parse import (
     DOCUMENTATION,
@@ -26,6 +31,10 @@ from ansible_collections.ansible.utils.plugins.modules.cli_parse import (
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     check_argspec,
 )
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
+    LruCache,
+    to_native_types,
+)
 
 # python 2.7 compat for FileNotFoundError
 try:
@@ -33,16 +42,140 @@ try:
 except NameError:
     FileNotFoundError = IOError
 
+# python 2.7 compat for the wall and CPU clocks
+try:
+    _wall_clock = time.perf_counter
+    _cpu_clock = time.process_time
+except AttributeError:
+    _wall_clock = time.time
+    _cpu_clock = time.clock
+
+try:
+    import cProfile
+
+    HAS_CPROFILE = True
+except ImportError:
+    HAS_CPROFILE = False
+
 
 ARGSPEC_CONDITIONALS = {
     "argument_spec": {
         "parser": {"mutually_exclusive": [["command", "template_path"]]}
     },
-    "required_one_of": [["command", "text"]],
-    "mutually_exclusive": [["command", "text"]],
+    "required_one_of": [["command", "text", "commands"]],
+    "mutually_exclusive": [["command", "text", "commands"]],
+    "required_by": {"command": "parser", "text": "parser"},
+}
+
+
+PARSER_REGISTRY_SIZE = 32
+TEMPLATE_PATHS_SIZE = 64
+
+# the caches are per process, each host of a task runs in its own worker
+# process so they are only reused within a task and host
+
+# requested parser name: (parser class or None, error, warning)
+_PARSER_REGISTRY = LruCache(maxsize=PARSER_REGISTRY_SIZE)
+
+# (search path, basedir, template file name): template path
+_TEMPLATE_PATHS = LruCache(maxsize=TEMPLATE_PATHS_SIZE)
+
+# optional libraries used by the parsers, module flag: library
+PARSER_LIBRARIES = {
+    "HAS_TEXTFSM": "textfsm",
+    "HAS_TTP": "ttp",
+    "HAS_XMLTODICT": "xmltodict",
 }
 
 
+# environment variables enabling the timings and the profile for every task
+TIMINGS_ENV = "ANSIBLE_CLI_PARSE_TIMINGS"
+PROFILE_DIR_ENV = "ANSIBLE_CLI_PARSE_PROFILE_DIR"
+
+
+class _PhaseTimer(object):
+    """ Record the wall and CPU time of the phases of a task
+    """
+
+    def __init__(self):
+        self._start = (_wall_clock(), _cpu_clock())
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        """ Time the block as the phase name, a phase timed
+        more than once is added up
+
+        :param name: The name of the phase
+        :type name: str
+        """
+        wall, cpu = _wall_clock(), _cpu_clock()
+        try:
+            yield
+        finally:
+            timing = self.phases.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+            timing["wall"] += _wall_clock() - wall
+            timing["cpu"] += _cpu_clock() - cpu
+
+    def timings(self):
+        """ The timings of the phases and of the whole task, in seconds
+
+        :return: The timings
+        :rtype: dict
+        """
+        phases = dict(
+            (
+                name,
+                dict(
+                    (clock, round(value, 6)) for clock, value in timing.items()
+                ),
+            )
+            for name, timing in self.phases.items()
+        )
+        return {
+            "phases": phases,
+            "total": {
+                "wall": round(_wall_clock() - self._start[0], 6),
+                "cpu": round(_cpu_clock() - self._start[1], 6),
+            },
+        }
+
+
+def available_parsers():
+    """ List the parsers in this collection and the optional libraries
+    each parser found
+
+    :return: parser name: {"available": bool, "libraries": {library: bool}}
+    :rtype: dict
+    """
+    package = (
+        "ansible_collections.ansible.utils.plugins.sub_plugins.cli_parser"
+    )
+    names = set()
+    for path in getattr(import_module(package), "__path__", []):
+        for fname in os.listdir(path):
+            if fname.endswith("_parser.py"):
+                names.add(fname[: -len("_parser.py")])
+
+    parsers = {}
+    for name in sorted(names):
+        requested_parser = "ansible.utils.{name}".format(name=name)
+        parsercls, _error, _warning = ActionModule._resolve_parser(
+            requested_parser
+        )
+        libraries = {}
+        if parsercls is not None:
+            module = sys.modules[parsercls.__module__]
+            for flag, library in PARSER_LIBRARIES.items():
+                if hasattr(module, flag):
+                    libraries[library] = getattr(module, flag)
+        parsers[requested_parser] = {
+            "available": parsercls is not None and all(libraries.values()),
+            "libraries": libraries,
+        }
+    return parsers
+
+
 class ActionModule(ActionBase):
     """ action module
     """
@@ -55,6 +188,7 @@ class ActionModule(ActionBase):
         self._parser_name = None
         self._result = {}
         self._task_vars = None
+        self._timer = None
 
     def _debug(self, msg):
         """ Output text using ansible's display
@@ -81,6 +215,13 @@ class ActionModule(ActionBase):
         that cannot be covered using stnd techniques
         """
         errors = []
+        if self._task.args.get("commands"):
+            self._extended_check_commands(errors)
+            if errors:
+                self._result["failed"] = True
+                self._result["msg"] = " ".join(errors)
+            return
+
         requested_parser = self._task.args.get("parser").get("name")
         if len(requested_parser.split(".")) != 3:
             msg = "Parser name should be provided as a full name including collection"
@@ -100,15 +241,52 @@ class ActionModule(ActionBase):
             self._result["failed"] = True
             self._result["msg"] = " ".join(errors)
 
-    def _load_parser(self, task_vars):
-        """ Load a parser from the fs
+    def _extended_check_commands(self, errors):
+        """ Check each entry of commands has a parser with a full name
+        and a command not used by another entry, the results are keyed
+        by command
 
-        :param task_vars: The vars provided when the task was run
-        :type task_vars: dict
-        :return: An instance of class CliParser
-        :rtype: CliParser
+        :param errors: The list the error messages are added to
+        :type errors: list
         """
-        requested_parser = self._task.args.get("parser").get("name")
+        commands = []
+        for entry in self._task.args.get("commands"):
+            if entry.get("command") in commands:
+                errors.append(
+                    "Command '{command}' is provided more than once"
+                    " in commands.".format(command=entry.get("command"))
+                )
+            commands.append(entry.get("command"))
+            parser = entry.get("parser") or self._task.args.get("parser")
+            if not parser:
+                errors.append(
+                    "Either commands/parser or parser needs to be provided"
+                    " for command '{command}'.".format(
+                        command=entry.get("command")
+                    )
+                )
+            elif len(parser.get("name").split(".")) != 3:
+                msg = "Parser name should be provided as a full name including collection"
+                if msg not in errors:
+                    errors.append(msg)
+
+    @classmethod
+    def _resolve_parser(cls, requested_parser):
+        """ Resolve a parser name to the parser class
+        The result, including a failure, is cached in the parser registry
+        of the worker process, it is reused by the entries of commands and
+        the other tasks run in the same process
+
+        :param requested_parser: The full name of the parser
+        :type requested_parser: str
+        :return: The parser class or None, the error and a warning
+        :rtype: tuple
+        """
+        resolved = _PARSER_REGISTRY.get(requested_parser)
+        if resolved is not None:
+            return resolved
+
+        warning = None
         cref = dict(
             zip(["corg", "cname", "plugin"], requested_parser.split("."))
         )
@@ -119,27 +297,22 @@ class ActionModule(ActionBase):
             "xml",
         ]:
             cref["cname"] = "utils"
-            msg = (
+            warning = (
                 "Use 'ansible.utils.{plugin}' for parser name instead of '{requested_parser}'."
                 " This feature will be removed from 'ansible.netcommon' collection in a release"
                 " after 2022-11-01".format(
                     plugin=cref["plugin"], requested_parser=requested_parser
                 )
             )
-            self._display.warning(msg)
 
         parserlib = "ansible_collections.{corg}.{cname}.plugins.sub_plugins.cli_parser.{plugin}_parser".format(
             **cref
         )
         try:
-            parsercls = getattr(import_module(parserlib), self.PARSER_CLS_NAME)
-            parser = parsercls(
-                task_args=self._task.args,
-                task_vars=task_vars,
-                debug=self._debug,
-            )
-            return parser
+            parsercls = getattr(import_module(parserlib), cls.PARSER_CLS_NAME)
+            resolved = (parsercls, None, warning)
         except Exception as exc:
+            resolved = (None, to_native(exc), warning)
             # TODO: The condition is added to support old sub-plugin strucutre.
             # Remove the if condition after ansible.netcommon.cli_parse module is removed
             # from ansible.netcommon collection
@@ -153,26 +326,46 @@ class ActionModule(ActionBase):
                 )
                 try:
                     parsercls = getattr(
-                        import_module(parserlib), self.PARSER_CLS_NAME
-                    )
-                    parser = parsercls(
-                        task_args=self._task.args,
-                        task_vars=task_vars,
-                        debug=self._debug,
+                        import_module(parserlib), cls.PARSER_CLS_NAME
                     )
-                    return parser
+                    resolved = (parsercls, None, warning)
                 except Exception as exc:
-                    self._result["failed"] = True
-                    self._result["msg"] = "Error loading parser: {err}".format(
-                        err=to_native(exc)
-                    )
-                    return None
+                    resolved = (None, to_native(exc), warning)
 
-            self._result["failed"] = True
-            self._result["msg"] = "Error loading parser: {err}".format(
-                err=to_native(exc)
+        _PARSER_REGISTRY.set(requested_parser, resolved)
+        return resolved
+
+    def _load_parser(self, task_vars):
+        """ Load a parser from the fs
+
+        :param task_vars: The vars provided when the task was run
+        :type task_vars: dict
+        :return: An instance of class CliParser
+        :rtype: CliParser
+        """
+        requested_parser = self._task.args.get("parser").get("name")
+        parsercls, error, warning = self._resolve_parser(requested_parser)
+        if warning:
+            self._display.warning(warning)
+        if parsercls is not None:
+            self._debug(
+                "parser {name} resolved to {cls}".format(
+                    name=requested_parser, cls=parsercls.__module__
+                )
             )
-            return None
+            try:
+                parser = parsercls(
+                    task_args=self._task.args,
+                    task_vars=task_vars,
+                    debug=self._debug,
+                )
+                return parser
+            except Exception as exc:
+                error = to_native(exc)
+
+        self._result["failed"] = True
+        self._result["msg"] = "Error loading parser: {err}".format(err=error)
+        return None
 
     def _set_parser_command(self):
         """ Set the /parser/command in the task args based on /command if needed
@@ -233,7 +426,7 @@ class ActionModule(ActionBase):
             fname = "{os}_{cmd}.{ext}".format(
                 os=oper_sys, cmd=cmd_as_fname, ext=template_extension
             )
-            source = self._find_needle("templates", fname)
+            source = self._find_template(fname)
             self._debug(
                 "template_path in task args updated to {source}".format(
                     source=source
@@ -241,6 +434,32 @@ class ActionModule(ActionBase):
             )
             self._task.args["parser"]["template_path"] = source
 
+    def _find_template(self, fname):
+        """ Find a template in the templates directories of the search path
+        The path found is cached in the worker process by search path and
+        file name, and is used for as long as the file still exists
+
+        :param fname: The name of the template file
+        :type fname: str
+        :return: The path to the template
+        :rtype: str
+        """
+        key = (
+            tuple(self._task.get_search_path() or ()),
+            self._loader.get_basedir(),
+            fname,
+        )
+        source = _TEMPLATE_PATHS.get(key)
+        if source is not None:
+            if os.path.isfile(source):
+                self._debug(
+                    "template path cache hit for {fname}".format(fname=fname)
+                )
+                return source
+        source = self._find_needle("templates", fname)
+        _TEMPLATE_PATHS.set(key, source)
+        return source
+
     def _get_template_contents(self):
         """ Retrieve the contents of the parser template
 
@@ -277,6 +496,14 @@ class ActionModule(ActionBase):
         self._result.pop("stdout", None)
         self._result.pop("stdout_lines", None)
 
+    def _want_stdout_lines(self):
+        """ Check if the output should also be returned split in lines
+
+        :return: The value of the stdout_lines option
+        :rtype: bool
+        """
+        return boolean(self._task.args.get("stdout_lines", True), strict=False)
+
     def _run_command(self):
         """ Run a command on the host
         If socket_path exists, assume it's a network device
@@ -290,7 +517,8 @@ class ActionModule(ActionBase):
                 try:
                     response = connection.get(command=command)
                     self._result["stdout"] = response
-                    self._result["stdout_lines"] = response.splitlines()
+                    if self._want_stdout_lines():
+                        self._result["stdout_lines"] = response.splitlines()
                 except AnsibleConnectionError as exc:
                     self._result["failed"] = True
                     self._result["msg"] = [to_text(exc)]
@@ -300,7 +528,194 @@ class ActionModule(ActionBase):
                     self._result["failed"] = True
                     self._result["msg"] = result["stderr"]
                 self._result["stdout"] = result["stdout"]
-                self._result["stdout_lines"] = result["stdout_lines"]
+                if self._want_stdout_lines():
+                    self._result["stdout_lines"] = result["stdout_lines"]
+
+    def _batch_supported(self, connection):
+        """ Check if the connection can run a list of commands at once
+
+        :param connection: The connection to the host
+        :type connection: Connection
+        :return: True if the cliconf plugin has run_commands
+        :rtype: bool
+        """
+        try:
+            capabilities = json.loads(connection.get_capabilities())
+        except Exception as exc:
+            self._debug(
+                "capabilities not available, {err}".format(err=to_text(exc))
+            )
+            return False
+        return "run_commands" in capabilities.get("rpc", [])
+
+    def _run_commands(self, commands):
+        """ Run a list of commands on the host, in one batch over the
+        persistent connection when it is supported
+
+        :param commands: The commands to run
+        :type commands: list
+        :return: The output of each command, in the order of the commands
+        :rtype: list
+        """
+        socket_path = self._connection.socket_path
+        if not socket_path:
+            responses = []
+            for command in commands:
+                result = self._low_level_execute_command(cmd=command)
+                if result["rc"]:
+                    self._result["failed"] = True
+                    self._result["msg"] = result["stderr"]
+                    return None
+                responses.append(result["stdout"])
+            return responses
+
+        connection = Connection(socket_path)
+        try:
+            if self._batch_supported(connection):
+                self._debug(
+                    "running {count} commands in one batch".format(
+                        count=len(commands)
+                    )
+                )
+                return connection.run_commands(commands=commands)
+            return [connection.get(command=command) for command in commands]
+        except AnsibleConnectionError as exc:
+            self._result["failed"] = True
+            self._result["msg"] = [to_text(exc)]
+            return None
+
+    def _parse_command(self, command_args, parsers, task_vars):
+        """ Parse the output of one entry of commands
+        The task args are replaced by the args of the entry while it is
+        parsed so the template lookup works as it does for one command,
+        a parser instance is made once for each parser name
+
+        :param command_args: The command, parser and text of the entry
+        :type command_args: dict
+        :param parsers: The parser instances, by parser name
+        :type parsers: dict
+        :param task_vars: The vars provided when the task is run
+        :type task_vars: dict
+        :return: The result from the parser or None on failure
+        :rtype: dict
+        """
+        task_args = self._task.args
+        self._task.args = command_args
+        try:
+            with self._timer.phase("parser_load"):
+                self._set_parser_command()
+                name = command_args["parser"]["name"]
+                parser = parsers.get(name)
+                if parser is None:
+                    parser = self._load_parser(task_vars)
+                    if parser is None:
+                        return None
+                    parsers[name] = parser
+                else:
+                    parser._task_args = command_args
+
+            with self._timer.phase("template"):
+                if getattr(parser, "DEFAULT_TEMPLATE_EXTENSION", False):
+                    self._update_template_path(
+                        parser.DEFAULT_TEMPLATE_EXTENSION
+                    )
+                if getattr(parser, "PROVIDE_TEMPLATE_CONTENTS", False) is True:
+                    template_contents = self._get_template_contents()
+                else:
+                    template_contents = None
+
+            try:
+                with self._timer.phase("parse"):
+                    result = parser.parse(template_contents=template_contents)
+                with self._timer.phase("normalize"):
+                    if not getattr(parser, "NATIVE_OUTPUT", False):
+                        result = to_native_types(result)
+            except Exception as exc:
+                raise AnsibleActionFail(
+                    "Unhandled exception from parser '{parser}' for command '{command}'."
+                    " Error: {err}".format(
+                        parser=name,
+                        command=command_args["command"],
+                        err=to_native(exc),
+                    )
+                )
+            return result
+        finally:
+            self._task.args = task_args
+
+    def _run_many(self, task_vars):
+        """ Run and parse each entry of commands
+
+        :param task_vars: The vars provided when the task is run
+        :type task_vars: dict
+        :return: The results from the parsers, by command
+        :rtype: dict
+        """
+        entries = self._task.args.get("commands")
+        commands = [entry["command"] for entry in entries]
+
+        with self._timer.phase("command"):
+            responses = self._run_commands(commands)
+        if self._result.get("failed"):
+            return self._result
+        stdout = dict(zip(commands, responses))
+        self._result["stdout"] = stdout
+        if self._want_stdout_lines():
+            self._result["stdout_lines"] = dict(
+                (command, to_text(response).splitlines())
+                for command, response in stdout.items()
+            )
+
+        parsers = {}
+        parsed = {}
+        for entry in entries:
+            parser_args = entry.get("parser") or self._task.args.get("parser")
+            command_args = {
+                "command": entry["command"],
+                "text": stdout[entry["command"]],
+                "parser": dict(parser_args),
+            }
+            result = self._parse_command(command_args, parsers, task_vars)
+            if self._result.get("failed"):
+                self._prune_result()
+                return self._result
+            if result.get("errors"):
+                self._prune_result()
+                self._result.update(
+                    {
+                        "failed": True,
+                        "msg": "Command '{command}': {errors}".format(
+                            command=entry["command"],
+                            errors=" ".join(result["errors"]),
+                        ),
+                    }
+                )
+                return self._result
+            parsed[entry["command"]] = result["parsed"]
+
+        self._result["parsed"] = parsed
+        set_fact = self._task.args.get("set_fact")
+        if set_fact:
+            self._result["ansible_facts"] = {set_fact: parsed}
+        return self._result
+
+    def _profile_path(self, profile_dir):
+        """ Build the path of the cProfile statistics file of the task
+
+        :param profile_dir: The directory for the statistics files
+        :type profile_dir: str
+        :return: The path of the file
+        :rtype: str
+        """
+        profile_dir = os.path.abspath(os.path.expanduser(profile_dir))
+        if not os.path.isdir(profile_dir):
+            os.makedirs(profile_dir)
+        fname = "cli_parse_{host}_{pid}_{stamp}.prof".format(
+            host=self._playhost or "localhost",
+            pid=os.getpid(),
+            stamp=int(time.time() * 1000000),
+        )
+        return os.path.join(profile_dir, fname)
 
     def run(self, tmp=None, task_vars=None):
         """ The std execution entry pt for an action plugin
@@ -312,52 +727,114 @@ class ActionModule(ActionBase):
         :return: The results from the parser
         :rtype: dict
         """
-        valid, argspec_result, updated_params = check_argspec(
-            DOCUMENTATION,
-            "cli_parse module",
-            schema_conditionals=ARGSPEC_CONDITIONALS,
-            **self._task.args
-        )
+        self._timer = _PhaseTimer()
+        # the environment variables are used when the task does not set
+        # the option, so a task can turn off the timings or the profile
+        timings = self._task.args.get("timings")
+        if timings is None:
+            timings = os.environ.get(TIMINGS_ENV)
+        profile_dir = self._task.args.get("profile_dir")
+        if profile_dir is None:
+            profile_dir = os.environ.get(PROFILE_DIR_ENV)
+        profiler = None
+        if profile_dir and HAS_CPROFILE:
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        try:
+            result = self._run(task_vars)
+        finally:
+            # the statistics are written for failed tasks too
+            if profiler is not None:
+                profiler.disable()
+                profile_path = self._profile_path(profile_dir)
+                profiler.dump_stats(profile_path)
+                self._debug(
+                    "profile written to {path}".format(path=profile_path)
+                )
+        if timings and boolean(timings, strict=False):
+            result["timings"] = self._timer.timings()
+            if isinstance(result.get("stdout"), dict):
+                text_size = sum(
+                    len(to_text(text)) for text in result["stdout"].values()
+                )
+            else:
+                text_size = len(self._task.args.get("text") or "")
+            result["timings"]["text_size"] = text_size
+            if "parsed" in result:
+                try:
+                    result["timings"]["parsed_size"] = len(
+                        json.dumps(result["parsed"])
+                    )
+                except (TypeError, ValueError):
+                    result["timings"]["parsed_size"] = None
+            if profiler is not None:
+                result["timings"]["profile"] = profile_path
+        return result
+
+    def _run(self, task_vars):
+        """ Run the task, timing each phase
+
+        :param task_vars: The vars provided when the task is run
+        :type task_vars: dict
+        :return: The results from the parser
+        :rtype: dict
+        """
+        with self._timer.phase("argspec"):
+            valid, argspec_result, updated_params = check_argspec(
+                DOCUMENTATION,
+                "cli_parse module",
+                schema_conditionals=ARGSPEC_CONDITIONALS,
+                **self._task.args
+            )
+            if valid:
+                self._extended_check_argspec()
         if not valid:
             return argspec_result
-
-        self._extended_check_argspec()
         if self._result.get("failed"):
             return self._result
 
         self._task_vars = task_vars
         self._playhost = task_vars.get("inventory_hostname")
+        if self._task.args.get("commands"):
+            return self._run_many(task_vars)
         self._parser_name = self._task.args.get("parser").get("name")
 
-        self._run_command()
+        with self._timer.phase("command"):
+            self._run_command()
         if self._result.get("failed"):
             return self._result
 
-        self._set_parser_command()
-        self._set_text()
-
-        parser = self._load_parser(task_vars)
+        with self._timer.phase("parser_load"):
+            self._set_parser_command()
+            self._set_text()
+            parser = self._load_parser(task_vars)
         if self._result.get("failed"):
             self._prune_result()
             return self._result
 
-        # Not all parsers use a template, in the case a parser provides
-        # an extension, provide it the template path
-        if getattr(parser, "DEFAULT_TEMPLATE_EXTENSION", False):
-            self._update_template_path(parser.DEFAULT_TEMPLATE_EXTENSION)
+        with self._timer.phase("template"):
+            # Not all parsers use a template, in the case a parser provides
+            # an extension, provide it the template path
+            if getattr(parser, "DEFAULT_TEMPLATE_EXTENSION", False):
+                self._update_template_path(parser.DEFAULT_TEMPLATE_EXTENSION)
 
-        # Not all parsers require the template contents
-        # when true, provide the template contents
-        if getattr(parser, "PROVIDE_TEMPLATE_CONTENTS", False) is True:
-            template_contents = self._get_template_contents()
-        else:
-            template_contents = None
+            # Not all parsers require the template contents
+            # when true, provide the template contents
+            if getattr(parser, "PROVIDE_TEMPLATE_CONTENTS", False) is True:
+                template_contents = self._get_template_contents()
+            else:
+                template_contents = None
 
         try:
-            result = parser.parse(template_contents=template_contents)
+            with self._timer.phase("parse"):
+                result = parser.parse(template_contents=template_contents)
             # ensure the response returned to the controller
             # contains only native types, nothing unique to the parser
-            result = json.loads(json.dumps(result))
+            # unless the parser declares its output is already native
+            with self._timer.phase("normalize"):
+                if not getattr(parser, "NATIVE_OUTPUT", False):
+                    result = to_native_types(result)
         except Exception as exc:
             raise AnsibleActionFail(
                 "Unhandled exception from parser '{parser}'. Error: {err}".format(
@@ -7,8 +7,6 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import ast
-import re
 from ansible.plugins.action import ActionBase
 
 from ansible.module_utils.common._collections_compat import (
@@ -24,6 +22,9 @@ from ansible_collections.ansible.utils.plugins.modules.update_fact import (
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     AnsibleArgSpecValidator,
 )
+from ansible_collections.ansible.utils.plugins.module_utils.common.to_paths import (
+    split_path,
+)
 from ansible.errors import AnsibleActionFail
 
 
@@ -70,40 +71,7 @@ class ActionModule(ActionBase):
         :return: the individual parts of the path
         :rtype: list
         """
-        que = list(path)
-        val = que.pop(0)
-        fields = []
-        try:
-            while True:
-                field = ""
-                # found a '.', move to the next character
-                if val == ".":
-                    val = que.pop(0)
-                # found a '[', pop until ']' and then get the next
-                if val == "[":
-                    val = que.pop(0)
-                    while val != "]":
-                        field += val
-                        val = que.pop(0)
-                    val = que.pop(0)
-                else:
-                    while val not in [".", "["]:
-                        field += val
-                        val = que.pop(0)
-                try:
-                    # make numbers numbers
-                    fields.append(ast.literal_eval(field))
-                except Exception:
-                    # or strip the quotes
-                    fields.append(re.sub("['\"]", "", field))
-        except IndexError:
-            # pop'ed past the end of the que
-            # so add the final field
-            try:
-                fields.append(ast.literal_eval(field))
-            except Exception:
-                fields.append(re.sub("['\"]", "", field))
-        return fields
+        return split_path(path)
 
     def set_value(self, obj, path, val):
         """Set a value
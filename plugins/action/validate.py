@@ -19,12 +19,16 @@ from ansible_collections.ansible.utils.plugins.modules.validate import (
 )
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.validate import (
     _load_validator,
+    _read_records,
 )
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     check_argspec,
 )
 
-ARGSPEC_CONDITIONALS = {}
+ARGSPEC_CONDITIONALS = {
+    "required_one_of": [["data", "data_file"]],
+    "mutually_exclusive": [["data", "data_file"]],
+}
 
 
 class ActionModule(ActionBase):
@@ -82,7 +86,14 @@ class ActionModule(ActionBase):
             return validator_result
 
         try:
-            result = self._validator_engine.validate()
+            if updated_params.get("data_file"):
+                records = _read_records(
+                    self._find_needle("files", updated_params["data_file"]),
+                    updated_params.get("data_format"),
+                )
+                result = self._validator_engine.validate_records(records)
+            else:
+                result = self._validator_engine.validate()
         except AnsibleError as exc:
             raise AnsibleActionFail(
                 to_text(exc, errors="surrogate_then_replace")
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Filter plugin file for in_network_many
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
+    ip_network,
+    _is_subnet_of,
+    _need_ipaddress,
+)
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+    name: in_network_many
+    author: Ansible Community
+    version_added: "2.5.0"
+    short_description: Test a list of IP addresses against a network
+    description:
+        - This plugin checks which of the provided IP addresses or networks belong to the provided network in a single call.
+        - The network is parsed once, each entry is parsed once and the argument validation is done once for the whole list.
+        - The result is the same as mapping the C(ansible.utils.in_network) test, for example C(addresses | select('ansible.utils.in_network', network)).
+        - Using the parameters below- C(data|ansible.utils.in_network_many(network, mask))
+    options:
+        data:
+            description:
+            - A list of IP addresses or networks to check.
+            - This option represents the value that is passed to the filter plugin in pipe format.
+            - For example C(config_data|ansible.utils.in_network_many('10.0.0.0/8')), in this case C(config_data) represents this option.
+            type: list
+            elements: str
+            required: True
+        network:
+            description:
+            - A string that represents the network address in CIDR form
+            - For example: "10.0.0.0/8"
+            type: str
+            required: True
+        mask:
+            description:
+            - If set to C(True), return a list of booleans, one for each entry in I(data).
+            - If set to C(False), return the entries in I(data) that fall in the I(network).
+            type: bool
+            default: False
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### Simple examples
+
+- name: Set a list of addresses
+  ansible.builtin.set_fact:
+    addresses:
+      - 10.1.1.1
+      - 8.8.8.8
+      - 10.2.0.0/16
+      - 2001:db8::1
+
+- name: Keep only the addresses in 10.0.0.0/8
+  ansible.builtin.set_fact:
+    data: "{{ addresses | ansible.utils.in_network_many('10.0.0.0/8') }}"
+
+# TASK [Keep only the addresses in 10.0.0.0/8] *******************************
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": [
+#             "10.1.1.1",
+#             "10.2.0.0/16"
+#         ]
+#     },
+#     "changed": false
+# }
+
+- name: Get a mask of the addresses in 10.0.0.0/8
+  ansible.builtin.set_fact:
+    data: "{{ addresses | ansible.utils.in_network_many('10.0.0.0/8', mask=True) }}"
+
+# TASK [Get a mask of the addresses in 10.0.0.0/8] ***************************
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": [
+#             true,
+#             false,
+#             true,
+#             false
+#         ]
+#     },
+#     "changed": false
+# }
+
+"""
+
+RETURN = """
+  data:
+    description:
+      - The entries in I(data) that fall in the I(network)
+      - A list of booleans, one for each entry in I(data), if I(mask=True)
+"""
+
+from ansible.errors import AnsibleFilterError
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    check_argspec,
+)
+
+
+@_need_ipaddress
+def _in_network_many(data, network, mask=False):
+    """Test a list of IP addresses against a network"""
+
+    params = {"data": data, "network": network, "mask": mask}
+    valid, argspec_result, updated_params = check_argspec(
+        DOCUMENTATION, "in_network_many filter", **params
+    )
+    if not valid:
+        raise AnsibleFilterError(
+            "{argspec_result} with errors: {argspec_errors}".format(
+                argspec_result=argspec_result.get("msg"),
+                argspec_errors=argspec_result.get("errors"),
+            )
+        )
+
+    data = updated_params["data"]
+    try:
+        network = ip_network(updated_params["network"])
+    except Exception:
+        network = None
+
+    seen = {}
+    results = []
+    for entry in data:
+        try:
+            result = seen[entry]
+        except KeyError:
+            try:
+                result = _is_subnet_of(ip_network(entry), network)
+            except Exception:
+                result = False
+            seen[entry] = result
+        results.append(result)
+
+    if updated_params["mask"]:
+        return results
+    return [entry for entry, result in zip(data, results) if result]
+
+
+class FilterModule(object):
+    """ in_network_many  """
+
+    def filters(self):
+
+        """a mapping of filter names to functions"""
+        return {"in_network_many": _in_network_many}
@@ -34,8 +34,8 @@ DOCUMENTATION = """
         - The name of the test to run against the list, a valid jinja2 test or ansible test plugin.
         - Jinja2 includes the following tests U(http://jinja.palletsprojects.com/templates/#builtin-tests).
         - An overview of tests included in ansible U(https://docs.ansible.com/ansible/latest/user_guide/playbooks_tests.html)
+        - Either I(test) or I(clauses) is required.
         type: str
-        required: True
       value:
         description:
         - The value used to test each list item against.
@@ -46,6 +46,8 @@ DOCUMENTATION = """
         description:
         - When the data provided is a list of dictionaries, run the test against this dictionary key.
         - When using a I(key), the I(data) must only contain dictionaries.
+        - The I(key) may be a path to a nested key in dot bracket notation, for example C(ipv4.address) or C(ipv4[0]['address']).
+        - A key found as is in a dictionary is used before the path.
         - See I(fail_on_missing) below to determine the behavior when the I(key) is missing from a dictionary in the I(data).
         type: str
       fail_on_missing:
@@ -56,6 +58,36 @@ DOCUMENTATION = """
         - When only a single entry in the I(data) is matched, the index of that entry is returned as an integer.
         - If set to C(True), the return value will always be a list, even if only a single entry is matched.
         type: bool
+      clauses:
+        description:
+        - A list of tests, each run against the list item or one of its dictionary keys, used in place of I(test), I(value) and I(key).
+        - The indices of the list items matching all the clauses are returned.
+        - The tests C(eq), C(ne), C(gt), C(ge), C(lt), C(le), C(in), C(regex), C(search) and C(match) run as python operators.
+        - Any other test is run using the jinja2 or ansible test.
+        type: list
+        elements: dict
+        version_added: "2.5.0"
+        suboptions:
+          test:
+            description: The name of the test to run, a valid jinja2 test or ansible test plugin.
+            type: str
+            required: True
+          value:
+            description: The value used to test the list item or dictionary key against.
+            type: raw
+          key:
+            description:
+            - The dictionary key or key path to run the test against, when the data provided is a list of dictionaries.
+            - When omitted the test is run against the list item.
+            type: raw
+      lazy:
+        description:
+        - Return a generator of the indices, the list items are only tested as the indices are consumed.
+        - Useful when only some of the indices are needed, for example with the C(first) filter or a jinja2 C(for) loop.
+        - The I(wantlist) option is ignored, use the C(list) filter to get a list.
+        type: bool
+        default: False
+        version_added: "2.5.0"
 
     notes:
 """
@@ -172,6 +204,60 @@ EXAMPLES = r"""
 #   msg: The device named fw02.example.corp is a firewall
 
 
+- name: Find the index of all firewalls with a .corp name, in one pass
+  ansible.builtin.set_fact:
+    firewalls: "{{ data|ansible.utils.index_of(clauses=clauses) }}"
+  vars:
+    clauses:
+    - key: type
+      test: eq
+      value: firewall
+    - key: name
+      test: regex
+      value: '\.corp$'
+
+# TASK [Find the index of all firewalls with a .corp name, in one pass] ******
+# ok: [nxos101] => changed=false
+#   ansible_facts:
+#     firewalls:
+#     - 2
+#     - 3
+
+
+#### Working with nested keys
+
+- name: Define a list of interfaces
+  ansible.builtin.set_fact:
+    interfaces:
+    - name: Ethernet1
+      ipv4:
+        address: 10.1.1.1
+    - name: Ethernet2
+      ipv4:
+        address: 10.1.2.1
+    - name: Ethernet3
+      ipv4:
+        address: 10.1.3.1
+
+- name: Find the index of an interface using a nested key
+  ansible.builtin.set_fact:
+    index: "{{ interfaces|ansible.utils.index_of('eq', '10.1.2.1', 'ipv4.address') }}"
+
+# TASK [Find the index of an interface using a nested key] *******************
+# ok: [nxos101] => changed=false
+#   ansible_facts:
+#     index: '1'
+
+- name: Find the index of the first interface in 10.1.0.0/16, the remaining interfaces are not tested
+  ansible.builtin.set_fact:
+    index: "{{ interfaces|ansible.utils.index_of('search', '^10[.]1[.]', 'ipv4.address', lazy=True)|first }}"
+
+# TASK [Find the index of the first interface in 10.1.0.0/16, the remaining interfaces are not tested] ***
+# ok: [nxos101] => changed=false
+#   ansible_facts:
+#     index: '0'
+
+
 #### Working with complex structures from resource modules
 
 - name: Retrieve the current L3 interface configuration
@@ -307,6 +393,16 @@ from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_valid
 )
 
 
+ARGSPEC_CONDITIONALS = {
+    "required_one_of": [["test", "clauses"]],
+    "mutually_exclusive": [
+        ["test", "clauses"],
+        ["value", "clauses"],
+        ["key", "clauses"],
+    ],
+}
+
+
 @environmentfilter
 def _index_of(*args, **kwargs):
     """Find the indicies of items in a list matching some criteria."""
@@ -324,7 +420,10 @@ def _index_of(*args, **kwargs):
     data.update(kwargs)
     environment = data.pop("environment")
     aav = AnsibleArgSpecValidator(
-        data=data, schema=DOCUMENTATION, name="index_of"
+        data=data,
+        schema=DOCUMENTATION,
+        schema_conditionals=ARGSPEC_CONDITIONALS,
+        name="index_of",
     )
     valid, errors, updated_data = aav.validate()
     if not valid:
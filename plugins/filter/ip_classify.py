@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Filter plugin file for ip_classify
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
+    ip_address,
+    ip_network,
+    _need_ipaddress,
+)
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+    name: ip_classify
+    author: Ansible Community
+    version_added: "2.5.0"
+    short_description: Run a netaddr test against a list of IP addresses
+    description:
+        - This plugin runs one of the netaddr tests against every entry in a list of IP addresses or networks in a single call.
+        - Each entry is parsed once and the argument validation is done once for the whole list rather than once per entry.
+        - The result is the same as mapping the individual test, for example C(addresses | select('ansible.utils.private')).
+        - Using the parameters below- C(data|ansible.utils.ip_classify(test, mask))
+    options:
+        data:
+            description:
+            - A list of IP addresses or networks to classify.
+            - This option represents the value that is passed to the filter plugin in pipe format.
+            - For example C(config_data|ansible.utils.ip_classify('private')), in this case C(config_data) represents this option.
+            type: list
+            elements: str
+            required: True
+        test:
+            description:
+            - The name of the netaddr test to run against each entry.
+            type: str
+            required: True
+            choices:
+            - ip
+            - ip_address
+            - ipv4
+            - ipv4_address
+            - ipv6
+            - ipv6_address
+            - ipv6_ipv4_mapped
+            - ipv6_sixtofour
+            - ipv6_teredo
+            - loopback
+            - multicast
+            - private
+            - public
+            - reserved
+            - unspecified
+        mask:
+            description:
+            - If set to C(True), return a list of booleans, one for each entry in I(data).
+            - If set to C(False), return the entries in I(data) that satisfy the test.
+            type: bool
+            default: False
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### Simple examples
+
+- name: Set a list of addresses
+  ansible.builtin.set_fact:
+    addresses:
+      - 10.1.1.1
+      - 8.8.8.8
+      - 192.168.1.1
+      - 2001:db8::1
+
+- name: Keep only the private addresses
+  ansible.builtin.set_fact:
+    data: "{{ addresses | ansible.utils.ip_classify('private') }}"
+
+# TASK [Keep only the private addresses] *************************************
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": [
+#             "10.1.1.1",
+#             "192.168.1.1",
+#             "2001:db8::1"
+#         ]
+#     },
+#     "changed": false
+# }
+
+- name: Get a mask of the IPv4 addresses
+  ansible.builtin.set_fact:
+    data: "{{ addresses | ansible.utils.ip_classify('ipv4_address', mask=True) }}"
+
+# TASK [Get a mask of the IPv4 addresses] ************************************
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": [
+#             true,
+#             true,
+#             true,
+#             false
+#         ]
+#     },
+#     "changed": false
+# }
+
+"""
+
+RETURN = """
+  data:
+    description:
+      - The entries in I(data) that satisfy the test
+      - A list of booleans, one for each entry in I(data), if I(mask=True)
+"""
+
+from ansible.errors import AnsibleFilterError
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    check_argspec,
+)
+
+
+def _optional(attr):
+    """Build a check for an attribute that is None when not applicable"""
+
+    def check(obj):
+        return getattr(obj, attr) is not None
+
+    return check
+
+
+def _flag(attr):
+    """Build a check for a boolean attribute"""
+
+    def check(obj):
+        return getattr(obj, attr)
+
+    return check
+
+
+def _version(version):
+    """Build a check for an IP version"""
+
+    def check(obj):
+        return obj.version == version
+
+    return check
+
+
+def _any(obj):
+    return True
+
+
+# test name: (parser, check), mirroring the individual test plugins
+CLASSIFIERS = {
+    "ip": (ip_network, _any),
+    "ip_address": (ip_address, _any),
+    "ipv4": (ip_network, _version(4)),
+    "ipv4_address": (ip_address, _version(4)),
+    "ipv6": (ip_network, _version(6)),
+    "ipv6_address": (ip_address, _version(6)),
+    "ipv6_ipv4_mapped": (ip_address, _optional("ipv4_mapped")),
+    "ipv6_sixtofour": (ip_address, _optional("sixtofour")),
+    "ipv6_teredo": (ip_address, _optional("teredo")),
+    "loopback": (ip_address, _flag("is_loopback")),
+    "multicast": (ip_address, _flag("is_multicast")),
+    "private": (ip_address, _flag("is_private")),
+    "public": (ip_address, _flag("is_global")),
+    "reserved": (ip_address, _flag("is_reserved")),
+    "unspecified": (ip_address, _flag("is_unspecified")),
+}
+
+
+def _classify(data, parser, check):
+    """Run a check against each entry, parsing duplicate entries once"""
+
+    seen = {}
+    results = []
+    for entry in data:
+        try:
+            result = seen[entry]
+        except KeyError:
+            try:
+                result = bool(check(parser(entry)))
+            except Exception:
+                result = False
+            seen[entry] = result
+        results.append(result)
+    return results
+
+
+@_need_ipaddress
+def _ip_classify(data, test, mask=False):
+    """Run a netaddr test against a list of IP addresses"""
+
+    params = {"data": data, "test": test, "mask": mask}
+    valid, argspec_result, updated_params = check_argspec(
+        DOCUMENTATION, "ip_classify filter", **params
+    )
+    if not valid:
+        raise AnsibleFilterError(
+            "{argspec_result} with errors: {argspec_errors}".format(
+                argspec_result=argspec_result.get("msg"),
+                argspec_errors=argspec_result.get("errors"),
+            )
+        )
+
+    data = updated_params["data"]
+    parser, check = CLASSIFIERS[updated_params["test"]]
+    results = _classify(data, parser, check)
+    if updated_params["mask"]:
+        return results
+    return [entry for entry, result in zip(data, results) if result]
+
+
+class FilterModule(object):
+    """ ip_classify  """
+
+    def filters(self):
+
+        """a mapping of filter names to functions"""
+        return {"ip_classify": _ip_classify}
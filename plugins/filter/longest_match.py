@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Filter plugin file for longest_match
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
+    _network_index,
+    _need_ipaddress,
+    _validate_args,
+)
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+    name: longest_match
+    author: Ansible Community
+    version_added: "2.5.0"
+    short_description: Find the most specific network an IP address belongs to
+    description:
+        - This plugin returns the network from the provided list with the longest prefix that contains the provided IP address or network.
+        - If no network in the list contains the IP address, C(None) is returned.
+        - The list of networks is indexed once and reused for every IP address checked against the same list.
+        - Using the parameters below- C(ip|ansible.utils.longest_match(networks))
+    options:
+        ip:
+            description:
+            - A string that represents an IP address or network
+            - For example: "10.1.1.1"
+            - This option represents the value that is passed to the filter plugin in pipe format.
+            type: str
+            required: True
+        networks:
+            description:
+            - A list of string and each string represents a network address in CIDR form
+            - For example: ['10.0.0.0/8', '10.1.0.0/16']
+            type: list
+            required: True
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### Simple examples
+
+- name: Set network list
+  ansible.builtin.set_fact:
+    networks:
+      - "10.0.0.0/8"
+      - "10.1.0.0/16"
+      - "192.168.1.0/24"
+
+- name: Find the most specific network for 10.1.1.1
+  ansible.builtin.set_fact:
+    data: "{{ '10.1.1.1' | ansible.utils.longest_match(networks) }}"
+
+# TASK [Find the most specific network for 10.1.1.1] ******************************
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": "10.1.0.0/16"
+#     },
+#     "changed": false
+# }
+
+- name: Find the most specific network for each address
+  ansible.builtin.set_fact:
+    data: "{{ data | default({}) | combine({item: item | ansible.utils.longest_match(networks)}) }}"
+  loop:
+    - 10.2.2.2
+    - 192.168.1.10
+    - 8.8.8.8
+
+# TASK [Find the most specific network for each address] **************************
+# ok: [localhost] => (item=10.2.2.2)
+# ok: [localhost] => (item=192.168.1.10)
+# ok: [localhost] => (item=8.8.8.8)
+
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": {
+#             "10.2.2.2": "10.0.0.0/8",
+#             "192.168.1.10": "192.168.1.0/24",
+#             "8.8.8.8": null
+#         }
+#     },
+#     "changed": false
+# }
+
+"""
+
+RETURN = """
+  data:
+    description:
+      - The network with the longest prefix that contains the IP address
+      - C(None) if no network contains the IP address
+"""
+
+
+@_need_ipaddress
+def _longest_match(ip, networks):
+    """Find the most specific network an IP address belongs to"""
+
+    params = {"ip": ip, "networks": networks}
+    _validate_args("longest_match", DOCUMENTATION, params)
+
+    return _network_index(networks).longest_match(ip)
+
+
+class FilterModule(object):
+    """ longest_match  """
+
+    def filters(self):
+
+        """a mapping of filter names to functions"""
+        return {"longest_match": _longest_match}
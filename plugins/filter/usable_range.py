@@ -8,7 +8,6 @@ Filter plugin file for usable_range
 """
 
 from __future__ import absolute_import, division, print_function
-from ipaddress import IPv4Network, IPv6Network
 
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
     _validate_args,
@@ -25,6 +24,8 @@ DOCUMENTATION = """
     short_description: Expand the usable IP addresses
     description:
         - For a given IP address (IPv4 or IPv6) in CIDR form, the plugin generates a list of usable IP addresses belonging to the network.
+        - Use I(offset), I(limit) and I(step) to only generate a slice of the usable IP addresses, the total number of IP addresses is always returned.
+        - Using the parameters below- C(ip|ansible.utils.usable_range(offset, limit, step))
     options:
         ip:
             description:
@@ -34,6 +35,25 @@ DOCUMENTATION = """
                 - "2001:db8:abcd:0012::0/124"
             type: str
             required: True
+        offset:
+            description:
+            - The index of the first IP address to generate, starting from C(0).
+            type: int
+            default: 0
+            version_added: "2.5.0"
+        limit:
+            description:
+            - The maximum number of IP addresses to generate.
+            - If not provided, IP addresses are generated up to the end of the network.
+            - Large networks, for example an IPv6 /64, should always be used with a I(limit).
+            type: int
+            version_added: "2.5.0"
+        step:
+            description:
+            - Generate every I(step)th IP address starting from I(offset).
+            type: int
+            default: 1
+            version_added: "2.5.0"
     notes:
 """
 
@@ -140,40 +160,93 @@ EXAMPLES = r"""
 # changed: [localhost] => (item=127.0.0.14)
 # changed: [localhost] => (item=127.0.0.15)
 
+#### Large networks (generating a slice of the usable IP addresses)
+
+- name: Produce the first 3 usable IP addresses in 10.0.0.0/8
+  ansible.builtin.set_fact:
+    data: "{{ '10.0.0.0/8' | ansible.utils.usable_range(limit=3) }}"
+
+# TASK [Produce the first 3 usable IP addresses in 10.0.0.0/8] ***************************
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": {
+#             "number_of_ips": 16777216,
+#             "usable_ips": [
+#                 "10.0.0.0",
+#                 "10.0.0.1",
+#                 "10.0.0.2"
+#             ]
+#         }
+#     },
+#     "changed": false
+# }
+
+- name: Produce every 256th usable IP address in 2001:db8::/64, starting from the second
+  ansible.builtin.set_fact:
+    data: "{{ '2001:db8::/64' | ansible.utils.usable_range(offset=1, limit=3, step=256) }}"
+
+# TASK [Produce every 256th usable IP address in 2001:db8::/64, starting from the second] ***
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": {
+#             "number_of_ips": 18446744073709551616,
+#             "usable_ips": [
+#                 "2001:db8::1",
+#                 "2001:db8::101",
+#                 "2001:db8::201"
+#             ]
+#         }
+#     },
+#     "changed": false
+# }
+
 """
 
 RETURN = """
     data:
         description:
         - Total number of usable IP addresses under the key C(number_of_ips)
-        - List of usable IP addresses under the key C(usable_ips)
+        - List of usable IP addresses under the key C(usable_ips), limited to the slice requested with I(offset), I(limit) and I(step)
 """
 
 from ansible.errors import AnsibleFilterError
 from ansible.module_utils.common.text.converters import to_text
-from ansible.module_utils.six import ensure_text
+
+
+def _address_slice(network, offset, limit, step):
+    """Generate a slice of the IP addresses in a network, using integer
+    math on the network address so only the addresses returned are built
+    """
+
+    first = int(network.network_address)
+    address = type(network.network_address)
+    num_addresses = network.num_addresses
+    index = offset
+    ips = []
+    while index < num_addresses and (limit is None or len(ips) < limit):
+        ips.append(to_text(address(first + index)))
+        index += step
+    return ips
 
 
 @_need_ipaddress
-def _usable_range(ip):
+def _usable_range(ip, offset=0, limit=None, step=1):
     """Expand the usable IP addresses"""
 
-    params = {"ip": ip}
-    _validate_args("usable_range", DOCUMENTATION, params)
+    params = {"ip": ip, "offset": offset, "limit": limit, "step": step}
+    params = _validate_args("usable_range", DOCUMENTATION, params)
+    offset, limit, step = params["offset"], params["limit"], params["step"]
+
+    if offset < 0 or step < 1 or (limit is not None and limit < 0):
+        raise AnsibleFilterError(
+            "Error while using plugin 'usable_range': offset and limit"
+            " must not be negative and step must be at least 1"
+        )
 
     try:
-        if ip_network(ip).version == 4:
-            ips = [
-                to_text(usable_ips)
-                for usable_ips in IPv4Network(ensure_text(ip))
-            ]
-            no_of_ips = IPv4Network(ensure_text(ip)).num_addresses
-        if ip_network(ip).version == 6:
-            ips = [
-                to_text(usable_ips)
-                for usable_ips in IPv6Network(ensure_text(ip))
-            ]
-            no_of_ips = IPv6Network(ensure_text(ip)).num_addresses
+        network = ip_network(ip)
+        ips = _address_slice(network, offset, limit, step)
+        no_of_ips = network.num_addresses
 
     except Exception as e:
         raise AnsibleFilterError(
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+"""
+The index_by lookup plugin
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+    name: index_by
+    author: Ansible Community
+    plugin_type: lookup
+    version_added: "2.5.0"
+    short_description: Find the indices of items in a list equal to a value using a hash index
+    description:
+        - This plugin returns the indices of items equal to a value, or to one of a list of values, in a list.
+        - When working with a list of dictionaries, the key to evaluate can be specified.
+        - The list is indexed once and the index is reused for every lookup against the same list, making it suited to lookups in a loop.
+        - Each lookup still reads the indexed value of every item to check the list is unchanged, a list changed in place is indexed again.
+        - A lookup is not constant time, it saves running the test against every item and building the index again.
+        - The result is the same as B(index_of) using the same test.
+        - B(index_by) is also available as a B(filter plugin) for convenience.
+        - Using the parameters below- C(lookup('ansible.utils.index_by', data, test, value, key, fail_on_missing, wantlist)).
+    options:
+      data:
+        description: A list of items to index and look up.
+        type: list
+        required: True
+      test:
+        description: >
+            The name of the test to run against the list.
+            C(eq), C(==) and C(equalto) find the items equal to the I(value).
+            C(in) finds the items equal to one of the values when I(value) is a list.
+        type: str
+        choices: ['eq', '==', 'equalto', 'in']
+        required: True
+      value:
+        description: The value to find in the list, or a list of values when using the C(in) test.
+        type: raw
+      key:
+        description: >
+            When the data provided is a list of dictionaries, look up the value of this dictionary key.
+            When using a I(key), the I(data) must only contain dictionaries.
+            The I(key) may be a path to a nested key in dot bracket notation, for example C(ipv4.address).
+            See I(fail_on_missing) below to determine the behaviour when the I(key) is missing from a dictionary in the I(data).
+        type: str
+      fail_on_missing:
+        description: When provided a list of dictionaries, fail if the key is missing from one or more of the dictionaries.
+        type: bool
+      wantlist:
+        description: >
+            When only a single entry in the I(data) is matched, the index of that entry is returned as an integer.
+            If set to C(True), the return value will always be a list, even if only a single entry is matched.
+            This can also be accomplished using C(query) or C(q) instead of C(lookup).
+            U(https://docs.ansible.com/ansible/latest/plugins/lookup.html)
+        type: bool
+
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### Simple examples
+
+- ansible.builtin.set_fact:
+    data:
+    - name: sw01.example.lan
+      type: switch
+    - name: rtr01.example.lan
+      type: router
+    - name: fw01.example.corp
+      type: firewall
+    - name: fw02.example.corp
+      type: firewall
+
+- name: Find the index of all firewalls using the type key
+  ansible.builtin.set_fact:
+    firewalls: "{{ lookup('ansible.utils.index_by', data, 'eq', 'firewall', 'type') }}"
+
+# TASK [Find the index of all firewalls using the type key] ******************
+# ok: [nxos101] => changed=false
+#   ansible_facts:
+#     firewalls:
+#     - 2
+#     - 3
+
+- name: Find the index of the router, ensure list is returned
+  ansible.builtin.set_fact:
+    routers: "{{ lookup('ansible.utils.index_by', data, 'eq', 'router', 'type', wantlist=True) }}"
+
+# TASK [Find the index of the router, ensure list is returned] ***************
+# ok: [nxos101] => changed=false
+#   ansible_facts:
+#     routers:
+#     - 1
+
+- name: Find the index of each device by name, the list is indexed once
+  debug:
+    msg: "{{ item }} is at index {{ lookup('ansible.utils.index_by', data, 'eq', item, 'name') }}"
+  loop:
+  - fw02.example.corp
+  - sw01.example.lan
+
+# TASK [Find the index of each device by name, the list is indexed once] ****
+# ok: [nxos101] => (item=fw02.example.corp) =>
+#   msg: fw02.example.corp is at index 3
+# ok: [nxos101] => (item=sw01.example.lan) =>
+#   msg: sw01.example.lan is at index 0
+"""
+
+RETURN = """
+  _raw:
+    description:
+      - One or more zero-based indicies of the matching list items.
+      - See C(wantlist) if a list is always required.
+"""
+
+from ansible.errors import AnsibleLookupError
+from ansible.plugins.lookup import LookupBase
+from ansible_collections.ansible.utils.plugins.module_utils.common.index_of import (
+    index_by,
+)
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    AnsibleArgSpecValidator,
+)
+
+
+class LookupModule(LookupBase):
+    def run(self, terms, variables, **kwargs):
+        if isinstance(terms, list):
+            keys = [
+                "data",
+                "test",
+                "value",
+                "key",
+                "fail_on_missing",
+                "wantlist",
+            ]
+            terms = dict(zip(keys, terms))
+        terms.update(kwargs)
+        # the validated data is a copy, a new list on each call would never
+        # find the index of the list, so a list is passed on as it is
+        options = dict(terms)
+        if isinstance(terms.get("data"), list):
+            options["data"] = []
+        aav = AnsibleArgSpecValidator(
+            data=options, schema=DOCUMENTATION, name="index_by"
+        )
+        valid, errors, updated_data = aav.validate()
+        if not valid:
+            raise AnsibleLookupError(errors)
+        if isinstance(terms.get("data"), list):
+            updated_data["data"] = terms["data"]
+        updated_data["wantlist"] = True
+        res = index_by(**updated_data)
+        return res
@@ -33,8 +33,8 @@ DOCUMENTATION = """
             The name of the test to run against the list, a valid jinja2 test or ansible test plugin.
             Jinja2 includes the following tests U(http://jinja.palletsprojects.com/templates/#builtin-tests).
             An overview of tests included in ansible U(https://docs.ansible.com/ansible/latest/user_guide/playbooks_tests.html).
+            Either I(test) or I(clauses) is required.
         type: str
-        required: True
       value:
         description: >
             The value used to test each list item against.
@@ -45,6 +45,8 @@ DOCUMENTATION = """
         description: >
             When the data provided is a list of dictionaries, run the test against this dictionary key.
             When using a I(key), the I(data) must only contain dictionaries.
+            The I(key) may be a path to a nested key in dot bracket notation, for example C(ipv4.address) or C(ipv4[0]['address']).
+            A key found as is in a dictionary is used before the path.
             See I(fail_on_missing) below to determine the behaviour when the I(key) is missing from a dictionary in the I(data).
         type: str
       fail_on_missing:
@@ -57,6 +59,28 @@ DOCUMENTATION = """
             This can also be accomplished using C(query) or C(q) instead of C(lookup).
             U(https://docs.ansible.com/ansible/latest/plugins/lookup.html)
         type: bool
+      clauses:
+        description:
+        - A list of tests, each run against the list item or one of its dictionary keys, used in place of I(test), I(value) and I(key).
+        - The indices of the list items matching all the clauses are returned.
+        - The tests C(eq), C(ne), C(gt), C(ge), C(lt), C(le), C(in), C(regex), C(search) and C(match) run as python operators.
+        - Any other test is run using the jinja2 or ansible test.
+        type: list
+        elements: dict
+        version_added: "2.5.0"
+        suboptions:
+          test:
+            description: The name of the test to run, a valid jinja2 test or ansible test plugin.
+            type: str
+            required: True
+          value:
+            description: The value used to test the list item or dictionary key against.
+            type: raw
+          key:
+            description:
+            - The dictionary key or key path to run the test against, when the data provided is a list of dictionaries.
+            - When omitted the test is run against the list item.
+            type: raw
 
     notes:
 """
@@ -184,6 +208,26 @@ EXAMPLES = r"""
 #   msg: The device named fw02.example.corp is a firewall
 
 
+- name: Find the index of all firewalls with a .corp name, in one pass
+  ansible.builtin.set_fact:
+    firewalls: "{{ lookup('ansible.utils.index_of', data, clauses=clauses) }}"
+  vars:
+    clauses:
+    - key: type
+      test: eq
+      value: firewall
+    - key: name
+      test: regex
+      value: '\.corp$'
+
+# TASK [Find the index of all firewalls with a .corp name, in one pass] ******
+# ok: [nxos101] => changed=false
+#   ansible_facts:
+#     firewalls:
+#     - 2
+#     - 3
+
+
 #### Working with complex structures from resource modules
 
 - name: Retrieve the current L3 interface configuration
@@ -325,6 +369,16 @@ from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_valid
 )
 
 
+ARGSPEC_CONDITIONALS = {
+    "required_one_of": [["test", "clauses"]],
+    "mutually_exclusive": [
+        ["test", "clauses"],
+        ["value", "clauses"],
+        ["key", "clauses"],
+    ],
+}
+
+
 class LookupModule(LookupBase):
     def run(self, terms, variables, **kwargs):
         if isinstance(terms, list):
@@ -339,7 +393,10 @@ class LookupModule(LookupBase):
             terms = dict(zip(keys, terms))
         terms.update(kwargs)
         aav = AnsibleArgSpecValidator(
-            data=terms, schema=DOCUMENTATION, name="index_of"
+            data=terms,
+            schema=DOCUMENTATION,
+            schema_conditionals=ARGSPEC_CONDITIONALS,
+            name="index_of",
         )
         valid, errors, updated_data = aav.validate()
         if not valid:
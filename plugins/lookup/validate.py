@@ -24,7 +24,32 @@ DOCUMENTATION = """
           For example C(lookup(config_data, config_criteria, engine='ansible.utils.jsonschema')),
           in this case C(config_data) represents this option.
         - For the type of I(data) that represents this value refer to the documentation of individual validate plugins.
-        required: True
+        - When I(data_file) is used the lookup plugin is passed only the criteria, for example
+          C(lookup('ansible.utils.validate', config_criteria, data_file='records.jsonl')).
+      data_file:
+        type: path
+        description:
+        - Path of a file on the Ansible controller with the records to validate against I(criteria).
+        - The file is either in JSON Lines format, one JSON document per line, or a YAML file
+          with one or more documents.
+        - The records are read and validated one at a time, so the whole file is never loaded in memory.
+        - Each error returned has a I(record) key with the index of the record it was found in,
+          starting at C(0).
+        - This can be a relative or an absolute path, relative paths are searched for in the
+          C(files) directories of the role or playbook.
+        - This option can be passed in lookup plugin as a key, value pair.
+        version_added: 2.5.0
+      data_format:
+        type: str
+        description:
+        - The format of the file in I(data_file).
+        - If not set, C(yaml) is used for a file with a C(.yml) or C(.yaml) extension
+          and C(json_lines) otherwise.
+        - This option can be passed in lookup plugin as a key, value pair.
+        choices:
+        - json_lines
+        - yaml
+        version_added: 2.5.0
       criteria:
         type: raw
         description:
@@ -72,6 +97,10 @@ EXAMPLES = r"""
     data_criteria_checks: "{{ lookup('ansible.utils.validate', data, criteria, engine='ansible.utils.jsonschema', draft='draft7') }}"
   vars:
     ansible_validate_jsonschema_draft: draft3
+
+- name: validate each record of a JSON Lines file using jsonschema with lookup plugin
+  ansible.builtin.set_fact:
+    data_criteria_checks: "{{ lookup('ansible.utils.validate', criteria, data_file='interfaces.jsonl') }}"
 """
 
 RETURN = """
@@ -79,6 +108,7 @@ RETURN = """
     description:
       - If data is valid returns empty list.
       - If data is invalid returns list of errors in data.
+      - With I(data_file) each error has the index of its record as I(record).
 """
 
 from ansible.errors import AnsibleError, AnsibleLookupError
@@ -86,6 +116,7 @@ from ansible.module_utils._text import to_text
 from ansible.plugins.lookup import LookupBase
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.validate import (
     _load_validator,
+    _read_records,
 )
 from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
     to_list,
@@ -95,18 +126,30 @@ from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_valid
 )
 
 
-ARGSPEC_CONDITIONALS = {}
+ARGSPEC_CONDITIONALS = {
+    "required_one_of": [["data", "data_file"]],
+    "mutually_exclusive": [["data", "data_file"]],
+}
 
 
 class LookupModule(LookupBase):
     def run(self, terms, variables, **kwargs):
-        if len(terms) < 2:
+        if kwargs.get("data_file"):
+            if len(terms) < 1:
+                raise AnsibleLookupError(
+                    "missing 'criteria' value in lookup input,"
+                    " refer ansible.utils.validate lookup plugin documentation for details"
+                )
+            params = {"criteria": terms[0], "data_file": kwargs["data_file"]}
+            if kwargs.get("data_format"):
+                params.update({"data_format": kwargs["data_format"]})
+        elif len(terms) < 2:
             raise AnsibleLookupError(
                 "missing either 'data' or 'criteria' value in lookup input,"
                 " refer ansible.utils.validate lookup plugin documentation for details"
             )
-
-        params = {"data": terms[0], "criteria": terms[1]}
+        else:
+            params = {"data": terms[0], "criteria": terms[1]}
         if kwargs.get("engine"):
             params.update({"engine": kwargs["engine"]})
 
@@ -126,7 +169,7 @@ class LookupModule(LookupBase):
 
         validator_engine, validator_result = _load_validator(
             engine=updated_params["engine"],
-            data=updated_params["data"],
+            data=updated_params.get("data"),
             criteria=updated_params["criteria"],
             plugin_vars=variables,
             kwargs=kwargs,
@@ -139,7 +182,22 @@ class LookupModule(LookupBase):
             )
 
         try:
-            result = validator_engine.validate()
+            if updated_params.get("data_file"):
+                data_file = self.find_file_in_search_path(
+                    variables or {}, "files", updated_params["data_file"]
+                )
+                if data_file is None:
+                    raise AnsibleError(
+                        "Unable to find data file '{data_file}'".format(
+                            data_file=updated_params["data_file"]
+                        )
+                    )
+                records = _read_records(
+                    data_file, updated_params.get("data_format")
+                )
+                result = validator_engine.validate_records(records)
+            else:
+                result = validator_engine.validate()
         except AnsibleError as exc:
             raise AnsibleLookupError(
                 to_text(exc, errors="surrogate_then_replace")
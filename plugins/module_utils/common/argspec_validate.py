@@ -23,12 +23,15 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
 import re
+from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
+    LruCache,
     dict_merge,
 )
-from ansible.module_utils.six import iteritems
+from ansible.module_utils.six import iteritems, string_types
 
 try:
     import yaml
@@ -84,6 +87,37 @@ VALID_ANSIBLEMODULE_ARGS = (
 
 BASE_ARG_AVAIL = 2.11
 
+ARGSPEC_CACHE_SIZE = 256
+
+
+class ArgspecCache(LruCache):
+    """A bounded, process-wide LRU cache of compiled argspecs
+
+    Each entry holds the argspec converted from a plugin's DOCUMENTATION
+    merged with its conditionals and, when available, a ready
+    ArgumentSpecValidator so the docstring is only parsed once per process
+    """
+
+    def __init__(self, maxsize=ARGSPEC_CACHE_SIZE):
+        """Initialize the cache
+        :param maxsize: The maximum number of entries to keep
+        :type maxsize: int
+        """
+        super(ArgspecCache, self).__init__(maxsize=maxsize)
+
+
+ARGSPEC_CACHE = ArgspecCache()
+
+
+def clear_argspec_cache():
+    """Invalidate all compiled argspecs, eg after a DOCUMENTATION change"""
+    ARGSPEC_CACHE.clear()
+
+
+def argspec_cache_info():
+    """Return the hits, misses and size of the compiled argspec cache"""
+    return ARGSPEC_CACHE.info()
+
 
 class MonkeyModule(AnsibleModule):
     """A derivative of the AnsibleModule used
@@ -197,6 +231,59 @@ class AnsibleArgSpecValidator:
         self._extract_schema_from_doc(doc_obj, temp_schema)
         self._schema = {"argument_spec": temp_schema}
 
+    def _cache_key(self):
+        """Build the key used to find the compiled argspec in the cache,
+        only docstrings are cached since that is where the cost is
+
+        :return: The cache key or None if this schema cannot be cached
+        :rtype: tuple
+        """
+        if self._schema_format != "doc" or not isinstance(
+            self._schema, string_types
+        ):
+            return None
+        try:
+            conditionals = json.dumps(
+                self._schema_conditionals, sort_keys=True
+            )
+        except (TypeError, ValueError):
+            return None
+        return (self._schema_format, self._schema, conditionals)
+
+    def _compile(self):
+        """Convert the doc string and merge the conditionals, using
+        the process-wide cache when possible
+
+        :return: The compiled entry, with the schema, any invalid keys
+            and the ArgumentSpecValidator if available
+        :rtype: dict
+        """
+        key = self._cache_key()
+        if key is not None:
+            entry = ARGSPEC_CACHE.get(key)
+            if entry is not None:
+                self._schema = entry["schema"]
+                return entry
+
+        if self._schema_format == "doc":
+            self._convert_doc_to_schema()
+        if self._schema_conditionals is not None:
+            self._schema = dict_merge(self._schema, self._schema_conditionals)
+        invalid_keys = [
+            k for k in self._schema.keys() if k not in VALID_ANSIBLEMODULE_ARGS
+        ]
+        validator = None
+        if HAS_ANSIBLE_ARG_SPEC_VALIDATOR and not invalid_keys:
+            validator = ArgumentSpecValidator(**self._schema)
+        entry = {
+            "schema": self._schema,
+            "invalid_keys": invalid_keys,
+            "validator": validator,
+        }
+        if key is not None:
+            ARGSPEC_CACHE.set(key, entry)
+        return entry
+
     def _validate(self):
         """Validate the data gainst the schema
         convert doc string in argspec if necessary
@@ -208,10 +295,8 @@ class AnsibleArgSpecValidator:
         :return params: The original data updated with defaults
         :rtype params: dict
         """
-        if self._schema_format == "doc":
-            self._convert_doc_to_schema()
-        if self._schema_conditionals is not None:
-            self._schema = dict_merge(self._schema, self._schema_conditionals)
+        # the compiled schema is shared, AnsibleModule gets its own copy
+        self._schema = deepcopy(self._compile()["schema"])
         if self._other_args is not None:
             self._schema = dict_merge(self._schema, self._other_args)
         invalid_keys = [
@@ -236,29 +321,18 @@ class AnsibleArgSpecValidator:
         that is coming in 2.11, change the check according above
         """
         if HAS_ANSIBLE_ARG_SPEC_VALIDATOR:
-            if self._schema_format == "doc":
-                self._convert_doc_to_schema()
-            if self._schema_conditionals is not None:
-                self._schema = dict_merge(
-                    self._schema, self._schema_conditionals
-                )
-            invalid_keys = [
-                k
-                for k in self._schema.keys()
-                if k not in VALID_ANSIBLEMODULE_ARGS
-            ]
-            if invalid_keys:
+            entry = self._compile()
+            if entry["invalid_keys"]:
                 valid = False
                 errors = [
                     "Invalid schema. Invalid keys found: {ikeys}".format(
-                        ikeys=",".join(invalid_keys)
+                        ikeys=",".join(entry["invalid_keys"])
                     )
                 ]
                 updated_data = {}
                 return valid, errors, updated_data
             else:
-                validator = ArgumentSpecValidator(**self._schema)
-                result = validator.validate(self._data)
+                result = entry["validator"].validate(self._data)
                 valid = not bool(result.error_messages)
                 return (
                     valid,
@@ -12,9 +12,17 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import json
+import operator
+import re
+
+from collections import OrderedDict
 
 from ansible.module_utils.six import string_types, integer_types
-from ansible.module_utils._text import to_native
+from ansible.module_utils._text import to_native, to_text
+from ansible.module_utils.common._collections_compat import Mapping
+from ansible_collections.ansible.utils.plugins.module_utils.common.to_paths import (
+    split_path,
+)
 
 # Note, this file can only be used on the control node
 # where ansible is installed
@@ -24,6 +32,42 @@ try:
 except ImportError:
     pass
 
+# the tests run as python operators rather than jinja tests,
+# the jinja test is only used to report an error
+NATIVE_TESTS = {
+    "eq": operator.eq,
+    "==": operator.eq,
+    "equalto": operator.eq,
+    "ne": operator.ne,
+    "!=": operator.ne,
+    "gt": operator.gt,
+    ">": operator.gt,
+    "greaterthan": operator.gt,
+    "ge": operator.ge,
+    ">=": operator.ge,
+    "lt": operator.lt,
+    "<": operator.lt,
+    "lessthan": operator.lt,
+    "le": operator.le,
+    "<=": operator.le,
+    "in": lambda entry, right: entry in right,
+}
+
+# the regex tests and the re method used by each
+NATIVE_REGEX_TESTS = {"regex": "search", "search": "search", "match": "match"}
+
+# the tests answered from a KeyIndex, all others need index_of
+INDEX_BY_TESTS = ("eq", "==", "equalto", "in")
+
+KEY_INDEX_CACHE_SIZE = 16
+_KEY_INDEXES_BY_ID = OrderedDict()
+
+KEY_PATH_CACHE_SIZE = 256
+_KEY_PATHS = OrderedDict()
+
+# the value of a key missing from a dictionary
+_MISSING = object()
+
 
 def _raise_error(msg):
     """Raise an error message, prepend with filter name
@@ -59,19 +103,105 @@ def _to_well_known_type(obj):
     return json.loads(json.dumps(obj))
 
 
-def _run_test(entry, test, right, tests):
-    """Run a test
+def _test_plan(test, right, tests):
+    """Resolve a test once for all the entries it is run against,
+    the inversion and the wrapping of right for 'in' are applied once
 
-    :param test: The test to run
-    :type test: a lambda from the qual_map
-    :param entry: The x for the lambda
-    :type entry: str int or bool
-    :param right: The y for the lamba
+    :param test: The test to run, as provided
+    :type test: str
+    :param right: The y for the test, as provided
     :type right: str int bool or list
-    :return: If the test passed
-    :rtype: book
+    :param tests: The jinja tests from the current environment
+    :type tests: ansible.template.JinjaPluginIntercept
+    :return: The test and right as provided, a function returning the
+        jinja test or None if not found, the resolved test name, the
+        resolved right, if the result is inverted and the native test
+    :rtype: tuple
     """
-    msg = (
+    name = test
+    if name.startswith("!"):
+        invert = True
+        name = name.lstrip("!")
+        if name == "=":
+            name = "=="
+    elif name.startswith("not "):
+        invert = True
+        name = name.lstrip("not ")
+    else:
+        invert = False
+
+    resolved_right = right
+    if not isinstance(right, list) and name == "in":
+        resolved_right = [right]
+
+    j2_test = _lazy_j2_test(name, tests)
+    native = _native_test(name, resolved_right)
+    return (test, right, j2_test, name, resolved_right, invert, native)
+
+
+def _lazy_j2_test(name, tests):
+    """Get a function looking up a jinja test the first time it is
+    called, a native test only looks the jinja test up when it falls
+    back to it
+
+    :param name: The resolved test name
+    :type name: str
+    :param tests: The jinja tests from the current environment
+    :type tests: ansible.template.JinjaPluginIntercept
+    :return: The function returning the jinja test or None if not found
+    :rtype: callable
+    """
+    resolved = []
+
+    def j2_test():
+        if not resolved:
+            resolved.append(tests.get(name) if tests is not None else None)
+        return resolved[0]
+
+    return j2_test
+
+
+def _native_test(name, right):
+    """Get a python function for a test, the right is bound so the
+    function is only called with the entry
+
+    :param name: The resolved test name
+    :type name: str
+    :param right: The resolved y for the test
+    :type right: str int bool or list
+    :return: The function or None if the test is not a native test
+    :rtype: callable
+    """
+    if right is None:
+        return None
+    if name in NATIVE_TESTS:
+        function = NATIVE_TESTS[name]
+        return lambda entry: function(entry, right)
+    if name in NATIVE_REGEX_TESTS:
+        try:
+            method = getattr(re.compile(right), NATIVE_REGEX_TESTS[name])
+        except Exception:
+            # the jinja test reports the error
+            return None
+        return lambda entry: method(
+            to_text(entry, errors="surrogate_or_strict")
+        )
+    return None
+
+
+def _test_error_msg(entry, plan):
+    """Build the message for an error when testing an entry, only
+    called once an error happened since it converts the entry
+
+    :param entry: The x for the test
+    :type entry: str int or bool
+    :param plan: The test plan
+    :type plan: tuple
+    :return: The message
+    :rtype: str
+    """
+    test, right = plan[0], plan[1]
+    return (
         "Error encountered when testing value "
         "'{entry}' (type={entry_type}) against "
         "'{right}' (type={right_type}) with '{test}'. "
@@ -83,51 +213,247 @@ def _run_test(entry, test, right, tests):
         test=test,
     )
 
-    if test.startswith("!"):
-        invert = True
-        test = test.lstrip("!")
-        if test == "=":
-            test = "=="
-    elif test.startswith("not "):
-        invert = True
-        test = test.lstrip("not ")
+
+def _run_plan(entry, plan):
+    """Run a test plan against an entry
+
+    :param entry: The x for the test
+    :type entry: str int or bool
+    :param plan: The test plan from _test_plan
+    :type plan: tuple
+    :return: If the test passed
+    :rtype: bool
+    """
+    _test, _right, j2_test, name, right, invert, native = plan
+    if native is not None:
+        try:
+            result = native(entry)
+        except Exception:
+            # run the jinja test for the same result or error
+            result = _run_j2_test(entry, plan)
     else:
-        invert = False
+        result = _run_j2_test(entry, plan)
 
-    if not isinstance(right, list) and test == "in":
-        right = [right]
+    if invert:
+        result = not result
+    return result
 
-    j2_test = tests.get(test)
+
+def _run_j2_test(entry, plan):
+    """Run the jinja test of a test plan against an entry
+
+    :param entry: The x for the test
+    :type entry: str int or bool
+    :param plan: The test plan from _test_plan
+    :type plan: tuple
+    :return: The result of the test, not inverted
+    :rtype: bool
+    """
+    j2_test, name, right = plan[2](), plan[3], plan[4]
     if not j2_test:
         msg = "{msg} Error was: the test '{test}' was not found.".format(
-            msg=msg, test=test
+            msg=_test_error_msg(entry, plan), test=name
+        )
+        _raise_error(msg)
+    try:
+        if right is None:
+            result = j2_test(entry)
+        else:
+            result = j2_test(entry, right)
+    except Exception as exc:
+        msg = "{msg} Error was: {error}".format(
+            msg=_test_error_msg(entry, plan), error=to_native(exc)
         )
         _raise_error(msg)
-    else:
-        try:
-            if right is None:
-                result = j2_test(entry)
-            else:
-                result = j2_test(entry, right)
-        except Exception as exc:
-            msg = "{msg} Error was: {error}".format(
-                msg=msg, error=to_native(exc)
-            )
-            _raise_error(msg)
-
-    if invert:
-        result = not result
     return result
 
 
+def _run_test(entry, test, right, tests):
+    """Run a test
+
+    :param test: The test to run
+    :type test: a lambda from the qual_map
+    :param entry: The x for the lambda
+    :type entry: str int or bool
+    :param right: The y for the lamba
+    :type right: str int bool or list
+    :return: If the test passed
+    :rtype: book
+    """
+    return _run_plan(entry, _test_plan(test, right, tests))
+
+
+def _compile_key(key):
+    """Check the type of a key and split a key path, a path is
+    only split once for all the entries
+
+    :param key: The key to use when a list of dicts is passed
+    :type key: valid key type
+    :raises: AnsibleError if the key is not a valid key type
+    :return: The key and its path, None if it is not a path
+    :rtype: tuple
+    """
+    if not isinstance(key, (string_types, integer_types, bool)):
+        msg = "Unknown key type, key ({key}) was a {type}. ".format(
+            key=key, type=type(_to_well_known_type(key)).__name__
+        )
+        _raise_error(msg)
+
+    path = None
+    if isinstance(key, string_types) and ("." in key or "[" in key):
+        path = _KEY_PATHS.get(key)
+        if path is None:
+            path = tuple(split_path(key))
+            _KEY_PATHS[key] = path
+            while len(_KEY_PATHS) > KEY_PATH_CACHE_SIZE:
+                _KEY_PATHS.popitem(last=False)
+    return key, path
+
+
+def _key_value(dyct, key, path):
+    """Get the value of a key or key path in a dictionary,
+    a key found as is in the dictionary is used before the path
+
+    :param dyct: The dictionary
+    :type dyct: dict
+    :param key: The key
+    :type key: valid key type
+    :param path: The parts of the key path or None
+    :type path: tuple
+    :return: The value or _MISSING
+    :rtype: unknown
+    """
+    if key in dyct:
+        return dyct[key]
+    if path is None:
+        return _MISSING
+    obj = dyct
+    for part in path:
+        if isinstance(obj, Mapping):
+            if part not in obj:
+                return _MISSING
+            obj = obj[part]
+        elif isinstance(obj, list) and isinstance(part, int):
+            try:
+                obj = obj[part]
+            except IndexError:
+                return _MISSING
+        else:
+            return _MISSING
+    return obj
+
+
+def _raise_not_dicts(data):
+    """Raise the error for a list with entries that are not dictionaries
+
+    :param data: The data passed in
+    :type data: list
+    :raises: AnsibleError
+    """
+    all_tipes = [type(_to_well_known_type(entry)).__name__ for entry in data]
+    msg = (
+        "When a key name is provided, all list entries are required to "
+        "be dictionaries, got {str_tipes}"
+    ).format(str_tipes=_list_to_and_str(all_tipes))
+    _raise_error(msg)
+
+
+def _missing_msg(key, dyct, idx):
+    """Build the message for a key missing from a dictionary"""
+    return ("'{key}' was not found in '{dyct}' at [{index}]").format(
+        key=key, dyct=dyct, index=idx
+    )
+
+
+def _raise_missing(errors, fail_on_missing):
+    """Raise the errors for the keys missing from the dictionaries
+
+    :param errors: The messages from _missing_msg
+    :type errors: list
+    :param fail_on_missing: Should we fail if key not found?
+    :type fail_on_missing: bool
+    :raises: AnsibleError
+    """
+    _raise_error(
+        ("{errors}. fail_on_missing={fom}").format(
+            errors=_list_to_and_str(errors), fom=str(fail_on_missing)
+        )
+    )
+
+
+def _clause_plans(clauses, tests):
+    """Compile the clauses once for all the entries
+
+    :param clauses: The clauses, each a dict with a test, and
+        optionally a value and key
+    :type clauses: list
+    :param tests: The jinja tests from the current environment
+    :type tests: ansible.template.JinjaPluginIntercept
+    :return: The compiled key, None for the entry, and test plan
+        of each clause
+    :rtype: list
+    """
+    plans = []
+    for clause in clauses:
+        key = clause.get("key")
+        if key is not None:
+            key = _compile_key(key)
+        plan = _test_plan(clause["test"], clause.get("value"), tests)
+        plans.append((key, plan))
+    return plans
+
+
+def _iter_index_of(data, plans, fail_on_missing):
+    """Yield the indices of the entries matching all the clause plans,
+    the entries are walked once and checked to be dictionaries as they
+    are tested, the clauses of an entry stop at the first one not
+    matching, missing keys are raised once all entries are tested
+
+    :param data: The data passed in
+    :type data: list
+    :param plans: The clause plans from _clause_plans
+    :type plans: list
+    :param fail_on_missing: Should we fail if a key is not found?
+    :type fail_on_missing: bool
+    """
+    keys = list(
+        OrderedDict.fromkeys(key for key, _plan in plans if key is not None)
+    )
+    errors = []
+    for idx, entry in enumerate(data):
+        if keys and not isinstance(entry, dict):
+            _raise_not_dicts(data)
+        if fail_on_missing:
+            errors.extend(
+                _missing_msg(key[0], entry, idx)
+                for key in keys
+                if _key_value(entry, *key) is _MISSING
+            )
+        for key, plan in plans:
+            if key is None:
+                value = entry
+            else:
+                value = _key_value(entry, *key)
+                if value is _MISSING:
+                    break
+            if not _run_plan(value, plan):
+                break
+        else:
+            yield idx
+    if errors:
+        _raise_missing(errors, fail_on_missing)
+
+
 def index_of(
     data,
-    test,
+    test=None,
     value=None,
     key=None,
     wantlist=False,
     fail_on_missing=False,
     tests=None,
+    clauses=None,
+    lazy=False,
 ):
     """Find the index or indices of entries in list of objects"
 
@@ -137,7 +463,7 @@ def index_of(
     :type test: jinj2 test
     :param value: The value to use for the test
     :type value: unknown
-    :param key: The key to use when a list of dicts is passed
+    :param key: The key or key path to use when a list of dicts is passed
     :type key: valid key type
     :param want_list: always return a list, even if 1 index
     :type want_list: bool
@@ -145,48 +471,148 @@ def index_of(
     :type fail_on_missing: bool
     :param tests: The jinja tests from the current environment
     :type tests: ansible.template.JinjaPluginIntercept
+    :param clauses: Clauses all entries must match, used in place of
+        the test, value and key
+    :type clauses: list
+    :param lazy: Return a generator of the indices
+    :type lazy: bool
+    """
+    if clauses is None:
+        clauses = [{"test": test, "value": value, "key": key}]
+    matches = _iter_index_of(
+        data, _clause_plans(clauses, tests), fail_on_missing
+    )
+    if lazy:
+        return matches
+    res = list(matches)
+    if len(res) == 1 and not wantlist:
+        return res[0]
+    return res
+
+
+class KeyIndex(object):
+    """A hash index of the entries of a list, or of the value of a key
+    in each dictionary of a list, mapping each value to its indices
+    """
+
+    def __init__(self, values):
+        self.hashed = {}
+        # entries that cannot be hashed, ie dicts and lists
+        self.unhashable = []
+        # the indices of the dictionaries without the key
+        self.missing = []
+
+        for idx, entry in enumerate(values):
+            if entry is _MISSING:
+                self.missing.append(idx)
+                continue
+            try:
+                self.hashed.setdefault(entry, []).append(idx)
+            except TypeError:
+                self.unhashable.append((idx, entry))
+
+    def lookup(self, value):
+        """The indices of the entries equal to value
+
+        :param value: The value to find
+        :type value: unknown
+        :return: The indices in ascending order
+        :rtype: list
+        """
+        try:
+            return list(self.hashed.get(value, ()))
+        except TypeError:
+            return [idx for idx, entry in self.unhashable if entry == value]
+
+
+def _key_values(data, key):
+    """Get the value indexed for each entry of a list
+
+    :param data: The list of entries or dictionaries
+    :type data: list
+    :param key: The key to index, None to index the entries
+    :type key: str int bool or None
+    :return: The entries or the value of the key in each dictionary,
+        _MISSING for the dictionaries without the key
+    :rtype: tuple
     """
-    res = list()
     if key is None:
-        for idx, entry in enumerate(data):
-            result = _run_test(entry, test, value, tests)
-            if result:
-                res.append(idx)
-
-    elif isinstance(key, (string_types, integer_types, bool)):
-
-        if not all(isinstance(entry, dict) for entry in data):
-            all_tipes = [
-                type(_to_well_known_type(entry)).__name__ for entry in data
-            ]
-            msg = (
-                "When a key name is provided, all list entries are required to "
-                "be dictionaries, got {str_tipes}"
-            ).format(str_tipes=_list_to_and_str(all_tipes))
-            _raise_error(msg)
-        errors = []
-        for idx, dyct in enumerate(data):
-            if key in dyct:
-                entry = dyct.get(key)
-                result = _run_test(entry, test, value, tests)
-                if result:
-                    res.append(idx)
-            elif fail_on_missing:
-                msg = (
-                    "'{key}' was not found in '{dyct}' at [{index}]"
-                ).format(key=key, dyct=dyct, index=idx)
-                errors.append(msg)
-        if errors:
-            _raise_error(
-                ("{errors}. fail_on_missing={fom}").format(
-                    errors=_list_to_and_str(errors), fom=str(fail_on_missing)
-                )
-            )
-    else:
-        msg = "Unknown key type, key ({key}) was a {type}. ".format(
-            key=key, type=type(_to_well_known_type(key)).__name__
+        return tuple(data)
+    key = _compile_key(key)
+    values = []
+    for dyct in data:
+        if not isinstance(dyct, dict):
+            _raise_not_dicts(data)
+        values.append(_key_value(dyct, *key))
+    return tuple(values)
+
+
+def _key_index(data, key):
+    """Get the KeyIndex of a list for a key, reusing the index built
+    for the same list object and key while the indexed values are
+    unchanged, a list changed in place is indexed again
+
+    :param data: The list of entries or dictionaries
+    :type data: list
+    :param key: The key to index, None to index the entries
+    :type key: str int bool or None
+    :return: The index
+    :rtype: KeyIndex
+    """
+    values = _key_values(data, key)
+
+    cache_key = (id(data), key)
+    entry = _KEY_INDEXES_BY_ID.get(cache_key)
+    # the entry keeps a reference to the list so the id is not reused
+    if entry is not None and entry[0] is data and entry[1] == values:
+        return entry[2]
+
+    index = KeyIndex(values)
+    _KEY_INDEXES_BY_ID[cache_key] = (data, values, index)
+    while len(_KEY_INDEXES_BY_ID) > KEY_INDEX_CACHE_SIZE:
+        _KEY_INDEXES_BY_ID.popitem(last=False)
+    return index
+
+
+def index_by(
+    data, test, value=None, key=None, wantlist=False, fail_on_missing=False
+):
+    """Find the index or indices of entries in list of objects using
+    a hash index of the list, reused while the list is unchanged,
+    the result is the same as index_of for the same test
+
+    :param data: The data passed in (data|index_by(...))
+    :type data: list
+    :param test: the test to use, one of INDEX_BY_TESTS
+    :type test: str
+    :param value: The value to use for the test
+    :type value: unknown
+    :param key: The key to use when a list of dicts is passed
+    :type key: valid key type
+    :param want_list: always return a list, even if 1 index
+    :type want_list: bool
+    :param fail_on_missing: Should we fail if key not found?
+    :type fail_on_missing: bool
+    """
+    if test not in INDEX_BY_TESTS:
+        msg = "The test '{test}' is not supported, use one of {tests}".format(
+            test=test, tests=_list_to_and_str(list(INDEX_BY_TESTS))
         )
         _raise_error(msg)
+
+    index = _key_index(data, key)
+    if key is not None and fail_on_missing and index.missing:
+        errors = [_missing_msg(key, data[idx], idx) for idx in index.missing]
+        _raise_missing(errors, fail_on_missing)
+
+    if test == "in":
+        values = value if isinstance(value, list) else [value]
+        res = set()
+        for entry in values:
+            res.update(index.lookup(entry))
+        res = sorted(res)
+    else:
+        res = index.lookup(value)
     if len(res) == 1 and not wantlist:
         return res[0]
     return res
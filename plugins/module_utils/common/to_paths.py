@@ -11,50 +11,135 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import ast
 import re
 from ansible.module_utils.common._collections_compat import (
     Mapping,
     MutableMapping,
 )
+from ansible.module_utils.six import binary_type, integer_types, text_type
+
+
+def _path_field(field):
+    """Convert a field of a path, numbers become numbers
+    and quotes are stripped from strings
+    """
+    try:
+        return ast.literal_eval(field)
+    except Exception:
+        return re.sub("['\"]", "", field)
+
+
+def split_path(path):
+    """Split a path in dot bracket notation into it's parts,
+    the grammar of the paths returned by to_paths
+
+    :param path: The path, ie a.b[0]['c.d']
+    :type path: str
+    :return: the individual parts of the path
+    :rtype: list
+    """
+    que = list(path)
+    val = que.pop(0)
+    fields = []
+    try:
+        while True:
+            field = ""
+            # found a '.', move to the next character
+            if val == ".":
+                val = que.pop(0)
+            # found a '[', pop until ']' and then get the next
+            if val == "[":
+                val = que.pop(0)
+                while val != "]":
+                    field += val
+                    val = que.pop(0)
+                val = que.pop(0)
+            else:
+                while val not in [".", "["]:
+                    field += val
+                    val = que.pop(0)
+            fields.append(_path_field(field))
+    except IndexError:
+        # pop'ed past the end of the que
+        # so add the final field
+        fields.append(_path_field(field))
+    return fields
+
+
+# a key rendered as .key rather than ['key']
+IDENTIFIER = re.compile("^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+# values known not to be a mapping without an abc instance check
+SCALAR_TYPES = (
+    text_type,
+    binary_type,
+    bool,
+    float,
+    type(None),
+) + integer_types
+
+
+def _join_path(path):
+    """Render the segments of a path, the first segment is the
+    top level key and is used as is when it is the only one
+    """
+    if len(path) == 1:
+        return path[0]
+    try:
+        return "".join(path)
+    except TypeError:
+        # a top level key that is not a string
+        return "{first}{rest}".format(first=path[0], rest="".join(path[1:]))
 
 
 def to_paths(var, prepend, wantlist):
     if prepend:
         var = {prepend: var}
 
-    def flatten(data, name="", out=None):
-        if out is None:
-            out = {}
-        if isinstance(data, (dict, Mapping, MutableMapping)):
+    out = {}
+    if isinstance(var, list) and not var:
+        out = []
+    # the rendered segment of each key
+    segments = {}
+    # depth first with an explicit stack, the paths are tuples of
+    # segments only joined once a value is reached
+    stack = [(var, ())]
+    while stack:
+        data, path = stack.pop()
+        if isinstance(data, list):
+            if data:
+                stack.extend(
+                    (data[idx], path + ("[{idx}]".format(idx=idx),))
+                    for idx in reversed(range(len(data)))
+                )
+            elif len(path) > 1 or (path and path[0]):
+                out[_join_path(path)] = []
+        elif isinstance(data, dict) or (
+            not isinstance(data, SCALAR_TYPES)
+            and isinstance(data, (Mapping, MutableMapping))
+        ):
+            named = len(path) > 1 or bool(path and path[0])
             if data:
+                children = []
                 for key, val in data.items():
-                    if name:
-                        if re.match("^[a-zA-Z_][a-zA-Z0-9_]*$", key):
-                            nname = name + ".{key}".format(key=key)
+                    if not named:
+                        children.append((val, (key,)))
+                        continue
+                    segment = segments.get(key)
+                    if segment is None:
+                        if IDENTIFIER.match(key):
+                            segment = ".{key}".format(key=key)
                         else:
-                            nname = name + "['{key}']".format(key=key)
-                    else:
-                        nname = key
-                    flatten(val, nname, out)
-            elif name:
-                out[name] = {}
-            else:
-                out = {}
-        elif isinstance(data, list):
-            if data:
-                for idx, val in enumerate(data):
-                    flatten(
-                        val, "{name}[{idx}]".format(name=name, idx=idx), out
-                    )
-            elif name:
-                out[name] = []
-            else:
-                out = []
+                            segment = "['{key}']".format(key=key)
+                        segments[key] = segment
+                    children.append((val, path + (segment,)))
+                stack.extend(reversed(children))
+            elif named:
+                out[_join_path(path)] = {}
         else:
-            out[name] = data
-        return out
+            out[_join_path(path)] = data
 
-    out = flatten(var)
     if wantlist:
         return [out]
     return out
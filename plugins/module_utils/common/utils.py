@@ -7,10 +7,93 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import threading
+
+from collections import OrderedDict
 from copy import deepcopy
 
+from ansible.module_utils._text import to_text
 from ansible.module_utils.common._collections_compat import Mapping
-from ansible.module_utils.six import iteritems
+from ansible.module_utils.six import (
+    integer_types,
+    iteritems,
+    string_types,
+    text_type,
+)
+
+# types that need no conversion when converting to json compatible types
+NATIVE_SCALAR_TYPES = (type(None), bool, float, text_type) + integer_types
+
+
+LRU_CACHE_SIZE = 128
+
+
+class LruCache(object):
+    """A bounded, thread safe LRU cache of compiled objects, with
+    hit and miss counters
+    """
+
+    def __init__(self, maxsize=LRU_CACHE_SIZE):
+        """Initialize the cache
+        :param maxsize: The maximum number of entries to keep
+        :type maxsize: int
+        """
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Get an entry from the cache, marking it as recently used
+        :param key: The cache key
+        :type key: tuple
+        :return: The cached entry or None
+        :rtype: dict
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # move to the end, OrderedDict.move_to_end is not in py2
+            del self._entries[key]
+            self._entries[key] = entry
+            return entry
+
+    def set(self, key, entry):
+        """Add an entry to the cache, evicting the least recently used
+        :param key: The cache key
+        :type key: tuple
+        :param entry: The compiled entry
+        :type entry: dict
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Return the cache statistics
+        :return: hits, misses, current size and maxsize
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
 
 
 def sort_list(val):
@@ -110,3 +193,73 @@ def to_list(val):
         return [val]
     else:
         return list()
+
+
+def _native_key(key):
+    """Convert a dict key the way json.dumps does"""
+    if type(key) is text_type:
+        return key
+    if isinstance(key, string_types):
+        return to_text(key, errors="surrogate_or_strict")
+    if key is True:
+        return u"true"
+    if key is False:
+        return u"false"
+    if key is None:
+        return u"null"
+    if isinstance(key, integer_types):
+        return text_type(int(key))
+    if isinstance(key, float):
+        return text_type(repr(float(key)))
+    raise TypeError(
+        "keys must be str, int, float, bool or None, not {0}".format(
+            type(key).__name__
+        )
+    )
+
+
+def to_native_types(obj):
+    """Convert an object to the types json.loads(json.dumps(obj)) returns
+
+    Mappings become dicts with text keys, tuples become lists and
+    subclasses of str, int and float, for example AnsibleUnicode, become
+    the builtin type. Objects that are already made of native types are
+    returned unchanged rather than copied.
+
+    :param obj: The object to convert
+    :raises TypeError: If the object cannot be represented as json
+    :return: The object made of only native types
+    """
+    obj_type = type(obj)
+    if obj_type in NATIVE_SCALAR_TYPES:
+        return obj
+    if obj_type is dict or isinstance(obj, Mapping):
+        changed = obj_type is not dict
+        items = []
+        for key, value in iteritems(obj):
+            native_key = _native_key(key)
+            native_value = to_native_types(value)
+            if native_key is not key or native_value is not value:
+                changed = True
+            items.append((native_key, native_value))
+        return dict(items) if changed else obj
+    if obj_type is list or isinstance(obj, tuple):
+        changed = obj_type is not list
+        items = []
+        for value in obj:
+            native_value = to_native_types(value)
+            if native_value is not value:
+                changed = True
+            items.append(native_value)
+        return items if changed else obj
+    if isinstance(obj, text_type):
+        return text_type(obj)
+    if isinstance(obj, string_types):
+        return to_text(obj, errors="surrogate_or_strict")
+    if isinstance(obj, integer_types):
+        return int(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    raise TypeError(
+        "Object of type {0} is not JSON serializable".format(obj_type.__name__)
+    )
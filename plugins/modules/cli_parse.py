@@ -25,11 +25,55 @@ options:
         type: str
         description:
         - Text to be parsed
+    commands:
+        type: list
+        elements: dict
+        description:
+        - A list of commands to run on the host, each parsed with its own parser.
+        - The commands are sent in a single batch when the connection supports it.
+        - The parsed results are returned in I(parsed) as a dict keyed by command.
+        - Each command can only be provided once.
+        - Mutually exclusive with I(command) and I(text).
+        version_added: 2.5.0
+        suboptions:
+            command:
+                type: str
+                description:
+                - The command to run on the host
+                required: True
+            parser:
+                type: dict
+                description:
+                - Parser specific parameters for this command, see I(parser).
+                - Defaults to I(parser) when not provided.
+                suboptions:
+                    name:
+                        type: str
+                        description:
+                        - The name of the parser to use
+                        required: True
+                    command:
+                        type: str
+                        description:
+                        - The command used to locate the parser's template
+                    os:
+                        type: str
+                        description:
+                        - Provide an operating system value to the parser
+                    template_path:
+                        type: str
+                        description:
+                        - Path of the parser template on the Ansible controller
+                    vars:
+                        type: dict
+                        description:
+                        - Additional parser specific parameters
     parser:
         type: dict
         description:
         - Parser specific parameters
-        required: True
+        - Required with I(command) or I(text).
+        - With I(commands), the parser for the entries without their own parser.
         suboptions:
             name:
                 type: str
@@ -61,6 +105,37 @@ options:
         description:
         - Set the resulting parsed data as a fact
         type: str
+    stdout_lines:
+        description:
+        - Return the output of the command or commands split into lines in I(stdout_lines).
+        - Set to C(False) for very large outputs so the output is not held in memory a second
+          time as a list of lines.
+        - The textfsm parser reads the output a chunk of lines at a time either way.
+        type: bool
+        default: True
+        version_added: 2.5.0
+    timings:
+        description:
+        - Return the wall and CPU time of each phase of the task, in seconds, under the
+          I(timings) key of the result.
+        - The phases are C(argspec), C(command), C(parser_load), C(template), C(parse)
+          and C(normalize).
+        - The size of the text and of the parsed result, once serialized to JSON, are
+          returned as well.
+        - When not set, the timings are enabled by the C(ANSIBLE_CLI_PARSE_TIMINGS)
+          environment variable, set to C(False) to turn them off for the task.
+        type: bool
+        version_added: 2.5.0
+    profile_dir:
+        description:
+        - Profile the task with cProfile and write the statistics to a file in this
+          directory on the Ansible control node.
+        - The directory is created when it does not exist.
+        - When not set, the directory is taken from the C(ANSIBLE_CLI_PARSE_PROFILE_DIR)
+          environment variable, set to an empty string to not profile the task.
+        - The statistics can be read with the python C(pstats) module.
+        type: str
+        version_added: 2.5.0
 
 
 notes:
@@ -120,6 +195,19 @@ EXAMPLES = r"""
     set_fact: interfaces_fact
 
 
+- name: Run many commands and parse each with its own parser
+  ansible.utils.cli_parse:
+    commands:
+      - command: "show interface"
+      - command: "show version"
+        parser:
+          name: ansible.utils.textfsm
+          template_path: "{{ role_path }}/templates/show_version.textfsm"
+    parser:
+      name: ansible.netcommon.native
+    set_fact: device_facts
+
+
 - name: Pass text and template_path
   ansible.utils.cli_parse:
     text: "{{ previous_command['stdout'] }}"
@@ -263,19 +351,39 @@ EXAMPLES = r"""
 
 RETURN = r"""
 parsed:
-  description: The structured data resulting from the parsing of the text
+  description:
+  - The structured data resulting from the parsing of the text
+  - A dict of the structured data of each command, keyed by command, when provided commands
   returned: always
   type: dict
   sample:
 stdout:
-  description: The output from the command run
-  returned: when provided a command
+  description:
+  - The output from the command run
+  - A dict of the output of each command, keyed by command, when provided commands
+  returned: when provided a command or commands
   type: str
   sample:
 stdout_lines:
-  description: The output of the command run split into lines
-  returned: when provided a command
+  description:
+  - The output of the command run split into lines
+  - A dict of the lines of each command, keyed by command, when provided commands
+  returned: when provided a command or commands and I(stdout_lines) is set
   type: list
   elements: str
   sample:
+timings:
+  description:
+  - The wall and CPU time of each phase of the task and of the whole task, in seconds
+  - The size of the text and of the parsed result
+  - The path of the cProfile statistics file when I(profile_dir) is set
+  returned: when I(timings) is set
+  type: dict
+  sample:
+    phases:
+      argspec: {"cpu": 0.000412, "wall": 0.000415}
+      parse: {"cpu": 0.001974, "wall": 0.001981}
+    total: {"cpu": 0.003317, "wall": 0.003402}
+    text_size: 1852
+    parsed_size: 742
 """
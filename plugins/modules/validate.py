@@ -24,7 +24,30 @@ options:
         description:
         - Data that will be validated against I(criteria). For the type of data refer to the
           documentation of individual validate plugins.
-        required: True
+        - One of I(data) or I(data_file) is required.
+    data_file:
+        type: path
+        description:
+        - Path of a file on the Ansible controller with the records to validate against I(criteria).
+        - The file is either in JSON Lines format, one JSON document per line, or a YAML file
+          with one or more documents.
+        - The records are read and validated one at a time, so the whole file is never loaded in memory.
+        - Each error returned has a I(record) key with the index of the record it was found in,
+          starting at C(0).
+        - This can be a relative or an absolute path, relative paths are searched for in the
+          C(files) directories of the role or playbook.
+        - Mutually exclusive with I(data).
+        version_added: 2.5.0
+    data_format:
+        type: str
+        description:
+        - The format of the file in I(data_file).
+        - If not set, C(yaml) is used for a file with a C(.yml) or C(.yaml) extension
+          and C(json_lines) otherwise.
+        choices:
+        - json_lines
+        - yaml
+        version_added: 2.5.0
     engine:
         type: str
         description:
@@ -61,6 +84,12 @@ EXAMPLES = r"""
     engine: ansible.utils.jsonschema
   vars:
     ansible_jsonschema_draft: draft7
+
+- name: validate each record of a JSON Lines file with jsonschema engine
+  ansible.utils.validate:
+    data_file: "{{ role_path }}/files/interfaces.jsonl"
+    criteria: "{{ criteria }}"
+    engine: ansible.utils.jsonschema
 """
 
 RETURN = r"""
@@ -73,7 +102,9 @@ msg:
   returned: always
   type: str
 errors:
-  description: The list of errors in I(data) based on the I(criteria).
+  description:
+  - The list of errors in I(data) based on the I(criteria).
+  - When I(data_file) is used each error has the index of its record as I(record).
   returned: when I(data) value is invalid
   type: list
   elements: str
@@ -5,6 +5,54 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ansible.module_utils.six import string_types
+
+# the size, in characters, of the chunks of text handed to the parsers
+# that consume the text incrementally
+TEXT_CHUNK_SIZE = 65536
+
+
+def iter_text_chunks(text, chunk_size=TEXT_CHUNK_SIZE):
+    """ Split text in chunks of about chunk_size characters, each chunk ends
+    at the end of a line so no line is split across two chunks
+
+    :param text: The text, a file-like object or an iterable of lines
+    :type text: str
+    :param chunk_size: The size of a chunk
+    :type chunk_size: int
+    :return: The chunks
+    :rtype: generator
+    """
+    if not text:
+        return
+    if isinstance(text, string_types):
+        start = 0
+        length = len(text)
+        while start < length:
+            end = text.find("\n", start + chunk_size)
+            if end == -1:
+                end = length
+            else:
+                end += 1
+            yield text[start:end]
+            start = end
+        return
+
+    chunk = []
+    size = 0
+    for line in text:
+        # lines from an iterator may not have their line break
+        if not line.endswith(("\n", "\r")):
+            line += "\n"
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield "".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield "".join(chunk)
+
 
 class CliParserBase:
     """ The base class for cli parsers
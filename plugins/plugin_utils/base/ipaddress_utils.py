@@ -13,7 +13,8 @@ __metaclass__ = type
 
 from ansible.errors import AnsibleError
 from ansible.module_utils.basic import missing_required_lib
-from ansible.module_utils.six import ensure_text
+from ansible.module_utils.six import ensure_text, iteritems, string_types
+from collections import OrderedDict
 from functools import wraps
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     check_argspec,
@@ -26,6 +27,34 @@ try:
 except ImportError:
     HAS_IPADDRESS = False
 
+try:
+    import yaml
+
+    # use C version if possible for speedup
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
+
+# option types the fast path can check with a simple isinstance
+FAST_PATH_TYPES = {
+    "str": string_types,
+    "list": list,
+    "bool": bool,
+    "raw": object,
+}
+FAST_PATH_METADATA = ("description", "type", "required")
+
+# compiled fast path validators, keyed by DOCUMENTATION
+_FAST_VALIDATORS = {}
+
+# network indexes, keyed by list content
+NETWORK_INDEX_CACHE_SIZE = 16
+_NETWORK_INDEXES_BY_CONTENT = OrderedDict()
+
 
 def ip_network(ip):
     """ PY2 compat shim, PY2 requires unicode
@@ -69,10 +98,164 @@ def _is_subnet_of(network_a, network_b):
         return False
 
 
+class NetworkIndex(object):
+    """ An index of a list of networks for longest prefix lookups
+
+    Networks are stored by version and prefix length, keyed by the
+    integer value of the network address, so finding the networks
+    containing an address takes one dict lookup per distinct prefix
+    length rather than parsing and comparing every network
+    """
+
+    def __init__(self, networks):
+        self._tables = {4: {}, 6: {}}
+        for network in networks:
+            try:
+                net = ip_network(network)
+            except Exception:
+                continue
+            table = self._tables[net.version].setdefault(net.prefixlen, {})
+            entry = table.get(int(net.network_address))
+            if entry is None:
+                # the count keeps duplicate networks for in_one_network
+                table[int(net.network_address)] = [1, network]
+            else:
+                entry[0] += 1
+        self._prefixlens = dict(
+            (version, sorted(table, reverse=True))
+            for version, table in iteritems(self._tables)
+        )
+
+    def matches(self, ip):
+        """ Yield the (count, network) of each network containing ip,
+        longest prefix first
+        """
+
+        try:
+            net = ip_network(ip)
+        except Exception:
+            return
+        table = self._tables[net.version]
+        address = int(net.network_address)
+        for prefixlen in self._prefixlens[net.version]:
+            if prefixlen > net.prefixlen:
+                continue
+            shift = net.max_prefixlen - prefixlen
+            entry = table[prefixlen].get(address >> shift << shift)
+            if entry is not None:
+                yield entry[0], entry[1]
+
+    def any_match(self, ip):
+        """ Test if any network contains ip
+        """
+
+        for _match in self.matches(ip):
+            return True
+        return False
+
+    def match_count(self, ip):
+        """ Count the networks containing ip, including duplicates
+        """
+
+        return sum(count for count, _network in self.matches(ip))
+
+    def longest_match(self, ip):
+        """ Return the network with the longest prefix containing ip
+        """
+
+        for _count, network in self.matches(ip):
+            return network
+        return None
+
+
+def _cache_network_index(cache, key, value):
+    cache[key] = value
+    while len(cache) > NETWORK_INDEX_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _network_index(networks):
+    """ Get the NetworkIndex for a list of networks, reusing the index
+    built for a list with the same content, the content is compared on
+    every call so a list changed in place is indexed again
+    """
+
+    try:
+        content = tuple(networks)
+        index = _NETWORK_INDEXES_BY_CONTENT.get(content)
+    except TypeError:
+        content = None
+        index = None
+    if index is None:
+        index = NetworkIndex(networks)
+        if content is not None:
+            _cache_network_index(_NETWORK_INDEXES_BY_CONTENT, content, index)
+    return index
+
+
+def _compile_fast_validator(doc):
+    """ Compile a lightweight validator from the plugin's DOCUMENTATION
+
+    Only specs made of simple required/type options are supported,
+    anything richer returns None and uses the full argspec validator.
+    The validator only ever answers "valid", the full argspec
+    validator is used to build the error messages
+    """
+
+    if not HAS_YAML:
+        return None
+    try:
+        options = yaml.load(doc, SafeLoader).get("options") or {}
+    except Exception:
+        return None
+
+    spec = {}
+    for name, option in iteritems(options):
+        if any(metakey not in FAST_PATH_METADATA for metakey in option):
+            return None
+        wanted = FAST_PATH_TYPES.get(option.get("type", "str"))
+        if wanted is None:
+            return None
+        spec[name] = wanted
+    required = tuple(
+        name for name, option in iteritems(options) if option.get("required")
+    )
+
+    def validator(params):
+        for name, value in iteritems(params):
+            wanted = spec.get(name)
+            if wanted is None:
+                return False
+            if value is not None and not isinstance(value, wanted):
+                return False
+        for name in required:
+            if name not in params:
+                return False
+        return True
+
+    return validator
+
+
+def _fast_validator(doc):
+    """ Get the compiled fast path validator for a DOCUMENTATION
+    """
+
+    try:
+        return _FAST_VALIDATORS[doc]
+    except KeyError:
+        validator = _compile_fast_validator(doc)
+        _FAST_VALIDATORS[doc] = validator
+        return validator
+
+
 def _validate_args(plugin, doc, params):
-    """ argspec validator utility function
+    """ argspec validator utility function, returns the validated params
     """
 
+    fast_validator = _fast_validator(doc)
+    if fast_validator is not None and fast_validator(params):
+        return params
+
     valid, argspec_result, updated_params = check_argspec(
         doc, plugin + " test", **params
     )
@@ -84,3 +267,4 @@ def _validate_args(plugin, doc, params):
                 argspec_errors=argspec_result.get("errors"),
             )
         )
+    return updated_params
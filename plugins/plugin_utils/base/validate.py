@@ -5,6 +5,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import io
+import json
 import os
 
 from importlib import import_module
@@ -12,6 +14,7 @@ from importlib import import_module
 from ansible.errors import AnsibleError
 from ansible.module_utils.six import iteritems
 from ansible.module_utils._text import to_text, to_native
+from ansible.utils.display import Display
 
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     check_argspec,
@@ -32,19 +35,129 @@ try:
 except ImportError:
     HAS_YAML = False
 
+display = Display()
+
+# validate plugin documentation: [(option name, var names, env names)]
+_SUB_PLUGIN_OPTIONS = {}
+
+
+# the formats of a data file, read by _read_records
+DATA_FILE_FORMATS = ("json_lines", "yaml")
+
+
+def _read_records(path, data_format=None):
+    """Read the records from a JSON Lines file or a YAML file with one or
+    more documents, one record at a time so the whole file is never loaded
+
+    :param path: The path to the file
+    :type path: str
+    :param data_format: json_lines or yaml, if not set the format is
+        yaml for a .yml or .yaml file and json_lines otherwise
+    :type data_format: str
+    :raises AnsibleError: If the file or a record cannot be read
+    :return: The records
+    :rtype: generator
+    """
+    if data_format is None:
+        if path.endswith((".yml", ".yaml")):
+            data_format = "yaml"
+        else:
+            data_format = "json_lines"
+
+    try:
+        fhand = io.open(path, encoding="utf-8")
+    except (IOError, OSError) as exc:
+        raise AnsibleError(
+            "Failed to open data file '{path}'. Error: {err}".format(
+                path=path, err=to_native(exc)
+            )
+        )
+
+    with fhand:
+        if data_format == "yaml":
+            records = (
+                record
+                for record in yaml.load_all(fhand, Loader=SafeLoader)
+                if record is not None
+            )
+        else:
+            records = (json.loads(line) for line in fhand if line.strip())
+
+        index = 0
+        while True:
+            try:
+                record = next(records)
+            except StopIteration:
+                return
+            except Exception as exc:
+                raise AnsibleError(
+                    "Failed to read record {index} from data file '{path}'. Error: {err}".format(
+                        index=index, path=path, err=to_native(exc)
+                    )
+                )
+            yield record
+            index += 1
+
+
+def _merge_record_result(result, index, record_result):
+    """Add the errors and msg of one record to the result of all records,
+    an error that is not a dict is set as the msg of a dict with the record
+
+    :param result: The result of all records
+    :type result: dict
+    :param index: The index of the record
+    :type index: int
+    :param record_result: The result of the record
+    :type record_result: dict
+    """
+    errors = record_result.get("errors")
+    if not errors:
+        return
+    result.setdefault("errors", [])
+    for error in to_list(errors):
+        if isinstance(error, dict):
+            error = dict(error, record=index)
+        else:
+            error = {"record": index, "msg": error}
+        result["errors"].append(error)
+    msg = "Record {index}: {msg}".format(
+        index=index,
+        msg=record_result.get(
+            "msg",
+            errors if not isinstance(errors, list) else "validation failed",
+        ),
+    )
+    if "msg" in result:
+        result["msg"] += "\n" + msg
+    else:
+        result["msg"] = msg
+
 
 class ValidateBase(object):
     """The base class for data validators
     Provides a  _debug function to normalize debug output
     """
 
-    def __init__(self, data, criteria, engine, plugin_vars=None, kwargs=None):
+    def __init__(
+        self,
+        data,
+        criteria,
+        engine,
+        plugin_vars=None,
+        kwargs=None,
+        option_defaults=None,
+    ):
         self._data = data
         self._criteria = criteria
         self._engine = engine
         self._plugin_vars = plugin_vars if plugin_vars is not None else {}
         self._result = {}
         self._kwargs = kwargs if kwargs is not None else {}
+        # defaults used by the calling plugin, in place of the option
+        # defaults, when an option is not passed, set as a var or env
+        self._option_defaults = (
+            option_defaults if option_defaults is not None else {}
+        )
         self._sub_plugin_options = {}
 
         cref = dict(zip(["corg", "cname", "plugin"], engine.split(".")))
@@ -56,8 +169,30 @@ class ValidateBase(object):
         if validatordoc:
             self._set_sub_plugin_options(validatordoc)
 
-    def _set_sub_plugin_options(self, doc):
-        params = {}
+    def _debug(self, msg):
+        """Output text using ansible's display
+
+        :param msg: The message
+        :type msg: str
+        """
+        display.vvvv(
+            "[validate] {engine} {msg}".format(engine=self._engine, msg=msg)
+        )
+
+    def _compile_sub_plugin_options(self, doc):
+        """Read the options of a validate plugin from its documentation,
+        the result is cached so the documentation is only read once
+
+        :param doc: The validate plugin documentation
+        :type doc: str
+        :return: A list of (option name, var names, env names)
+        :rtype: list
+        """
+        try:
+            return _SUB_PLUGIN_OPTIONS[doc]
+        except KeyError:
+            pass
+
         try:
             argspec_obj = yaml.load(doc, SafeLoader)
         except Exception as exc:
@@ -70,14 +205,46 @@ class ValidateBase(object):
             )
         options = argspec_obj.get("options", {})
 
-        if not options:
-            return None
+        compiled = []
+        for option_name, option_value in iteritems(options or {}):
+            var_names = []
+            for var_name_entry in to_list(option_value.get("vars", [])):
+                if not isinstance(var_name_entry, dict):
+                    raise AnsibleError(
+                        "invalid type '{var_name_type}' for the value of '{var_name_entry}' option,"
+                        " should to be type dict".format(
+                            var_name_type=type(var_name_entry),
+                            var_name_entry=var_name_entry,
+                        )
+                    )
+                if var_name_entry.get("name"):
+                    var_names.append(var_name_entry["name"])
+
+            env_names = []
+            for env_name_entry in to_list(option_value.get("env", [])):
+                if not isinstance(env_name_entry, dict):
+                    raise AnsibleError(
+                        "invalid type '{env_name_entry_type}' for the value of '{env_name_entry}' option,"
+                        " should to be type dict".format(
+                            env_name_entry_type=type(env_name_entry),
+                            env_name_entry=env_name_entry,
+                        )
+                    )
+                env_names.append(env_name_entry.get("name"))
+
+            compiled.append((option_name, var_names, env_names))
 
-        for option_name, option_value in iteritems(options):
+        _SUB_PLUGIN_OPTIONS[doc] = compiled
+        return compiled
 
-            option_var_name_list = option_value.get("vars", [])
-            option_env_name_list = option_value.get("env", [])
+    def _set_sub_plugin_options(self, doc):
+        params = {}
+        options = self._compile_sub_plugin_options(doc)
+
+        if not options:
+            return None
 
+        for option_name, var_names, env_names in options:
             # check if plugin configuration option passed as kwargs
             # valid for lookup, filter, test plugins or pass through
             # variables if supported by the module.
@@ -89,41 +256,30 @@ class ValidateBase(object):
             #  vars:
             #  - name: ansible_validate_jsonschema_draft
             #  - name: ansible_validate_jsonschema_draft_type
-            if option_var_name_list and (option_name not in params):
-                for var_name_entry in to_list(option_var_name_list):
-                    if not isinstance(var_name_entry, dict):
-                        raise AnsibleError(
-                            "invalid type '{var_name_type}' for the value of '{var_name_entry}' option,"
-                            " should to be type dict".format(
-                                var_name_type=type(var_name_entry),
-                                var_name_entry=var_name_entry,
-                            )
-                        )
-                    var_name = var_name_entry.get("name")
-                    if var_name and var_name in self._plugin_vars:
-                        params[option_name] = self._plugin_vars[var_name]
-                        break
+            for var_name in var_names:
+                if var_name in self._plugin_vars:
+                    params[option_name] = self._plugin_vars[var_name]
+                    break
 
             # check if plugin configuration option as passed as enviornment  eg.
             # env:
             # - name: ANSIBLE_VALIDATE_JSONSCHEMA_DRAFT
-            if option_env_name_list and (option_name not in params):
-                for env_name_entry in to_list(option_env_name_list):
-                    if not isinstance(env_name_entry, dict):
-                        raise AnsibleError(
-                            "invalid type '{env_name_entry_type}' for the value of '{env_name_entry}' option,"
-                            " should to be type dict".format(
-                                env_name_entry_type=type(env_name_entry),
-                                env_name_entry=env_name_entry,
-                            )
-                        )
-                    env_name = env_name_entry.get("name")
+            if option_name not in params:
+                for env_name in env_names:
                     if env_name in os.environ:
                         params[option_name] = os.environ[env_name]
                         break
 
+            if (
+                option_name not in params
+                and option_name in self._option_defaults
+            ):
+                params[option_name] = self._option_defaults[option_name]
+
+        # the documentation is passed as is, check_argspec caches the
+        # argspec compiled from it
         valid, argspec_result, updated_params = check_argspec(
-            yaml.dump(argspec_obj), self._engine, **params
+            doc, self._engine, **params
         )
         if not valid:
             raise AnsibleError(
@@ -139,9 +295,47 @@ class ValidateBase(object):
     def _get_sub_plugin_options(self, name):
         return self._sub_plugin_options.get(name)
 
+    def validate_records(self, records):
+        """Validate each record against the criteria, one at a time
+
+        :param records: The records to validate, for example from _read_records
+        :type records: iterable
+        :return: The errors of all records, each error has the index of its
+            record set as record, and a msg with a line per invalid record
+        :rtype: dict
+        """
+        result = {}
+        criteria = self._criteria
+        fail_fast = self._get_sub_plugin_options("fail_fast")
+        for index, record in enumerate(records):
+            self._data = record
+            self._criteria = criteria
+            self._result = {}
+            try:
+                record_result = self.validate()
+            except AnsibleError as exc:
+                raise AnsibleError(
+                    "Record {index}: {err}".format(
+                        index=index,
+                        err=to_text(exc, errors="surrogate_then_replace"),
+                    )
+                )
+            _merge_record_result(result, index, record_result)
+            if not isinstance(record_result.get("errors", []), list):
+                break
+            if fail_fast and result.get("errors"):
+                break
+        return result
+
 
 def _load_validator(
-    engine, data, criteria, plugin_vars=None, cls_name="Validate", kwargs=None
+    engine,
+    data,
+    criteria,
+    plugin_vars=None,
+    cls_name="Validate",
+    kwargs=None,
+    option_defaults=None,
 ):
     """
     Load the validate plugin from engine name
@@ -150,6 +344,8 @@ def _load_validator(
                  be referred in individual plugin documentation.
     :param cls_name: Base class name for validate plugin. Defaults to ``Validate``.
     :param kwargs: The base name of the class for validate plugin
+    :param option_defaults: Defaults for the validate plugin options used when
+                 an option is not passed in kwargs, set as a variable or an environment variable
     :return:
     """
     result = {}
@@ -179,6 +375,7 @@ def _load_validator(
             engine=engine,
             plugin_vars=plugin_vars,
             kwargs=kwargs,
+            option_defaults=option_defaults,
         )
         return validator, result
     except Exception as exc:
@@ -38,6 +38,9 @@ import json
 
 from ansible.module_utils._text import to_native
 from ansible.module_utils.six import string_types
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
+    to_native_types,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.cli_parser import (
     CliParserBase,
 )
@@ -50,6 +53,8 @@ class CliParser(CliParserBase):
 
     DEFAULT_TEMPLATE_EXTENSION = None
     PROVIDE_TEMPLATE_CONTENTS = False
+    # json.loads only returns native types
+    NATIVE_OUTPUT = True
 
     def parse(self, *_args, **_kwargs):
         """ Std entry point for a cli_parse parse execution
@@ -66,9 +71,12 @@ class CliParser(CliParserBase):
         """
         text = self._task_args.get("text")
         try:
-            if not isinstance(text, string_types):
-                text = json.dumps(text)
-            parsed = json.loads(text)
+            if isinstance(text, string_types):
+                parsed = json.loads(text)
+            else:
+                # already structured data, converted without
+                # serializing it to a json string first
+                parsed = to_native_types(text)
         except Exception as exc:
             return {"errors": [to_native(exc)]}
 
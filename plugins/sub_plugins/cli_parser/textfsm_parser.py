@@ -37,11 +37,17 @@ EXAMPLES = r"""
 """
 
 import os
+import threading
 
 from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import missing_required_lib
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
+    LruCache,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.cli_parser import (
+    TEXT_CHUNK_SIZE,
     CliParserBase,
+    iter_text_chunks,
 )
 
 try:
@@ -51,6 +57,61 @@ try:
 except ImportError:
     HAS_TEXTFSM = False
 
+TEMPLATE_CACHE_SIZE = 16
+
+# compiled templates, template path: ((mtime, size), TextFSM)
+# the cache is per process, it is only reused within a task
+_TEMPLATE_CACHE = LruCache(maxsize=TEMPLATE_CACHE_SIZE)
+# a compiled template holds the parse state, serialize its use
+_TEMPLATE_CACHE_LOCK = threading.RLock()
+
+
+def _compiled_template(template_path):
+    """ Get the compiled template for a template path, the template
+    is only compiled again if its mtime or size has changed
+
+    Each host runs in its own worker process, so the compiled template
+    is only reused by the parses of the same task and host, for example
+    the entries of commands using the same template
+
+    :param template_path: The path to the textfsm template
+    :type template_path: str
+    :return: The compiled template and True if it was found in the cache
+    :rtype: tuple
+    """
+    stat = os.stat(template_path)
+    key = (stat.st_mtime, stat.st_size)
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is not None and cached[0] == key:
+        return cached[1], True
+    with open(template_path) as template:
+        re_table = textfsm.TextFSM(template)
+    _TEMPLATE_CACHE.set(template_path, (key, re_table))
+    return re_table, False
+
+
+def _parse_chunks(re_table, text, chunk_size=TEXT_CHUNK_SIZE):
+    """ Parse the text one chunk of lines at a time so the whole text
+    is never split in lines at once, the result is the same as
+    re_table.ParseText(text)
+
+    :param re_table: The compiled template, reset to its Start state
+    :type re_table: textfsm.TextFSM
+    :param text: The text, a file-like object or an iterable of lines
+    :type text: str
+    :param chunk_size: The size of a chunk
+    :type chunk_size: int
+    :return: The rows
+    :rtype: list
+    """
+    for chunk in iter_text_chunks(text, chunk_size):
+        re_table.ParseText(chunk, eof=False)
+        # ParseText only stops at End or EOF within a chunk
+        if getattr(re_table, "_cur_state_name", None) in ("End", "EOF"):
+            break
+    # an empty text only runs the implicit EOF record
+    return re_table.ParseText("", eof=True)
+
 
 class CliParser(CliParserBase):
     """ The textfsm parser class
@@ -98,16 +159,25 @@ class CliParser(CliParserBase):
                     file=template_path
                 )
             }
-        try:
-            template = open(self._task_args.get("parser").get("template_path"))
-        except IOError as exc:
-            return {"errors": to_native(exc)}
-
-        re_table = textfsm.TextFSM(template)
-        fsm_results = re_table.ParseText(cli_output)
+        template_path = os.path.abspath(template_path)
+        with _TEMPLATE_CACHE_LOCK:
+            try:
+                re_table, cached = _compiled_template(template_path)
+            except (IOError, OSError) as exc:
+                return {"errors": to_native(exc)}
+            if self._debug:
+                self._debug(
+                    "textfsm template cache {status} for {path}".format(
+                        status="hit" if cached else "miss", path=template_path
+                    )
+                )
+            # start each parse from the Start state with empty records
+            re_table.Reset()
+            fsm_results = _parse_chunks(re_table, cli_output)
+            header = re_table.header
 
         results = list()
         for item in fsm_results:
-            results.append(dict(zip(re_table.header, item)))
+            results.append(dict(zip(header, item)))
 
         return {"parsed": results}
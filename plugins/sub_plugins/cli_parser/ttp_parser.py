@@ -36,10 +36,15 @@ EXAMPLES = r"""
   register: nxos_ttp_text
 """
 
+import json
 import os
+import threading
 
 from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import missing_required_lib
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
+    LruCache,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.cli_parser import (
     CliParserBase,
 )
@@ -51,6 +56,69 @@ try:
 except ImportError:
     HAS_TTP = False
 
+TTP_CACHE_SIZE = 16
+
+# compiled ttp objects, (path, mtime, size, ttp_vars, ttp_init): ttp
+# the cache is per process, it is only reused within a task
+_TTP_CACHE = LruCache(maxsize=TTP_CACHE_SIZE)
+# a ttp object holds the inputs and results, serialize its use
+_TTP_CACHE_LOCK = threading.RLock()
+
+
+def _cached_ttp(template_path, ttp_vars, ttp_init):
+    """ Get a ttp object with the template compiled, the template
+    is only compiled again if its mtime or size has changed
+
+    Each host runs in its own worker process, so the ttp object is only
+    reused by the parses of the same task and host, for example the
+    entries of commands using the same template. The output of each host
+    is parsed on its own, there are no outputs of several hosts to parse
+    together
+
+    :param template_path: The path to the ttp template
+    :type template_path: str
+    :param ttp_vars: The vars passed to ttp
+    :type ttp_vars: dict
+    :param ttp_init: The additional arguments used to create the ttp object
+    :type ttp_init: dict
+    :return: The ttp object and True if it was found in the cache
+    :rtype: tuple
+    """
+    stat = os.stat(template_path)
+    key = (
+        template_path,
+        stat.st_mtime,
+        stat.st_size,
+        json.dumps(ttp_vars, sort_keys=True, default=repr),
+        json.dumps(ttp_init, sort_keys=True, default=repr),
+    )
+    parser = _TTP_CACHE.get(key)
+    if parser is not None:
+        return parser, True
+    parser = ttp(template=template_path, vars=ttp_vars, **ttp_init)
+    _TTP_CACHE.set(key, parser)
+    return parser, False
+
+
+def _reset_ttp(parser):
+    """ Remove the inputs, results and per parse state from a ttp object
+    so it can be reused, the results are replaced rather than cleared
+    since they have been returned to the caller
+
+    The values saved with record, and the counters of count, are kept
+    in the global_vars of the ttp object and would otherwise be seen
+    by the next parse, the parser and results objects hold the last
+    text and results
+
+    :param parser: The ttp object
+    """
+    parser.clear_input()
+    for template in parser._templates:
+        template.results = []
+    parser._ttp_["global_vars"].clear()
+    for name in ("parser_object", "results_object"):
+        parser._ttp_.pop(name, None)
+
 
 class CliParser(CliParserBase):
     """ The ttp parser class
@@ -73,6 +141,58 @@ class CliParser(CliParserBase):
 
         return {"errors": errors}
 
+    def _parser_vars(self, name):
+        """ Get one of the ttp settings from parser/vars
+
+        :param name: The name of the setting, ttp_init, ttp_vars or ttp_results
+        :type name: str
+        :return: The setting
+        :rtype: dict
+        """
+        parser_param = self._task_args.get("parser")
+        if parser_param.get("vars"):
+            return parser_param.get("vars", {}).get(name, {})
+        return {}
+
+    def _template_path(self):
+        """ Get the template path and check it exists
+
+        :return: The template path or the errors
+        :rtype: tuple
+        """
+        template_path = to_native(
+            self._task_args.get("parser").get("template_path"),
+            errors="surrogate_then_replace",
+        )
+        if template_path and not os.path.isfile(template_path):
+            return (
+                None,
+                "error while reading template_path file {file}".format(
+                    file=template_path
+                ),
+            )
+        return os.path.abspath(template_path), None
+
+    def _get_ttp(self, template_path):
+        """ Get the cached ttp object for the template and settings
+
+        :param template_path: The path to the ttp template
+        :type template_path: str
+        :return: The ttp object
+        """
+        parser, cached = _cached_ttp(
+            template_path,
+            self._parser_vars("ttp_vars"),
+            self._parser_vars("ttp_init"),
+        )
+        if self._debug:
+            self._debug(
+                "ttp template cache {status} for {path}".format(
+                    status="hit" if cached else "miss", path=template_path
+                )
+            )
+        return parser
+
     def parse(self, *_args, **_kwargs):
         """ Std entry point for a cli_parse parse execution
 
@@ -93,39 +213,19 @@ class CliParser(CliParserBase):
         if res.get("errors"):
             return {"errors": res.get("errors")}
 
-        template_path = to_native(
-            self._task_args.get("parser").get("template_path"),
-            errors="surrogate_then_replace",
-        )
-        if template_path and not os.path.isfile(template_path):
-            return {
-                "errors": "error while reading template_path file {file}".format(
-                    file=template_path
-                )
-            }
+        template_path, errors = self._template_path()
+        if errors:
+            return {"errors": errors}
 
         try:
-            parser_param = self._task_args.get("parser")
-            vars = (
-                parser_param.get("vars", {}).get("ttp_vars", {})
-                if parser_param.get("vars")
-                else {}
-            )
-            kwargs = (
-                parser_param.get("vars", {}).get("ttp_init", {})
-                if parser_param.get("vars")
-                else {}
-            )
-            parser = ttp(
-                data=cli_output, template=template_path, vars=vars, **kwargs
-            )
-            parser.parse(one=True)
-            ttp_results = (
-                parser_param.get("vars", {}).get("ttp_results", {})
-                if parser_param.get("vars")
-                else {}
-            )
-            results = parser.result(**ttp_results)
+            with _TTP_CACHE_LOCK:
+                parser = self._get_ttp(template_path)
+                try:
+                    parser.add_input(cli_output)
+                    parser.parse(one=True)
+                    results = parser.result(**self._parser_vars("ttp_results"))
+                finally:
+                    _reset_ttp(parser)
         except Exception as exc:
             msg = "Template Text Parser returned an error while parsing. Error: {err}"
             return {"errors": [msg.format(err=to_native(exc))]}
@@ -32,25 +32,72 @@ DOCUMENTATION = """
         - name: ANSIBLE_VALIDATE_JSONSCHEMA_DRAFT
         vars:
         - name: ansible_validate_jsonschema_draft
+      fail_fast:
+        description:
+        - Stop the validation at the first error found instead of collecting and sorting
+          every error of every criteria.
+        - When set, only the first error found is returned.
+        - This is set by default by the I(ansible.utils.validate) test plugin since it
+          only returns if the data is valid or not.
+        type: bool
+        default: false
+        env:
+        - name: ANSIBLE_VALIDATE_JSONSCHEMA_FAIL_FAST
+        vars:
+        - name: ansible_validate_jsonschema_fail_fast
+        version_added: 2.5.0
+      workers:
+        description:
+        - The number of threads or processes used to validate the data against
+          a list of criteria concurrently.
+        - With the default of C(1) each criteria is validated one after the other.
+        - The errors are returned in the order of the criteria either way.
+        type: int
+        default: 1
+        env:
+        - name: ANSIBLE_VALIDATE_JSONSCHEMA_WORKERS
+        vars:
+        - name: ansible_validate_jsonschema_workers
+        version_added: 2.5.0
+      worker_type:
+        description:
+        - The type of the workers used when I(workers) is more than C(1).
+        - Threads share the compiled validators, processes avoid the global interpreter
+          lock for large schemas but each compiles its own validators.
+        type: str
+        default: thread
+        choices:
+        - thread
+        - process
+        env:
+        - name: ANSIBLE_VALIDATE_JSONSCHEMA_WORKER_TYPE
+        vars:
+        - name: ansible_validate_jsonschema_worker_type
+        version_added: 2.5.0
     notes:
     - The value of I(data) option should be either a valid B(JSON) object or a B(JSON) string.
     - The value of I(criteria) should be B(list) of B(dict) or B(list) of B(strings) and each
       B(string) within the B(list) entry should be a valid B(dict) when read in python.
 """
 
+import hashlib
 import json
+from collections import deque
 
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.basic import missing_required_lib
 from ansible.errors import AnsibleError
 from ansible.module_utils.six import string_types
 
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.validate import (
     ValidateBase,
+    _merge_record_result,
 )
 
 from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
+    LruCache,
     to_list,
+    to_native_types,
 )
 
 # PY2 compatiblilty for JSONDecodeError
@@ -66,6 +113,158 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+try:
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    HAS_FUTURES = True
+except ImportError:
+    HAS_FUTURES = False
+
+
+VALIDATOR_CACHE_SIZE = 64
+
+# compiled validators, (draft, schema hash): validator
+# shared by the validate module, filter, lookup and test plugins
+VALIDATOR_CACHE = LruCache(maxsize=VALIDATOR_CACHE_SIZE)
+
+# draft: (validator class, format checker)
+DRAFT_VALIDATORS = {
+    "draft3": ("Draft3Validator", "draft3_format_checker"),
+    "draft4": ("Draft4Validator", "draft4_format_checker"),
+    "draft6": ("Draft6Validator", "draft6_format_checker"),
+    "draft7": ("Draft7Validator", "draft7_format_checker"),
+}
+
+
+def clear_validator_cache():
+    """Remove all the compiled validators"""
+    VALIDATOR_CACHE.clear()
+
+
+def validator_cache_info():
+    """Return the hits, misses and size of the compiled validator cache"""
+    return VALIDATOR_CACHE.info()
+
+
+def _compiled_validator(draft, criteria):
+    """Get the compiled validator for a schema, the validator is
+    compiled from a copy of the schema the first time it is seen
+
+    :param draft: The jsonschema draft, defaults to draft7
+    :type draft: str
+    :param criteria: The schema
+    :type criteria: dict
+    :return: The validator
+    """
+    # the key keeps the order of the schema keywords, it decides
+    # the order of the errors at the same data path
+    schema = json.dumps(criteria)
+    key = (draft, hashlib.sha256(to_bytes(schema)).hexdigest())
+    validator = VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator_cls, format_checker = DRAFT_VALIDATORS.get(
+            draft, DRAFT_VALIDATORS["draft7"]
+        )
+        validator = getattr(jsonschema, validator_cls)(
+            json.loads(schema),
+            format_checker=getattr(jsonschema, format_checker),
+        )
+        VALIDATOR_CACHE.set(key, validator)
+    return validator
+
+
+def _validation_error(validation_error):
+    """Convert a jsonschema ValidationError to the error dict returned
+
+    :param validation_error: The jsonschema error
+    :type validation_error: jsonschema.ValidationError
+    :return: The error
+    :rtype: dict
+    """
+    return {
+        "message": validation_error.message,
+        "data_path": to_path(validation_error.absolute_path),
+        "json_path": json_path(validation_error.absolute_path),
+        "schema_path": to_path(validation_error.relative_schema_path),
+        "relative_schema": validation_error.schema,
+        "expected": validation_error.validator_value,
+        "validator": validation_error.validator,
+        "found": validation_error.instance,
+    }
+
+
+def _error_message(error):
+    """Build the message line for an error dict"""
+    return "At '{schema_path}' {message}. ".format(
+        schema_path=error["schema_path"], message=error["message"]
+    )
+
+
+def _validate_criteria(draft, criteria, data, fail_fast=False):
+    """Validate data against one criteria, this is a module level
+    function so it can be run in a process pool
+
+    :param draft: The jsonschema draft
+    :type draft: str
+    :param criteria: The schema
+    :type criteria: dict
+    :param data: The data to validate
+    :param fail_fast: Only return the first error found, unsorted
+    :type fail_fast: bool
+    :return: The errors
+    :rtype: list
+    """
+    validator = _compiled_validator(draft, criteria)
+    if fail_fast:
+        validation_errors = []
+        for validation_error in validator.iter_errors(data):
+            validation_errors.append(validation_error)
+            break
+    else:
+        validation_errors = sorted(
+            validator.iter_errors(data), key=lambda e: e.path
+        )
+    return [
+        _validation_error(validation_error)
+        for validation_error in validation_errors
+        if isinstance(validation_error, jsonschema.ValidationError)
+    ]
+
+
+def _validate_record(
+    draft,
+    criteria,
+    data,
+    fail_fast=False,
+    validate_criteria=_validate_criteria,
+):
+    """Validate data against each criteria, this is a module level
+    function so it can be run in a process pool
+
+    :param draft: The jsonschema draft
+    :type draft: str
+    :param criteria: The schemas
+    :type criteria: list
+    :param data: The data to validate
+    :param fail_fast: Stop at the first error found
+    :type fail_fast: bool
+    :param validate_criteria: The module level function validating one criteria
+    :type validate_criteria: function
+    :return: The errors and msg, like the result of Validate.validate
+    :rtype: dict
+    """
+    errors = []
+    for schema in criteria:
+        errors.extend(validate_criteria(draft, schema, data, fail_fast))
+        if fail_fast and errors:
+            break
+    if not errors:
+        return {}
+    return {
+        "errors": errors,
+        "msg": "\n".join(_error_message(error) for error in errors),
+    }
+
 
 def to_path(fpath):
     return ".".join(str(index) for index in fpath)
@@ -82,6 +281,10 @@ def json_path(absolute_path):
 
 
 class Validate(ValidateBase):
+    # validates the data against one criteria, engines built on this one
+    # replace it with their own module level function
+    _criteria_validator = staticmethod(_validate_criteria)
+
     @staticmethod
     def _check_reqs():
         """Check the prerequisites are installed for jsonschema
@@ -100,9 +303,11 @@ class Validate(ValidateBase):
             if isinstance(self._data, string_types):
                 self._data = json.loads(self._data)
             else:
-                self._data = json.loads(json.dumps(self._data))
+                # data made of native types is validated as is, not copied,
+                # circular data raises a RuntimeError (RecursionError)
+                self._data = to_native_types(self._data)
 
-        except (TypeError, JSONDecodeError) as exe:
+        except (TypeError, JSONDecodeError, RuntimeError) as exe:
             msg = (
                 "'data' option value is invalid, value should a valid JSON."
                 " Failed to read with error '{err}'".format(
@@ -117,10 +322,10 @@ class Validate(ValidateBase):
                 if isinstance(self._criteria, string_types):
                     criteria.append(json.loads(item))
                 else:
-                    criteria.append(json.loads(json.dumps(item)))
+                    criteria.append(to_native_types(item))
 
             self._criteria = criteria
-        except (TypeError, JSONDecodeError) as exe:
+        except (TypeError, JSONDecodeError, RuntimeError) as exe:
             msg = (
                 "'criteria' option value is invalid, value should a valid JSON."
                 " Failed to read with error '{err}'".format(
@@ -156,62 +361,159 @@ class Validate(ValidateBase):
         error_messages = None
 
         draft = self._get_sub_plugin_options("draft")
+        fail_fast = self._get_sub_plugin_options("fail_fast")
         error_messages = []
 
-        for criteria in self._criteria:
-            if draft == "draft3":
-                validator = jsonschema.Draft3Validator(
-                    criteria, format_checker=jsonschema.draft3_format_checker
-                )
-            elif draft == "draft4":
-                validator = jsonschema.Draft4Validator(
-                    criteria, format_checker=jsonschema.draft4_format_checker
-                )
-            elif draft == "draft6":
-                validator = jsonschema.Draft6Validator(
-                    criteria, format_checker=jsonschema.draft6_format_checker
-                )
-            else:
-                validator = jsonschema.Draft7Validator(
-                    criteria, format_checker=jsonschema.draft7_format_checker
-                )
-
-            validation_errors = sorted(
-                validator.iter_errors(self._data), key=lambda e: e.path
-            )
-
-            if validation_errors:
+        for errors in self._criteria_errors(draft, fail_fast):
+            if errors:
                 if "errors" not in self._result:
                     self._result["errors"] = []
 
-                for validation_error in validation_errors:
-                    if isinstance(
-                        validation_error, jsonschema.ValidationError
-                    ):
-                        error = {
-                            "message": validation_error.message,
-                            "data_path": to_path(
-                                validation_error.absolute_path
-                            ),
-                            "json_path": json_path(
-                                validation_error.absolute_path
-                            ),
-                            "schema_path": to_path(
-                                validation_error.relative_schema_path
-                            ),
-                            "relative_schema": validation_error.schema,
-                            "expected": validation_error.validator_value,
-                            "validator": validation_error.validator,
-                            "found": validation_error.instance,
-                        }
-                        self._result["errors"].append(error)
-                        error_message = "At '{schema_path}' {message}. ".format(
-                            schema_path=error["schema_path"],
-                            message=error["message"],
-                        )
-                        error_messages.append(error_message)
+                for error in errors:
+                    self._result["errors"].append(error)
+                    error_messages.append(_error_message(error))
+                if fail_fast:
+                    break
+        self._debug(
+            "compiled validator cache {info}".format(
+                info=validator_cache_info()
+            )
+        )
         if error_messages:
             if "msg" not in self._result:
                 self._result["msg"] = "\n".join(error_messages)
             else:
                 self._result["msg"] += "\n".join(error_messages)
+
+    def _criteria_errors(self, draft, fail_fast):
+        """Validate the data against each criteria, in a pool of threads or
+        processes when more than one worker is requested
+
+        :param draft: The jsonschema draft
+        :type draft: str
+        :param fail_fast: Stop at the first error
+        :type fail_fast: bool
+        :return: The errors for each criteria, in the order of the criteria
+        :rtype: generator
+        """
+        workers = self._get_sub_plugin_options("workers") or 1
+        if workers < 2 or len(self._criteria) < 2:
+            for criteria in self._criteria:
+                yield self._criteria_validator(
+                    draft, criteria, self._data, fail_fast
+                )
+            return
+
+        if not HAS_FUTURES:
+            self._debug("concurrent.futures is not available, using 1 worker")
+            for criteria in self._criteria:
+                yield self._criteria_validator(
+                    draft, criteria, self._data, fail_fast
+                )
+            return
+
+        executor_cls = self._executor_cls()
+        self._debug(
+            "validating {count} criteria with {workers} {worker_type} workers".format(
+                count=len(self._criteria),
+                workers=workers,
+                worker_type=executor_cls.__name__,
+            )
+        )
+        with executor_cls(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._criteria_validator,
+                    draft,
+                    criteria,
+                    self._data,
+                    fail_fast,
+                )
+                for criteria in self._criteria
+            ]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                # nothing more is needed when the caller stops early
+                for future in futures:
+                    future.cancel()
+
+    def _executor_cls(self):
+        """The pool executor class for the worker_type option"""
+        if self._get_sub_plugin_options("worker_type") == "process":
+            return ProcessPoolExecutor
+        return ThreadPoolExecutor
+
+    def validate_records(self, records):
+        """Validate each record against the criteria, in a pool of threads or
+        processes when more than one worker is requested
+
+        A bounded number of records is handed to the pool at a time so the
+        memory used does not grow with the number of records
+
+        :param records: The records to validate
+        :type records: iterable
+        :return: The errors of all records, in the order of the records
+        :rtype: dict
+        """
+        workers = self._get_sub_plugin_options("workers") or 1
+        if workers < 2 or not HAS_FUTURES:
+            return super(Validate, self).validate_records(records)
+
+        self._check_reqs()
+        draft = self._get_sub_plugin_options("draft")
+        fail_fast = self._get_sub_plugin_options("fail_fast")
+        executor_cls = self._executor_cls()
+        self._debug(
+            "validating records with {workers} {worker_type} workers".format(
+                workers=workers, worker_type=executor_cls.__name__
+            )
+        )
+
+        result = {}
+        pending = deque()
+        with executor_cls(max_workers=workers) as executor:
+            try:
+                for index, record in enumerate(records):
+                    self._data = record
+                    try:
+                        self._check_args()
+                    except AnsibleError as exc:
+                        raise AnsibleError(
+                            "Record {index}: {err}".format(
+                                index=index,
+                                err=to_text(
+                                    exc, errors="surrogate_then_replace"
+                                ),
+                            )
+                        )
+                    pending.append(
+                        (
+                            index,
+                            executor.submit(
+                                _validate_record,
+                                draft,
+                                self._criteria,
+                                self._data,
+                                fail_fast,
+                                self._criteria_validator,
+                            ),
+                        )
+                    )
+                    while len(pending) >= workers * 2 or (
+                        pending and pending[0][1].done()
+                    ):
+                        index, future = pending.popleft()
+                        _merge_record_result(result, index, future.result())
+                        if fail_fast and result.get("errors"):
+                            return result
+                while pending:
+                    index, future = pending.popleft()
+                    _merge_record_result(result, index, future.result())
+                    if fail_fast and result.get("errors"):
+                        return result
+            finally:
+                for _index, future in pending:
+                    future.cancel()
+        return result
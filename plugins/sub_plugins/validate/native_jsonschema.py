@@ -0,0 +1,529 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+    author: Ansible Community
+    name: native_jsonschema
+    short_description: Define configurable options for native_jsonschema validate plugin
+    description:
+    - This sub plugin documentation provides the configurable options that can be passed
+      to the validate plugins when C(ansible.utils.native_jsonschema) is used as a value for
+      engine option.
+    - The schemas that only use the C(type), C(required), C(properties), C(items), C(enum),
+      C(pattern), C(minimum) and C(maximum) keywords are compiled to plain python checks
+      and validated without the jsonschema library.
+    - Any other schema is validated by the C(ansible.utils.jsonschema) engine.
+    - The errors returned are the same as the ones returned by the C(ansible.utils.jsonschema)
+      engine.
+    version_added: 2.5.0
+    options:
+      draft:
+        description:
+        - This option provides the jsonschema specification that should be used
+          for the validating the data. The I(criteria) option in the validate
+          plugin should follow the specification as mentioned by this option
+        - The schemas written for C(draft3) are always validated by the jsonschema library.
+        default: draft7
+        choices:
+        - draft3
+        - draft4
+        - draft6
+        - draft7
+        env:
+        - name: ANSIBLE_VALIDATE_NATIVE_JSONSCHEMA_DRAFT
+        vars:
+        - name: ansible_validate_native_jsonschema_draft
+      fail_fast:
+        description:
+        - Stop the validation at the first error found instead of collecting and sorting
+          every error of every criteria.
+        - When set, only the first error found is returned.
+        - This is set by default by the I(ansible.utils.validate) test plugin since it
+          only returns if the data is valid or not.
+        type: bool
+        default: false
+        env:
+        - name: ANSIBLE_VALIDATE_NATIVE_JSONSCHEMA_FAIL_FAST
+        vars:
+        - name: ansible_validate_native_jsonschema_fail_fast
+      workers:
+        description:
+        - The number of threads or processes used to validate the data against
+          a list of criteria concurrently.
+        - With the default of C(1) each criteria is validated one after the other.
+        - The errors are returned in the order of the criteria either way.
+        type: int
+        default: 1
+        env:
+        - name: ANSIBLE_VALIDATE_NATIVE_JSONSCHEMA_WORKERS
+        vars:
+        - name: ansible_validate_native_jsonschema_workers
+      worker_type:
+        description:
+        - The type of the workers used when I(workers) is more than C(1).
+        type: str
+        default: thread
+        choices:
+        - thread
+        - process
+        env:
+        - name: ANSIBLE_VALIDATE_NATIVE_JSONSCHEMA_WORKER_TYPE
+        vars:
+        - name: ansible_validate_native_jsonschema_worker_type
+    notes:
+    - The value of I(data) option should be either a valid B(JSON) object or a B(JSON) string.
+    - The value of I(criteria) should be B(list) of B(dict) or B(list) of B(strings) and each
+      B(string) within the B(list) entry should be a valid B(dict) when read in python.
+    - The jsonschema library is only required for the schemas that can not be compiled
+      to python checks.
+"""
+
+import hashlib
+import json
+import numbers
+import re
+
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils.basic import missing_required_lib
+from ansible.errors import AnsibleError
+from ansible.module_utils.six import string_types
+
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
+    LruCache,
+)
+from ansible_collections.ansible.utils.plugins.sub_plugins.validate.jsonschema import (
+    HAS_JSONSCHEMA,
+    Validate as JsonschemaValidate,
+    _validate_criteria as _jsonschema_validate_criteria,
+    json_path,
+    to_path,
+)
+
+
+CHECK_CACHE_SIZE = 64
+
+# compiled checks, (draft, schema hash): (check,)
+# the check is None when the schema needs the jsonschema library
+CHECK_CACHE = LruCache(maxsize=CHECK_CACHE_SIZE)
+
+# the drafts the checks follow, draft3 has a different type and
+# required keywords and always uses the jsonschema library
+NATIVE_DRAFTS = ("draft4", "draft6", "draft7")
+
+# keywords that do not change the result of the validation
+# when there is no $ref in the schema
+ANNOTATIONS = frozenset(
+    (
+        "$comment",
+        "$id",
+        "$schema",
+        "default",
+        "definitions",
+        "description",
+        "examples",
+        "id",
+        "title",
+    )
+)
+
+
+class _Unsupported(Exception):
+    """The schema can not be compiled to python checks"""
+
+
+def clear_check_cache():
+    """Remove all the compiled checks"""
+    CHECK_CACHE.clear()
+
+
+def check_cache_info():
+    """Return the hits, misses and size of the compiled check cache"""
+    return CHECK_CACHE.info()
+
+
+def _is_number(instance):
+    return isinstance(instance, numbers.Number) and not isinstance(
+        instance, bool
+    )
+
+
+def _is_integer(instance):
+    return isinstance(instance, int) and not isinstance(instance, bool)
+
+
+def _is_integer_or_integral_float(instance):
+    if isinstance(instance, float):
+        return instance.is_integer()
+    return _is_integer(instance)
+
+
+# type name: check, the same as the jsonschema type checkers
+TYPE_CHECKS = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": _is_integer_or_integral_float,
+    "null": lambda instance: instance is None,
+    "number": _is_number,
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, string_types),
+}
+
+# draft4 does not consider 1.0 an integer
+DRAFT4_TYPE_CHECKS = dict(TYPE_CHECKS, integer=_is_integer)
+
+
+def _unbool(element, true=object(), false=object()):
+    """Keep True and False apart from 1 and 0 when comparing"""
+    if element is True:
+        return true
+    if element is False:
+        return false
+    return element
+
+
+def _equal(one, two):
+    """Compare two values the way the jsonschema enum keyword does"""
+    if isinstance(one, string_types) or isinstance(two, string_types):
+        return one == two
+    if isinstance(one, dict) and isinstance(two, dict):
+        return len(one) == len(two) and all(
+            key in two and _equal(value, two[key])
+            for key, value in one.items()
+        )
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(
+            _equal(i, j) for i, j in zip(one, two)
+        )
+    return _unbool(one) == _unbool(two)
+
+
+# Each keyword builder returns a check(instance, path, errors), the checks
+# append (validator, message, path, schema_path, schema, expected, instance)
+# to errors
+
+
+def _type(value, schema, schema_path, draft):
+    types = [value] if isinstance(value, string_types) else value
+    type_checks = DRAFT4_TYPE_CHECKS if draft == "draft4" else TYPE_CHECKS
+    if not isinstance(types, list) or not all(
+        isinstance(name, string_types) and name in type_checks
+        for name in types
+    ):
+        raise _Unsupported("type")
+    checks = [type_checks[name] for name in types]
+    reprs = ", ".join(repr(name) for name in types)
+
+    def check(instance, path, errors):
+        for type_check in checks:
+            if type_check(instance):
+                return
+        errors.append(
+            (
+                "type",
+                "{0!r} is not of type {1}".format(instance, reprs),
+                path,
+                schema_path,
+                schema,
+                value,
+                instance,
+            )
+        )
+
+    return check
+
+
+def _required(value, schema, schema_path, draft):
+    if not isinstance(value, list):
+        raise _Unsupported("required")
+
+    def check(instance, path, errors):
+        if not isinstance(instance, dict):
+            return
+        for name in value:
+            if name not in instance:
+                errors.append(
+                    (
+                        "required",
+                        "{0!r} is a required property".format(name),
+                        path,
+                        schema_path,
+                        schema,
+                        value,
+                        instance,
+                    )
+                )
+
+    return check
+
+
+def _enum(value, schema, schema_path, draft):
+    if not isinstance(value, list):
+        raise _Unsupported("enum")
+
+    def check(instance, path, errors):
+        for each in value:
+            if _equal(each, instance):
+                return
+        errors.append(
+            (
+                "enum",
+                "{0!r} is not one of {1!r}".format(instance, value),
+                path,
+                schema_path,
+                schema,
+                value,
+                instance,
+            )
+        )
+
+    return check
+
+
+def _pattern(value, schema, schema_path, draft):
+    if not isinstance(value, string_types):
+        raise _Unsupported("pattern")
+    try:
+        regex = re.compile(value)
+    except re.error:
+        raise _Unsupported("pattern")
+
+    def check(instance, path, errors):
+        if isinstance(instance, string_types) and not regex.search(instance):
+            errors.append(
+                (
+                    "pattern",
+                    "{0!r} does not match {1!r}".format(instance, value),
+                    path,
+                    schema_path,
+                    schema,
+                    value,
+                    instance,
+                )
+            )
+
+    return check
+
+
+def _minimum(value, schema, schema_path, draft):
+    if not _is_number(value):
+        raise _Unsupported("minimum")
+
+    def check(instance, path, errors):
+        if _is_number(instance) and instance < value:
+            errors.append(
+                (
+                    "minimum",
+                    "{0!r} is less than the minimum of {1!r}".format(
+                        instance, value
+                    ),
+                    path,
+                    schema_path,
+                    schema,
+                    value,
+                    instance,
+                )
+            )
+
+    return check
+
+
+def _maximum(value, schema, schema_path, draft):
+    if not _is_number(value):
+        raise _Unsupported("maximum")
+
+    def check(instance, path, errors):
+        if _is_number(instance) and instance > value:
+            errors.append(
+                (
+                    "maximum",
+                    "{0!r} is greater than the maximum of {1!r}".format(
+                        instance, value
+                    ),
+                    path,
+                    schema_path,
+                    schema,
+                    value,
+                    instance,
+                )
+            )
+
+    return check
+
+
+def _properties(value, schema, schema_path, draft):
+    if not isinstance(value, dict):
+        raise _Unsupported("properties")
+    properties = [
+        (name, _compile(subschema, schema_path + (name,), draft))
+        for name, subschema in value.items()
+    ]
+
+    def check(instance, path, errors):
+        if not isinstance(instance, dict):
+            return
+        for name, property_check in properties:
+            if name in instance:
+                property_check(instance[name], path + (name,), errors)
+
+    return check
+
+
+def _items(value, schema, schema_path, draft):
+    # a list of schemas validates each position differently
+    if not isinstance(value, dict):
+        raise _Unsupported("items")
+    item_check = _compile(value, schema_path, draft)
+
+    def check(instance, path, errors):
+        if not isinstance(instance, list):
+            return
+        for index, item in enumerate(instance):
+            item_check(item, path + (index,), errors)
+
+    return check
+
+
+# keyword: builder
+KEYWORDS = {
+    "enum": _enum,
+    "items": _items,
+    "maximum": _maximum,
+    "minimum": _minimum,
+    "pattern": _pattern,
+    "properties": _properties,
+    "required": _required,
+    "type": _type,
+}
+
+
+def _compile(schema, schema_path, draft):
+    """Compile a schema to a single check, the keywords are checked in
+    the order of the schema like jsonschema does so the errors come in
+    the same order
+
+    :param schema: The schema
+    :type schema: dict
+    :param schema_path: The path of the schema in the criteria
+    :type schema_path: tuple
+    :param draft: The jsonschema draft
+    :type draft: str
+    :raises _Unsupported: When the schema needs the jsonschema library
+    :return: The check
+    """
+    if not isinstance(schema, dict):
+        raise _Unsupported("boolean schema")
+    checks = []
+    for keyword, value in schema.items():
+        if keyword in ANNOTATIONS:
+            continue
+        builder = KEYWORDS.get(keyword)
+        if builder is None:
+            raise _Unsupported(keyword)
+        checks.append(builder(value, schema, schema_path + (keyword,), draft))
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(instance, path, errors):
+        for keyword_check in checks:
+            keyword_check(instance, path, errors)
+
+    return check
+
+
+def _compiled_check(draft, criteria):
+    """Get the compiled check for a schema, the check is compiled
+    from a copy of the schema the first time it is seen
+
+    :param draft: The jsonschema draft, defaults to draft7
+    :type draft: str
+    :param criteria: The schema
+    :type criteria: dict
+    :return: The check or None when the schema needs the jsonschema library
+    """
+    # the key keeps the order of the schema keywords, it decides
+    # the order of the errors at the same data path
+    schema = json.dumps(criteria)
+    key = (draft, hashlib.sha256(to_bytes(schema)).hexdigest())
+    cached = CHECK_CACHE.get(key)
+    if cached is None:
+        check = None
+        if (draft or "draft7") in NATIVE_DRAFTS:
+            try:
+                # the keywords are checked in the order of the schema,
+                # as the jsonschema engine does
+                check = _compile(json.loads(schema), (), draft or "draft7")
+            except _Unsupported:
+                pass
+        cached = (check,)
+        CHECK_CACHE.set(key, cached)
+    return cached[0]
+
+
+def _error(error):
+    """Convert a check error to the error dict returned
+
+    :param error: The error appended by a check
+    :type error: tuple
+    :return: The error
+    :rtype: dict
+    """
+    validator, message, path, schema_path, schema, expected, found = error
+    return {
+        "message": message,
+        "data_path": to_path(path),
+        "json_path": json_path(path),
+        "schema_path": to_path(schema_path),
+        "relative_schema": schema,
+        "expected": expected,
+        "validator": validator,
+        "found": found,
+    }
+
+
+def _validate_criteria(draft, criteria, data, fail_fast=False):
+    """Validate data against one criteria with the compiled check,
+    or with the jsonschema library when the schema can not be compiled,
+    this is a module level function so it can be run in a process pool
+
+    :param draft: The jsonschema draft
+    :type draft: str
+    :param criteria: The schema
+    :type criteria: dict
+    :param data: The data to validate
+    :param fail_fast: Only return the first error found, unsorted
+    :type fail_fast: bool
+    :return: The errors
+    :rtype: list
+    """
+    check = _compiled_check(draft, criteria)
+    if check is None:
+        if not HAS_JSONSCHEMA:
+            raise AnsibleError(missing_required_lib("jsonschema"))
+        return _jsonschema_validate_criteria(draft, criteria, data, fail_fast)
+
+    errors = []
+    check(data, (), errors)
+    if fail_fast:
+        errors = errors[:1]
+    else:
+        errors.sort(key=lambda e: e[2])
+    return [_error(error) for error in errors]
+
+
+class Validate(JsonschemaValidate):
+    _criteria_validator = staticmethod(_validate_criteria)
+
+    @staticmethod
+    def _check_reqs():
+        """The jsonschema library is only checked for when a schema
+        can not be compiled to python checks
+
+        :return None: Always
+        """
@@ -8,10 +8,8 @@ Test plugin file for netaddr tests: in_any_network
 """
 
 from __future__ import absolute_import, division, print_function
-from ansible_collections.ansible.utils.plugins.test.in_network import (
-    _in_network,
-)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
+    _network_index,
     _validate_args,
 )
 
@@ -97,10 +95,7 @@ def _in_any_network(ip, networks):
     params = {"ip": ip, "networks": networks}
     _validate_args("in_any_network", DOCUMENTATION, params)
 
-    bools = [_in_network(ip, network) for network in networks]
-    if True in bools:
-        return True
-    return False
+    return _network_index(networks).any_match(ip)
 
 
 class TestModule(object):
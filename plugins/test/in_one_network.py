@@ -8,10 +8,8 @@ Test plugin file for netaddr tests: in_one_network
 """
 
 from __future__ import absolute_import, division, print_function
-from ansible_collections.ansible.utils.plugins.test.in_network import (
-    _in_network,
-)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
+    _network_index,
     _validate_args,
 )
 
@@ -96,10 +94,7 @@ def _in_one_network(ip, networks):
     params = {"ip": ip, "networks": networks}
     _validate_args("in_one_network", DOCUMENTATION, params)
 
-    bools = [_in_network(ip, network) for network in networks]
-    if bools.count(True) == 1:
-        return True
-    return False
+    return _network_index(networks).match_count(ip) == 1
 
 
 class TestModule(object):
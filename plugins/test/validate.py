@@ -52,6 +52,9 @@ DOCUMENTATION = """
       or set as environment variables.
     - The precedence the validate plugin configurable option is the variable passed within test plugin
       as C(key=value) pairs followed by task variables followed by environment variables.
+    - The validate plugin configuration option C(fail_fast) is set to C(True) by default so the
+      validation stops at the first error, pass C(fail_fast=False) or set it as an environment
+      variable to override it.
 """
 
 EXAMPLES = r"""
@@ -114,11 +117,14 @@ def validate(*args, **kwargs):
             )
         )
 
+    # only pass or fail is returned, stop at the first error unless
+    # fail_fast is passed or set as an environment variable
     validator_engine, validator_result = _load_validator(
         engine=updated_params["engine"],
         data=updated_params["data"],
         criteria=updated_params["criteria"],
         kwargs=kwargs,
+        option_defaults={"fail_fast": True},
     )
     if validator_result.get("failed"):
         raise AnsibleError(
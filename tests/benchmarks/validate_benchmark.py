@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmark the validate module, filter, lookup and test plugins
+
+The data is a synthetic list of interfaces of increasing size, validated
+with schemas of increasing complexity, for each jsonschema draft.
+
+For each combination this reports:
+- the time spent in each phase of a validation, the argspec check,
+  _load_validator, the _check_args normalization, the validator
+  construction with an empty cache and the iteration of the errors
+- the time and the peak memory of a validation through the action,
+  filter, lookup and test plugins, with empty caches (cold) and the best
+  of the following runs (warm)
+
+The collection has to be in a ansible_collections/ansible/utils directory,
+run from the root of the collection with:
+
+    python tests/benchmarks/validate_benchmark.py
+    python tests/benchmarks/validate_benchmark.py --sizes 1KB,1MB \\
+        --drafts draft7 --complexity simple --json results.json
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+COLLECTION_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+if COLLECTION_ROOT.split(os.sep)[-3:] == [
+    "ansible_collections",
+    "ansible",
+    "utils",
+]:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(COLLECTION_ROOT)))
+
+try:
+    from unittest.mock import MagicMock  # pylint:disable=syntax-error
+except ImportError:
+    from mock import MagicMock
+
+from importlib import import_module
+
+from ansible.playbook.task import Task
+from ansible.template import Templar
+
+from ansible_collections.ansible.utils.plugins.action.validate import (
+    ActionModule,
+)
+from ansible_collections.ansible.utils.plugins.filter.validate import (
+    validate as validate_filter,
+)
+from ansible_collections.ansible.utils.plugins.lookup.validate import (
+    LookupModule,
+)
+from ansible_collections.ansible.utils.plugins.modules import (
+    validate as validate_module,
+)
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    check_argspec,
+    clear_argspec_cache,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import (
+    validate as validate_base,
+)
+from ansible_collections.ansible.utils.plugins.test.validate import (
+    validate as validate_test,
+)
+
+SIZES = "1KB,100KB,1MB,10MB,50MB"
+
+DRAFTS = "draft3,draft4,draft6,draft7"
+
+ENGINES = "ansible.utils.jsonschema,ansible.utils.native_jsonschema"
+
+# engine: the module level function compiling one criteria
+ENGINE_COMPILERS = {
+    "ansible.utils.jsonschema": "_compiled_validator",
+    "ansible.utils.native_jsonschema": "_compiled_check",
+}
+
+# engine: the functions emptying the compiled criteria caches
+ENGINE_CACHES = {
+    "ansible.utils.jsonschema": ["clear_validator_cache"],
+    "ansible.utils.native_jsonschema": ["clear_check_cache"],
+}
+
+UNITS = {"KB": 1024, "MB": 1024 * 1024}
+
+INTERFACE_ITEMS = {
+    "type": "object",
+    "properties": {"mtu": {"type": "integer", "maximum": 9216}},
+}
+
+INTERFACE_ITEMS_MEDIUM = {
+    "type": "object",
+    "required": ["name", "enabled", "mtu"],
+    "properties": {
+        "name": {"type": "string", "pattern": "^(Gigabit|TenGig)Ethernet"},
+        "description": {"type": ["string", "null"]},
+        "enabled": {"type": "boolean"},
+        "duplex_mode": {"enum": ["full", "half", "auto"]},
+        "mtu": {"type": "integer", "minimum": 68, "maximum": 9216},
+        "vlans": {
+            "type": "array",
+            "items": {"type": "integer", "minimum": 1, "maximum": 4094},
+        },
+        "counters": {
+            "type": "object",
+            "properties": {
+                "in_crc_errors": {"type": "integer", "maximum": 0},
+                "in_errors": {"type": "integer", "minimum": 0},
+                "rate": {
+                    "type": "object",
+                    "properties": {
+                        "in_rate": {"type": "number", "minimum": 0},
+                        "out_rate": {"type": "number", "minimum": 0},
+                    },
+                },
+            },
+        },
+    },
+}
+
+INTERFACE_ITEMS_COMPLEX = {
+    "type": "object",
+    "required": ["name", "enabled", "mtu"],
+    "additionalProperties": False,
+    "properties": dict(
+        INTERFACE_ITEMS_MEDIUM["properties"],
+        address={"type": "string", "format": "ipv4"},
+        vlans={
+            "type": "array",
+            "uniqueItems": True,
+            "items": {"type": "integer", "minimum": 1, "maximum": 4094},
+        },
+        counters={
+            "type": "object",
+            "patternProperties": {"^in_": {"$ref": "#/definitions/counter"}},
+            "properties": {
+                "in_crc_errors": {"type": "integer", "maximum": 0},
+                "rate": {
+                    "type": "object",
+                    "additionalProperties": {"$ref": "#/definitions/rate"},
+                },
+            },
+        },
+    ),
+}
+
+
+DEFINITIONS = {
+    "counter": {"type": "integer", "minimum": 0},
+    "rate": {"type": "number", "minimum": 0},
+}
+
+
+def _interfaces_schema(items, definitions=None):
+    schema = {
+        "type": "object",
+        "required": ["interfaces"],
+        "properties": {"interfaces": {"type": "array", "items": items}},
+    }
+    if definitions:
+        schema["definitions"] = definitions
+    return schema
+
+
+# complexity: criteria
+COMPLEXITY = {
+    "simple": [_interfaces_schema(INTERFACE_ITEMS)],
+    "medium": [_interfaces_schema(INTERFACE_ITEMS_MEDIUM)],
+    "complex": [
+        _interfaces_schema(INTERFACE_ITEMS_MEDIUM),
+        _interfaces_schema(INTERFACE_ITEMS_COMPLEX, DEFINITIONS),
+    ],
+}
+
+
+def _size(value):
+    """Read a size like 100KB or 50MB in bytes"""
+    value = value.strip().upper()
+    for unit, factor in UNITS.items():
+        if value.endswith(unit):
+            return int(float(value[: -len(unit)]) * factor)
+    return int(value)
+
+
+def _interface(index):
+    """A synthetic interface, about one in a hundred is not valid"""
+    return {
+        "name": "GigabitEthernet0/0/{slot}/{port}".format(
+            slot=index // 48, port=index % 48
+        ),
+        "description": "configured using Ansible" if index % 3 else None,
+        "enabled": bool(index % 2),
+        "duplex_mode": "full",
+        "mtu": 9300 if index % 100 == 99 else 1514,
+        "address": "10.{0}.{1}.1".format(index // 256 % 256, index % 256),
+        "vlans": [10, 20, 30 + index % 100],
+        "counters": {
+            "in_crc_errors": 1 if index % 100 == 49 else 0,
+            "in_errors": index % 7,
+            "rate": {"in_rate": index % 1000, "out_rate": 0.5},
+        },
+    }
+
+
+def make_data(size):
+    """Build the data, about size bytes once serialized to json"""
+    item_size = len(json.dumps(_interface(0))) + 2
+    count = max(1, size // item_size)
+    return {"interfaces": [_interface(index) for index in range(count)]}
+
+
+def clear_caches(engine):
+    """Empty the caches so the next validation is a cold one"""
+    clear_argspec_cache()
+    validate_base._SUB_PLUGIN_OPTIONS.clear()
+    module = _engine_module(engine)
+    for name in ENGINE_CACHES.get(engine, []):
+        getattr(module, name)()
+
+
+def _engine_module(engine):
+    return import_module(
+        "ansible_collections.{0}.{1}.plugins.sub_plugins.validate.{2}".format(
+            *engine.split(".")
+        )
+    )
+
+
+def _option_var(engine, name):
+    return "ansible_validate_{plugin}_{name}".format(
+        plugin=engine.split(".")[-1], name=name
+    )
+
+
+def run_action(engine, draft, data, criteria):
+    task = MagicMock(Task)
+    task.args = {"engine": engine, "data": data, "criteria": criteria}
+    play_context = MagicMock()
+    play_context.check_mode = False
+    plugin = ActionModule(
+        task=task,
+        connection=MagicMock(),
+        play_context=play_context,
+        loader={},
+        templar=Templar(loader={}),
+        shared_loader_obj=None,
+    )
+    return plugin.run(task_vars={_option_var(engine, "draft"): draft})
+
+
+def run_filter(engine, draft, data, criteria):
+    return validate_filter(data, criteria, engine=engine, draft=draft)
+
+
+def run_lookup(engine, draft, data, criteria):
+    return LookupModule().run(
+        [data, criteria], variables={}, engine=engine, draft=draft
+    )
+
+
+def run_test(engine, draft, data, criteria):
+    return validate_test(data, criteria=criteria, engine=engine, draft=draft)
+
+
+ENTRY_POINTS = [
+    ("action", run_action),
+    ("filter", run_filter),
+    ("lookup", run_lookup),
+    ("test", run_test),
+]
+
+
+def _timed(func, *args):
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def _peak_memory(func, *args):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def phases(engine, draft, data, criteria):
+    """Time each phase of one validation, from empty caches
+
+    :return: phase: seconds
+    :rtype: dict
+    """
+    clear_caches(engine)
+    timings = {}
+
+    timings["argspec"], _result = _timed(
+        lambda: check_argspec(
+            validate_module.DOCUMENTATION,
+            "validate module",
+            engine=engine,
+            data=data,
+            criteria=criteria,
+        )
+    )
+    timings["load_validator"], (validator, _result) = _timed(
+        lambda: validate_base._load_validator(
+            engine=engine,
+            data=data,
+            criteria=criteria,
+            kwargs={"draft": draft},
+        )
+    )
+    timings["check_args"], _result = _timed(validator._check_args)
+
+    compiler = getattr(_engine_module(engine), ENGINE_COMPILERS[engine])
+    timings["construction"], _result = _timed(
+        lambda: [compiler(draft, each) for each in validator._criteria]
+    )
+    fail_fast = validator._get_sub_plugin_options("fail_fast")
+    timings["iteration"], _result = _timed(
+        lambda: list(validator._criteria_errors(draft, fail_fast))
+    )
+    return timings
+
+
+def entry_point(func, engine, draft, data, criteria, repeat):
+    """Time a validation through a plugin, once from empty caches
+    and the best of repeat runs after that, then measure its peak memory
+
+    :return: cold and warm seconds, peak memory in bytes
+    :rtype: dict
+    """
+    clear_caches(engine)
+    cold, _result = _timed(func, engine, draft, data, criteria)
+    warm = min(
+        _timed(func, engine, draft, data, criteria)[0] for _i in range(repeat)
+    )
+    peak = _peak_memory(func, engine, draft, data, criteria)
+    return {"cold": cold, "warm": warm, "peak_memory": peak}
+
+
+def _ms(seconds):
+    return "{0:10.2f}ms".format(seconds * 1000)
+
+
+def _mb(size):
+    return "{0:8.2f}MB".format(size / UNITS["MB"])
+
+
+def run(args):
+    results = []
+    for size_name in args.sizes.split(","):
+        data = make_data(_size(size_name))
+        for complexity in args.complexity.split(","):
+            criteria = COMPLEXITY[complexity]
+            for engine in args.engines.split(","):
+                for draft in args.drafts.split(","):
+                    result = {
+                        "size": size_name,
+                        "items": len(data["interfaces"]),
+                        "complexity": complexity,
+                        "engine": engine,
+                        "draft": draft,
+                        "phases": phases(engine, draft, data, criteria),
+                        "entry_points": {},
+                    }
+                    for name, func in ENTRY_POINTS:
+                        result["entry_points"][name] = entry_point(
+                            func, engine, draft, data, criteria, args.repeat
+                        )
+                    results.append(result)
+                    report(result)
+    return results
+
+
+def report(result):
+    print(
+        "{size} ({items} interfaces) {complexity} {engine} {draft}".format(
+            **result
+        )
+    )
+    print(
+        "  phases: "
+        + " ".join(
+            "{0}={1}".format(name, _ms(seconds).strip())
+            for name, seconds in result["phases"].items()
+        )
+    )
+    for name, timings in result["entry_points"].items():
+        print(
+            "  {name:8} cold {cold} warm {warm} peak {peak}".format(
+                name=name,
+                cold=_ms(timings["cold"]),
+                warm=_ms(timings["warm"]),
+                peak=_mb(timings["peak_memory"]),
+            )
+        )
+    sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the ansible.utils.validate plugins"
+    )
+    parser.add_argument(
+        "--sizes",
+        default=SIZES,
+        help="comma separated data sizes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--complexity",
+        default=",".join(COMPLEXITY),
+        help="comma separated schema complexity (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--drafts",
+        default=DRAFTS,
+        help="comma separated jsonschema drafts (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--engines",
+        default=ENGINES,
+        help="comma separated validate engines (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="warm runs for each entry point (default: %(default)s)",
+    )
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.json:
+        with open(args.json, "w") as fhand:
+            json.dump(results, fhand, indent=2)
+
+
+if __name__ == "__main__":
+    main()
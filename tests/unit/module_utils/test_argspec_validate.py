@@ -11,6 +11,9 @@ __metaclass__ = type
 import unittest
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     AnsibleArgSpecValidator,
+    ARGSPEC_CACHE,
+    argspec_cache_info,
+    clear_argspec_cache,
 )
 from .fixtures.docstring import DOCUMENTATION
 
@@ -158,3 +161,69 @@ class TestSortList(unittest.TestCase):
         valid, errors, _updated_data = aav.validate()
         self.assertFalse(valid)
         self.assertIn("Invalid schema. Invalid keys found: not_valid", errors)
+
+    def test_cache_hit(self):
+        clear_argspec_cache()
+        for _i in range(3):
+            aav = AnsibleArgSpecValidator(
+                data={"param_str": "string"},
+                schema=DOCUMENTATION,
+                schema_format="doc",
+                schema_conditionals={},
+                name="test_action",
+            )
+            valid, _errors, _updated_data = aav.validate()
+            self.assertTrue(valid)
+        info = argspec_cache_info()
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["hits"], 2)
+        self.assertEqual(info["size"], 1)
+
+    def test_cache_keyed_by_conditionals(self):
+        clear_argspec_cache()
+        aav = AnsibleArgSpecValidator(
+            data={"param_str": "string"},
+            schema=DOCUMENTATION,
+            schema_format="doc",
+            schema_conditionals={},
+            name="test_action",
+        )
+        valid, _errors, _updated_data = aav.validate()
+        self.assertTrue(valid)
+        aav = AnsibleArgSpecValidator(
+            data={"param_str": "string"},
+            schema=DOCUMENTATION,
+            schema_format="doc",
+            schema_conditionals={
+                "required_together": [["param_str", "param_bool"]]
+            },
+            name="test_action",
+        )
+        valid, errors, _updated_data = aav.validate()
+        self.assertFalse(valid)
+        self.assertIn(
+            "parameters are required together: param_str, param_bool", errors
+        )
+        self.assertEqual(argspec_cache_info()["size"], 2)
+
+    def test_cache_bounded(self):
+        clear_argspec_cache()
+        maxsize = ARGSPEC_CACHE.maxsize
+        ARGSPEC_CACHE.maxsize = 2
+        try:
+            for idx in range(4):
+                aav = AnsibleArgSpecValidator(
+                    data={"param_str": "string"},
+                    schema=DOCUMENTATION + "\n# {idx}".format(idx=idx),
+                    schema_format="doc",
+                    name="test_action",
+                )
+                aav.validate()
+            self.assertEqual(argspec_cache_info()["size"], 2)
+        finally:
+            ARGSPEC_CACHE.maxsize = maxsize
+            clear_argspec_cache()
+        self.assertEqual(
+            argspec_cache_info(),
+            {"hits": 0, "misses": 0, "size": 0, "maxsize": maxsize},
+        )
@@ -10,12 +10,29 @@ __metaclass__ = type
 
 
 import unittest
+from ansible_collections.ansible.utils.plugins.module_utils.common import (
+    index_of as index_of_module,
+)
 from ansible_collections.ansible.utils.plugins.module_utils.common.index_of import (
+    index_by,
     index_of,
 )
+from ansible_collections.ansible.utils.tests.unit.compat.mock import (
+    MagicMock,
+    patch,
+)
 from ansible.template import Templar
 
 
+def _j2_result(entry, plan, tests):
+    """Run a test plan with the jinja test only"""
+    plan = index_of_module._test_plan(plan[0], plan[1], tests)[:-1] + (None,)
+    try:
+        return index_of_module._run_plan(entry, plan)
+    except Exception as exc:
+        return str(exc)
+
+
 class TestIndexOfFilter(unittest.TestCase):
     def setUp(self):
         self._tests = Templar(loader=None).environment.tests
@@ -118,3 +135,312 @@ class TestIndexOfFilter(unittest.TestCase):
             obj, test, value, key, answer = entry
             result = index_of(obj, test, value, key, tests=self._tests)
             self.assertEqual(result, answer)
+
+    def test_error_message_lazy(self):
+        """Check the error message is only built when a test fails"""
+        obj = [{"a": {"b": 1}}, {"a": {"b": 2}}]
+        with patch.object(
+            index_of_module,
+            "_to_well_known_type",
+            wraps=index_of_module._to_well_known_type,
+        ) as mock_convert:
+            result = index_of(obj, "==", {"b": 2}, "a", tests=self._tests)
+            self.assertEqual(result, 1)
+            self.assertEqual(mock_convert.call_count, 0)
+
+            with self.assertRaises(Exception) as exc:
+                index_of(obj, "<", "b", "a", tests=self._tests)
+            self.assertEqual(mock_convert.call_count, 2)
+        self.assertIn(
+            "Error encountered when testing value '{'b': 1}' (type=dict)"
+            " against 'b' (type=dict) with '<'.",
+            str(exc.exception),
+        )
+
+    def test_test_resolved_once(self):
+        """Check the test is looked up once for all the entries"""
+        tests = dict(self._tests)
+        with patch.object(
+            index_of_module, "_test_plan", wraps=index_of_module._test_plan
+        ) as mock_plan:
+            result = index_of([1, 2, 3, 4], "!in", 3, tests=tests)
+        self.assertEqual(result, [0, 1, 3])
+        self.assertEqual(mock_plan.call_count, 1)
+
+    def test_test_resolved_lazily(self):
+        """Check the jinja test is only looked up when it is needed"""
+        tests = MagicMock(wraps=self._tests)
+        self.assertEqual(index_of([1, 2, 3], "==", 3, tests=tests), 2)
+        self.assertEqual(index_of([], "even", tests=tests), [])
+        self.assertEqual(tests.get.call_count, 0)
+        self.assertEqual(index_of([1, 2, 3, 4], "even", tests=tests), [1, 3])
+        self.assertEqual(tests.get.call_count, 1)
+
+    def test_native_same_as_jinja(self):
+        """Check the native tests return the same as the jinja tests"""
+        objs = [1, 2.5, "10", True, None, "Eth1", "eth10", 10]
+        cases = [
+            ("eq", 1),
+            ("!=", "10"),
+            (">", 2),
+            ("ge", 2.5),
+            ("lessthan", 10),
+            ("in", [1, "10"]),
+            ("not in", "eth10"),
+            ("regex", "^1"),
+            ("search", "th1"),
+            ("match", "(?i)eth"),
+            ("!match", "E"),
+        ]
+        for test, value in cases:
+            plan = index_of_module._test_plan(test, value, self._tests)
+            self.assertIsNotNone(plan[-1])
+            for entry in objs:
+                expected = _j2_result(entry, plan, self._tests)
+                try:
+                    result = index_of_module._run_plan(entry, plan)
+                except Exception as exc:
+                    result = str(exc)
+                self.assertEqual(bool(result), bool(expected))
+                if isinstance(expected, str):
+                    self.assertEqual(result, expected)
+
+    def test_native_skips_jinja(self):
+        """Check native tests do not call the jinja test"""
+        tests = dict(self._tests)
+        with patch.dict(tests, {"eq": None, "regex": None}):
+            self.assertEqual(index_of([1, 2], "eq", 2, tests=tests), 1)
+            self.assertEqual(
+                index_of(["a", "b"], "regex", "b", tests=tests), 1
+            )
+        # unknown tests and tests without a value use jinja
+        self.assertEqual(index_of([1, 2, 3], "odd", tests=tests), [0, 2])
+        self.assertEqual(index_of([2, 3], "divisibleby", 3, tests=tests), 1)
+
+    def test_clauses(self):
+        """Check the entries matching all the clauses are found"""
+        obj = [
+            {"name": "Eth1", "enabled": True, "mtu": 9216},
+            {"name": "Eth2", "enabled": False, "mtu": 9216},
+            {"name": "lo0", "enabled": True, "mtu": 9216},
+            {"name": "Eth3", "enabled": True, "mtu": 1500},
+            {"name": "Eth4", "enabled": True},
+        ]
+        clauses = [
+            {"key": "enabled", "test": "true"},
+            {"key": "mtu", "test": ">", "value": 9000},
+            {"key": "name", "test": "match", "value": "^Eth"},
+        ]
+        self.assertEqual(index_of(obj, clauses=clauses, tests=self._tests), 0)
+        self.assertEqual(
+            index_of(obj, clauses=clauses[:1], tests=self._tests), [0, 2, 3, 4]
+        )
+        for clause in clauses:
+            expected = index_of(
+                obj,
+                clause["test"],
+                clause.get("value"),
+                clause["key"],
+                wantlist=True,
+                tests=self._tests,
+            )
+            result = index_of(
+                obj, clauses=[clause], wantlist=True, tests=self._tests
+            )
+            self.assertEqual(result, expected)
+        clauses = [{"test": "in", "value": [1, 3]}, {"test": "odd"}]
+        self.assertEqual(
+            index_of([1, 2, 3], clauses=clauses, tests=self._tests), [0, 2]
+        )
+
+    def test_clauses_fail(self):
+        """Check the clauses fail as a single test does"""
+        obj = [{"a": 1, "b": 2}, {"a": 2}, {"c": 3}]
+        clauses = [
+            {"key": "a", "test": "eq", "value": 2},
+            {"key": "b", "test": "eq", "value": 1},
+        ]
+        with self.assertRaises(Exception) as exc:
+            index_of(
+                obj, clauses=clauses, fail_on_missing=True, tests=self._tests
+            )
+        self.assertIn(
+            "'b' was not found in '{'a': 2}' at [1], "
+            "'a' was not found in '{'c': 3}' at [2] and "
+            "'b' was not found in '{'c': 3}' at [2]. fail_on_missing=True",
+            str(exc.exception),
+        )
+        with self.assertRaises(Exception) as exc:
+            index_of(obj + [1], clauses=clauses, tests=self._tests)
+        self.assertIn("required to be dictionaries", str(exc.exception))
+        with self.assertRaises(Exception) as exc:
+            index_of(obj, clauses=[{"test": "@@"}], tests=self._tests)
+        self.assertIn("the test '@@' was not found", str(exc.exception))
+
+    def test_key_path(self):
+        """Check nested keys are found using a key path"""
+        obj = [
+            {"name": "Eth1", "ipv4": {"address": "10.1.1.1"}},
+            {"name": "Eth2", "ipv4": [{"address": "10.1.2.1"}]},
+            {"name": "Eth3", "ipv4": {"address": "10.1.3.1"}},
+            {"name": "Eth4", "ipv4.address": "10.1.1.1"},
+            {"name": "Eth5"},
+        ]
+        cases = [
+            ("ipv4.address", "10.1.1.1", [0, 3]),
+            ("ipv4['address']", "10.1.3.1", 2),
+            ("ipv4[0].address", "10.1.2.1", 1),
+            ("ipv4[1].address", "10.1.2.1", []),
+        ]
+        for key, value, expected in cases:
+            result = index_of(obj, "eq", value, key, tests=self._tests)
+            self.assertEqual(result, expected)
+            expected = index_of(obj, "eq", value, key, True, tests=self._tests)
+            self.assertEqual(index_by(obj, "eq", value, key, True), expected)
+        with self.assertRaises(Exception) as exc:
+            index_of(
+                obj,
+                "eq",
+                "10.1.1.1",
+                "ipv4.address",
+                fail_on_missing=True,
+                tests=self._tests,
+            )
+        self.assertIn(
+            "'ipv4.address' was not found in '{'name': 'Eth2', "
+            "'ipv4': [{'address': '10.1.2.1'}]}' at [1] and "
+            "'ipv4.address' was not found in '{'name': 'Eth5'}' at [4]. "
+            "fail_on_missing=True",
+            str(exc.exception),
+        )
+
+    def test_lazy(self):
+        """Check the entries are tested as the indices are consumed"""
+        obj = [{"a": idx % 2} for idx in range(10)]
+        with patch.object(
+            index_of_module, "_run_plan", wraps=index_of_module._run_plan
+        ) as mock_run:
+            result = index_of(obj, "eq", 1, "a", lazy=True, tests=self._tests)
+            self.assertEqual(mock_run.call_count, 0)
+            self.assertEqual(next(result), 1)
+            self.assertEqual(mock_run.call_count, 2)
+            self.assertEqual(list(result), [3, 5, 7, 9])
+            self.assertEqual(mock_run.call_count, 10)
+        # the key is checked when called, the entries when consumed
+        with self.assertRaises(Exception) as exc:
+            index_of(obj, "eq", 1, [1], lazy=True, tests=self._tests)
+        self.assertIn("Unknown key type", str(exc.exception))
+        result = index_of(
+            obj + [1], "eq", 1, "a", lazy=True, tests=self._tests
+        )
+        with self.assertRaises(Exception) as exc:
+            list(result)
+        self.assertIn("required to be dictionaries", str(exc.exception))
+
+
+class TestIndexByFilter(unittest.TestCase):
+    def setUp(self):
+        self._tests = Templar(loader=None).environment.tests
+        index_of_module._KEY_INDEXES_BY_ID.clear()
+
+    def test_same_as_index_of(self):
+        """Check index_by returns the same as index_of"""
+        dicts = [
+            {"a": "b", "c": 1},
+            {"a": "b", "c": True},
+            {"a": "x", "c": [1, 2]},
+            {"a": 2.0, "c": {"d": "e"}},
+            {"a": None},
+            {"c": 2},
+        ]
+        objs = [
+            (dicts, "eq", "b", "a"),
+            (dicts, "==", "x", "a"),
+            (dicts, "equalto", 2, "a"),
+            (dicts, "eq", "z", "a"),
+            (dicts, "eq", 1, "c"),
+            (dicts, "eq", [1, 2], "c"),
+            (dicts, "eq", {"d": "e"}, "c"),
+            (dicts, "in", ["x", "b"], "a"),
+            (dicts, "in", "x", "a"),
+            (dicts, "in", [2, [1, 2]], "c"),
+            ([1, "a", 1.0, True, [1], 0], "eq", 1, None),
+            ([1, "a", 1.0, True, [1], 0], "in", ["a", [1]], None),
+        ]
+        for data, test, value, key in objs:
+            for wantlist in [True, False]:
+                expected = index_of(
+                    data, test, value, key, wantlist, tests=self._tests
+                )
+                result = index_by(data, test, value, key, wantlist)
+                self.assertEqual(result, expected)
+
+    def test_fail_mixed_list(self):
+        obj, test, value, key = [{"a": "b"}, True, 1, "a"], "==", "b", "a"
+        with self.assertRaises(Exception) as exc:
+            index_by(obj, test, value, key)
+        self.assertIn("required to be dictionaries", str(exc.exception))
+
+    def test_fail_key_not_valid(self):
+        obj, test, value, key = [{"a": "b"}], "==", "b", [1, 2]
+        with self.assertRaises(Exception) as exc:
+            index_by(obj, test, value, key)
+        self.assertIn("Unknown key type", str(exc.exception))
+
+    def test_fail_test_not_supported(self):
+        with self.assertRaises(Exception) as exc:
+            index_by([1, 2], ">", 1)
+        self.assertIn("'>' is not supported", str(exc.exception))
+
+    def test_fail_on_missing(self):
+        obj, test, value, key = [{"a": True}, {"c": False}], "==", True, "a"
+        with self.assertRaises(Exception) as exc:
+            index_by(obj, test, value, key, fail_on_missing=True)
+        expected = None
+        try:
+            index_of(
+                obj, test, value, key, fail_on_missing=True, tests=self._tests
+            )
+        except Exception as exc_of:
+            expected = str(exc_of)
+        self.assertEqual(str(exc.exception), expected)
+        self.assertEqual(index_by(obj, test, value, key), 0)
+
+    def test_index_reused(self):
+        """Check the list is indexed once for many lookups"""
+        data = [{"name": "eth{0}".format(idx)} for idx in range(10)]
+        with patch.object(
+            index_of_module, "KeyIndex", wraps=index_of_module.KeyIndex
+        ) as key_index:
+            for idx in range(10):
+                name = "eth{0}".format(idx)
+                self.assertEqual(index_by(data, "eq", name, "name"), idx)
+            self.assertEqual(key_index.call_count, 1)
+            # another key or another list is indexed again
+            index_by(data, "eq", "eth1", "missing")
+            index_by(list(data), "eq", "eth1", "name")
+            self.assertEqual(key_index.call_count, 3)
+            # a list that changed length is indexed again
+            data.append({"name": "eth10"})
+            self.assertEqual(index_by(data, "eq", "eth10", "name"), 10)
+            self.assertEqual(key_index.call_count, 4)
+
+    def test_changed_in_place(self):
+        """Check a list changed in place is indexed again"""
+        data = [{"name": "eth0"}, {"name": "eth1"}]
+        self.assertEqual(index_by(data, "eq", "eth0", "name"), 0)
+        data[0]["name"] = "eth2"
+        self.assertEqual(index_by(data, "eq", "eth0", "name"), [])
+        self.assertEqual(index_by(data, "eq", "eth2", "name"), 0)
+        del data[1]["name"]
+        with self.assertRaises(Exception) as exc:
+            index_by(data, "eq", "eth2", "name", fail_on_missing=True)
+        self.assertIn("'name' was not found", str(exc.exception))
+        data[1] = "eth1"
+        with self.assertRaises(Exception) as exc:
+            index_by(data, "eq", "eth2", "name")
+        self.assertIn("required to be dictionaries", str(exc.exception))
+        entries = ["a", "b"]
+        self.assertEqual(index_by(entries, "eq", "a"), 0)
+        entries[0] = "b"
+        self.assertEqual(index_by(entries, "eq", "b"), [0, 1])
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import unittest
+from collections import OrderedDict
+
+from ansible.parsing.yaml.objects import AnsibleUnicode
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
+    to_native_types,
+)
+
+
+class TestToNativeTypes(unittest.TestCase):
+    def test_native_unchanged(self):
+        var = {"a": [1, 2.5, None, True, {"b": "c"}], "d": []}
+        result = to_native_types(var)
+        self.assertIs(result, var)
+        self.assertIs(result["a"], var["a"])
+
+    def test_non_native(self):
+        var = OrderedDict(
+            [
+                (AnsibleUnicode("a"), (1, AnsibleUnicode("b"))),
+                (1, OrderedDict([("c", None)])),
+                (None, [True, 2.5]),
+            ]
+        )
+        result = to_native_types(var)
+        self.assertEqual(result, json.loads(json.dumps(var)))
+        self.assertIs(type(result), dict)
+        self.assertIs(type(result["a"]), list)
+        self.assertIs(type(result["a"][1]), type(u""))
+        self.assertIs(type(result["1"]), dict)
+
+    def test_matches_round_trip(self):
+        var = [
+            {"a": (1, 2)},
+            {True: False, 2.5: "x", "y": OrderedDict([("z", [])])},
+            "native",
+        ]
+        result = to_native_types(var)
+        self.assertEqual(result, json.loads(json.dumps(var)))
+        self.assertIsNot(result, var)
+        self.assertIs(result[2], var[2])
+
+    def test_not_serializable(self):
+        with self.assertRaises(TypeError):
+            to_native_types({"a": set([1])})
+        with self.assertRaises(TypeError):
+            to_native_types({(1, 2): "a"})
@@ -11,11 +11,13 @@ __metaclass__ = type
 import json
 import heapq
 import os
+import sys
 import unittest
 from ansible_collections.ansible.utils.plugins.module_utils.common.get_path import (
     get_path,
 )
 from ansible_collections.ansible.utils.plugins.module_utils.common.to_paths import (
+    split_path,
     to_paths,
 )
 
@@ -101,3 +103,42 @@ class TestToPaths(unittest.TestCase):
         expected = {}
         result = to_paths(var, prepend=None, wantlist=None)
         self.assertEqual(result, expected)
+
+    def test_to_paths_deep(self):
+        """Check structures deeper than the recursion limit"""
+        depth = sys.getrecursionlimit() + 10
+        var = 1
+        for _idx in range(depth):
+            var = {"a": [var]}
+        expected = {"a[0]" + ".a[0]" * (depth - 1): 1}
+        result = to_paths(var, prepend=None, wantlist=None)
+        self.assertEqual(result, expected)
+
+    def test_to_paths_empty(self):
+        """Check empty and scalar values"""
+        cases = [
+            ({}, {}),
+            ([], []),
+            (1, {"": 1}),
+            (
+                {"a": {}, "b": [], "c": [{}, []]},
+                {"a": {}, "b": [], "c[0]": {}, "c[1]": []},
+            ),
+            ({"": {"a": 1, "b c": {}}}, {"a": 1, "b c": {}}),
+        ]
+        for var, expected in cases:
+            result = to_paths(var, prepend=None, wantlist=None)
+            self.assertEqual(result, expected)
+
+    def test_split_path(self):
+        """Check the paths from to_paths split back to their keys"""
+        var = {"a": {"b": [{"c": 1}, {"Eth1/1": {"d_e": [0, True]}}]}}
+        expected = {
+            "a.b[0].c": ["a", "b", 0, "c"],
+            "a.b[1]['Eth1/1'].d_e[0]": ["a", "b", 1, "Eth1/1", "d_e", 0],
+            "a.b[1]['Eth1/1'].d_e[1]": ["a", "b", 1, "Eth1/1", "d_e", 1],
+        }
+        paths = to_paths(var, prepend=None, wantlist=None)
+        self.assertEqual(sorted(paths), sorted(expected))
+        for path, value in paths.items():
+            self.assertEqual(split_path(path), expected[path])
@@ -5,8 +5,12 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
 import os
+import pstats
+import shutil
 import tempfile
+from collections import OrderedDict
 from ansible.playbook.task import Task
 from ansible.template import Templar
 
@@ -29,6 +33,11 @@ from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_valid
 )
 from ansible_collections.ansible.utils.plugins.action.cli_parse import (
     ARGSPEC_CONDITIONALS,
+    PROFILE_DIR_ENV,
+    TIMINGS_ENV,
+    _PARSER_REGISTRY,
+    _TEMPLATE_PATHS,
+    available_parsers,
 )
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.cli_parser import (
     CliParserBase,
@@ -118,7 +127,22 @@ class TestCli_Parse(unittest.TestCase):
         )
 
         self.assertIn(
-            "one of the following is required: command, text", result["errors"]
+            "one of the following is required: command, text, commands",
+            result["errors"],
+        )
+
+    def test_fn_check_argspec_fail_no_parser(self):
+        """ Confirm failed argspec with text and no parser
+        """
+        valid, result, updated_params = check_argspec(
+            DOCUMENTATION,
+            "cli_parse module",
+            schema_conditionals=ARGSPEC_CONDITIONALS,
+            text="anything",
+        )
+        self.assertFalse(valid)
+        self.assertIn(
+            "missing parameter(s) required by 'text': parser", result["errors"]
         )
 
     def test_fn_check_argspec_fail_no_parser_name(self):
@@ -190,6 +214,52 @@ class TestCli_Parse(unittest.TestCase):
         self.assertTrue(self._plugin._result["failed"])
         self.assertIn("No module named", self._plugin._result["msg"])
 
+    def test_fn_load_parser_registry(self):
+        """ Confirm a parser, or the failure to find one,
+        is resolved once and reused
+        """
+        _PARSER_REGISTRY.clear()
+        self._plugin._task.args = {
+            "text": "anything",
+            "parser": {"name": "ansible.netcommon.pyats"},
+        }
+        with patch(
+            "ansible_collections.ansible.utils.plugins.action.cli_parse.import_module",
+            side_effect=ImportError("No module named pyats_parser"),
+        ) as mock_import:
+            for _i in range(3):
+                self._plugin._result = {}
+                parser = self._plugin._load_parser(task_vars=None)
+                self.assertIsNone(parser)
+                self.assertIn("No module named", self._plugin._result["msg"])
+        # the utils path and the netcommon fallback, probed once each
+        self.assertEqual(mock_import.call_count, 2)
+        self.assertIsNotNone(_PARSER_REGISTRY.get("ansible.netcommon.pyats"))
+
+        self._plugin._task.args["parser"]["name"] = "ansible.netcommon.json"
+        self._plugin._display = MagicMock()
+        for _i in range(2):
+            parser = self._plugin._load_parser(task_vars=None)
+            self.assertEqual(type(parser).__name__, "CliParser")
+        self.assertEqual(self._plugin._display.warning.call_count, 2)
+        self.assertIn(
+            "Use 'ansible.utils.json'",
+            self._plugin._display.warning.call_args[0][0],
+        )
+        _PARSER_REGISTRY.clear()
+
+    def test_fn_available_parsers(self):
+        """ Confirm the parsers and their libraries are listed
+        """
+        parsers = available_parsers()
+        for parser_name in ["json", "textfsm", "ttp", "xml"]:
+            self.assertIn("ansible.utils." + parser_name, parsers)
+        self.assertEqual(parsers["ansible.utils.json"]["libraries"], {})
+        self.assertTrue(parsers["ansible.utils.json"]["available"])
+        self.assertIn("xmltodict", parsers["ansible.utils.xml"]["libraries"])
+        self.assertIn("textfsm", parsers["ansible.utils.textfsm"]["libraries"])
+        self.assertIn("ttp", parsers["ansible.utils.ttp"]["libraries"])
+
     def test_fn_set_parser_command_missing(self):
         """ Confirm parser/command is set if missing
         and command provided
@@ -301,6 +371,37 @@ class TestCli_Parse(unittest.TestCase):
             self._plugin._task.args["parser"]["template_path"], template_path
         )
 
+    def test_fn_update_template_path_cached(self):
+        """ Check the template path is resolved once for the same
+        search path, os and command and resolved again if removed
+        """
+        _TEMPLATE_PATHS.clear()
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        template_path = os.path.join(tmpdir, "nxos_show_version.yaml")
+        with open(template_path, "w") as fhand:
+            fhand.write("---")
+        self._plugin._find_needle = MagicMock()
+        self._plugin._find_needle.return_value = template_path
+        for _i in range(3):
+            self._plugin._task.args = {
+                "parser": {"command": "show version", "os": "nxos"}
+            }
+            self._plugin._update_template_path("yaml")
+            self.assertEqual(
+                self._plugin._task.args["parser"]["template_path"],
+                template_path,
+            )
+        self.assertEqual(self._plugin._find_needle.call_count, 1)
+
+        os.remove(template_path)
+        self._plugin._task.args = {
+            "parser": {"command": "show version", "os": "nxos"}
+        }
+        self._plugin._update_template_path("yaml")
+        self.assertEqual(self._plugin._find_needle.call_count, 2)
+        _TEMPLATE_PATHS.clear()
+
     def test_fn_get_template_contents_pass(self):
         """ Check the retrieval of the template contents
         """
@@ -393,6 +494,19 @@ class TestCli_Parse(unittest.TestCase):
         self.assertEqual(self._plugin._result["stdout"], expected)
         self.assertEqual(self._plugin._result["stdout_lines"], [expected])
 
+    @patch("ansible.module_utils.connection.Connection.__rpc__")
+    def test_fn_run_command_no_stdout_lines(self, mock_rpc):
+        """ Check stdout_lines is only returned when requested
+        """
+        mock_rpc.return_value = "a\nb"
+        self._plugin._connection.socket_path = (
+            tempfile.NamedTemporaryFile().name
+        )
+        self._plugin._task.args = {"command": "ls", "stdout_lines": False}
+        self._plugin._run_command()
+        self.assertEqual(self._plugin._result["stdout"], "a\nb")
+        self.assertNotIn("stdout_lines", self._plugin._result)
+
     def test_fn_run_command_not_specified(self):
         """ Check run command for network
         """
@@ -455,6 +569,257 @@ class TestCli_Parse(unittest.TestCase):
         self.assertEqual(result["parsed"][0]["version"], "9.2(2)")
         self.assertNotIn("ansible_facts", result)
 
+    def test_fn_run_native_types(self):
+        """ Check the parser result is converted to native types
+        unless the parser declares its output is native
+        """
+
+        class CliParser(CliParserBase):
+            def parse(self, *_args, **kwargs):
+                return {"parsed": OrderedDict([("a", ("b", "c"))])}
+
+        self._plugin._task.args = {
+            "text": "anything",
+            "parser": {"name": "a.b.c", "command": "show version"},
+        }
+        self._plugin._load_parser = MagicMock()
+        self._plugin._load_parser.return_value = CliParser(None, None, None)
+        task_vars = {"inventory_hostname": "mockdevice"}
+        result = self._plugin.run(task_vars=task_vars)
+        self.assertEqual(result["parsed"], {"a": ["b", "c"]})
+        self.assertIs(type(result["parsed"]), dict)
+
+        CliParser.NATIVE_OUTPUT = True
+        self._plugin._result = {}
+        result = self._plugin.run(task_vars=task_vars)
+        self.assertIs(type(result["parsed"]), OrderedDict)
+
+    def _run_timed(self, **args):
+        class CliParser(CliParserBase):
+            def parse(self, *_args, **kwargs):
+                return {"parsed": {"a": ["b", "c"]}}
+
+        self._plugin._task.args = dict(
+            {
+                "text": "anything",
+                "parser": {"name": "a.b.c", "command": "show version"},
+            },
+            **args
+        )
+        self._plugin._result = {}
+        self._plugin._load_parser = MagicMock()
+        self._plugin._load_parser.return_value = CliParser(None, None, None)
+        return self._plugin.run(task_vars={"inventory_hostname": "mockdevice"})
+
+    def test_fn_run_timings(self):
+        """ Check the timings are only returned when requested
+        """
+        result = self._run_timed()
+        self.assertNotIn("timings", result)
+
+        result = self._run_timed(timings=True)
+        timings = result["timings"]
+        self.assertEqual(
+            set(timings["phases"]),
+            set(
+                [
+                    "argspec",
+                    "command",
+                    "parser_load",
+                    "template",
+                    "parse",
+                    "normalize",
+                ]
+            ),
+        )
+        for timing in list(timings["phases"].values()) + [timings["total"]]:
+            self.assertEqual(set(timing), set(["wall", "cpu"]))
+            self.assertGreaterEqual(timing["wall"], 0)
+        self.assertEqual(timings["text_size"], len("anything"))
+        self.assertEqual(timings["parsed_size"], len('{"a": ["b", "c"]}'))
+        self.assertNotIn("profile", timings)
+
+    def test_fn_run_timings_env(self):
+        """ Check the timings can be enabled with an environment variable
+        """
+        with patch.dict(os.environ, {TIMINGS_ENV: "yes"}):
+            result = self._run_timed()
+            self.assertIn("parse", result["timings"]["phases"])
+            # the task option overrides the environment variable
+            result = self._run_timed(timings=False)
+            self.assertNotIn("timings", result)
+
+    def test_fn_run_profile_dir(self):
+        """ Check a cProfile statistics file is written for each task
+        """
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            profile_dir = os.path.join(tmp_dir, "profiles")
+            result = self._run_timed(profile_dir=profile_dir, timings=True)
+            profile = result["timings"]["profile"]
+            self.assertEqual(os.path.dirname(profile), profile_dir)
+            self.assertIn("mockdevice", os.path.basename(profile))
+            self.assertTrue(pstats.Stats(profile).total_calls)
+
+            with patch.dict(os.environ, {PROFILE_DIR_ENV: profile_dir}):
+                result = self._run_timed()
+                self.assertNotIn("timings", result)
+                self.assertEqual(len(os.listdir(profile_dir)), 2)
+                self._run_timed(profile_dir="")
+            self.assertEqual(len(os.listdir(profile_dir)), 2)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def _commands_args(self):
+        template_path = os.path.join(
+            os.path.dirname(__file__), "fixtures", "nxos_show_version.textfsm"
+        )
+        return {
+            "commands": [
+                {"command": "show version"},
+                {
+                    "command": "show interface",
+                    "parser": {"name": "ansible.utils.json"},
+                },
+            ],
+            "parser": {
+                "name": "ansible.utils.textfsm",
+                "template_path": template_path,
+            },
+            "set_fact": "new_fact",
+        }
+
+    @patch("ansible.module_utils.connection.Connection.__rpc__")
+    def test_fn_run_commands_batch(self, mock_rpc):
+        """ Check commands are sent in one batch and each is parsed
+        with its own parser
+        """
+        mock_out = self._load_fixture("nxos_show_version.txt")
+        calls = []
+
+        def rpc(name, *args, **kwargs):
+            calls.append(name)
+            if name == "get_capabilities":
+                return json.dumps({"rpc": ["get", "run_commands"]})
+            return [mock_out, '{"Ethernet1/1": "up"}']
+
+        mock_rpc.side_effect = rpc
+        self._plugin._connection.socket_path = (
+            tempfile.NamedTemporaryFile().name
+        )
+        self._plugin._task.args = self._commands_args()
+        task_vars = {"inventory_hostname": "mockdevice"}
+        result = self._plugin.run(task_vars=task_vars)
+        self.assertEqual(calls, ["get_capabilities", "run_commands"])
+        self.assertEqual(result["stdout"]["show version"], mock_out)
+        self.assertEqual(
+            result["stdout_lines"]["show interface"], ['{"Ethernet1/1": "up"}']
+        )
+        self.assertEqual(
+            result["parsed"]["show version"][0]["version"], "9.2(2)"
+        )
+        self.assertEqual(
+            result["parsed"]["show interface"], {"Ethernet1/1": "up"}
+        )
+        self.assertEqual(result["ansible_facts"]["new_fact"], result["parsed"])
+
+    @patch("ansible.module_utils.connection.Connection.__rpc__")
+    def test_fn_run_commands_no_batch(self, mock_rpc):
+        """ Check each command is sent on its own when the connection
+        does not support run_commands
+        """
+        calls = []
+
+        def rpc(name, *args, **kwargs):
+            calls.append(name)
+            if name == "get_capabilities":
+                return json.dumps({"rpc": ["get"]})
+            return '{"command": "%s"}' % kwargs["command"]
+
+        mock_rpc.side_effect = rpc
+        self._plugin._connection.socket_path = (
+            tempfile.NamedTemporaryFile().name
+        )
+        self._plugin._task.args = {
+            "commands": [{"command": "show a"}, {"command": "show b"}],
+            "parser": {"name": "ansible.utils.json"},
+        }
+        result = self._plugin.run(task_vars={"inventory_hostname": "mock"})
+        self.assertEqual(calls, ["get_capabilities", "get", "get"])
+        self.assertEqual(
+            result["parsed"],
+            {"show a": {"command": "show a"}, "show b": {"command": "show b"}},
+        )
+
+    def test_fn_run_commands_parser_reused(self):
+        """ Check a parser is loaded once for the commands using it
+        """
+        self._plugin._connection.socket_path = None
+        self._plugin._low_level_execute_command = MagicMock()
+        self._plugin._low_level_execute_command.side_effect = [
+            {"rc": 0, "stdout": "[1]"},
+            {"rc": 0, "stdout": "[2]"},
+        ]
+        self._plugin._task.args = {
+            "commands": [{"command": "cat a"}, {"command": "cat b"}],
+            "parser": {"name": "ansible.utils.json"},
+        }
+        load_parser = self._plugin._load_parser
+        self._plugin._load_parser = MagicMock(side_effect=load_parser)
+        result = self._plugin.run(task_vars={"inventory_hostname": "mock"})
+        self.assertEqual(result["parsed"], {"cat a": [1], "cat b": [2]})
+        self.assertEqual(self._plugin._load_parser.call_count, 1)
+
+    def test_fn_run_commands_missing_parser(self):
+        """ Check each command needs a parser
+        """
+        self._plugin._task.args = {
+            "commands": [
+                {
+                    "command": "show a",
+                    "parser": {"name": "ansible.utils.json"},
+                },
+                {"command": "show b"},
+            ]
+        }
+        result = self._plugin.run(task_vars={"inventory_hostname": "mock"})
+        self.assertTrue(result["failed"])
+        self.assertIn("for command 'show b'", result["msg"])
+
+    def test_fn_run_commands_duplicate_command(self):
+        """ Check a command provided twice fails the task
+        """
+        self._plugin._task.args = {
+            "commands": [
+                {"command": "show a"},
+                {"command": "show a", "parser": {"name": "ansible.utils.xml"}},
+            ],
+            "parser": {"name": "ansible.utils.json"},
+        }
+        result = self._plugin.run(task_vars={"inventory_hostname": "mock"})
+        self.assertTrue(result["failed"])
+        self.assertIn(
+            "Command 'show a' is provided more than once", result["msg"]
+        )
+
+    def test_fn_run_commands_command_fail(self):
+        """ Check a failed command fails the task
+        """
+        self._plugin._connection.socket_path = None
+        self._plugin._low_level_execute_command = MagicMock()
+        self._plugin._low_level_execute_command.return_value = {
+            "rc": 1,
+            "stdout": "",
+            "stderr": "not found",
+        }
+        self._plugin._task.args = {
+            "commands": [{"command": "cat a"}],
+            "parser": {"name": "ansible.utils.json"},
+        }
+        result = self._plugin.run(task_vars={"inventory_hostname": "mock"})
+        self.assertTrue(result["failed"])
+        self.assertEqual(result["msg"], "not found")
+
     def test_fn_run_fail_argspec(self):
         """ Check full module run with invalid params
         """
@@ -7,6 +7,10 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
+import os
+import shutil
+import tempfile
 import unittest
 from ansible.playbook.task import Task
 from ansible.template import Templar
@@ -306,3 +310,40 @@ class TestValidate(unittest.TestCase):
 
         result = self._plugin.run(task_vars=None)
         self.assertIn("Validation errors were found", result["msg"])
+
+    def test_data_file(self):
+        """Check each record of a data file is validated"""
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        data_file = os.path.join(tmpdir, "data.jsonl")
+        with open(data_file, "w") as fhand:
+            for record in [VALID_DATA, IN_VALID_DATA, VALID_DATA]:
+                fhand.write(json.dumps(record) + "\n")
+
+        self._plugin._find_needle = MagicMock()
+        self._plugin._find_needle.return_value = data_file
+        self._plugin._task.args = {
+            "engine": "ansible.utils.jsonschema",
+            "data_file": "data.jsonl",
+            "criteria": CRITERIA_FORMAT_SUPPORT_CHECK,
+        }
+        result = self._plugin.run(task_vars=None)
+        self._plugin._find_needle.assert_called_with("files", "data.jsonl")
+        self.assertTrue(result["failed"])
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertEqual(result["errors"][0]["record"], 1)
+        self.assertEqual(result["errors"][0]["data_path"], "email")
+        self.assertIn("Record 1: At 'properties.email.format'", result["msg"])
+
+    def test_data_and_data_file(self):
+        """Check data and data_file are mutually exclusive"""
+
+        self._plugin._task.args = {
+            "engine": "ansible.utils.jsonschema",
+            "data": DATA,
+            "data_file": "data.jsonl",
+            "criteria": CRITERIA_FORMAT_SUPPORT_CHECK,
+        }
+        result = self._plugin.run(task_vars=None)
+        self.assertIn("mutually exclusive", str(result["errors"]))
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for in_network_many filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from ansible.errors import AnsibleFilterError
+from ansible_collections.ansible.utils.plugins.filter.in_network_many import (
+    _in_network_many,
+)
+from ansible_collections.ansible.utils.plugins.test.in_network import (
+    _in_network,
+)
+
+DATA = ["10.1.1.1", "8.8.8.8", "10.2.0.0/16", "2001:db8::1", "helloworld"]
+
+
+class TestInNetworkMany(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        with self.assertRaises(TypeError) as error:
+            _in_network_many(DATA)
+        self.assertIn("argument", str(error.exception))
+
+        with self.assertRaises(AnsibleFilterError) as error:
+            _in_network_many(DATA, "10.0.0.0/8", mask="maybe")
+        self.assertIn("argspec validation failed", str(error.exception))
+
+    def test_filter(self):
+        """Check the entries in the network are returned"""
+
+        result = _in_network_many(DATA, "10.0.0.0/8")
+        self.assertEqual(result, ["10.1.1.1", "10.2.0.0/16"])
+
+        result = _in_network_many(DATA, "2001:db8::/32")
+        self.assertEqual(result, ["2001:db8::1"])
+
+    def test_mask(self):
+        """Check a mask is returned"""
+
+        result = _in_network_many(DATA, "10.0.0.0/8", mask=True)
+        self.assertEqual(result, [True, False, True, False, False])
+
+    def test_invalid_network(self):
+        """Check an invalid network matches nothing"""
+
+        result = _in_network_many(DATA, "helloworld", mask=True)
+        self.assertEqual(result, [False] * len(DATA))
+
+    def test_matches_in_network(self):
+        """Check the results match the in_network test plugin"""
+
+        for network in ("10.0.0.0/8", "8.8.8.8/32", "2001:db8::/32"):
+            expected = [_in_network(entry, network) for entry in DATA]
+            self.assertEqual(
+                _in_network_many(DATA, network, mask=True), expected
+            )
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for index_by filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from ansible.errors import AnsibleError
+from ansible_collections.ansible.utils.tests.unit.compat.mock import patch
+from ansible_collections.ansible.utils.plugins.module_utils.common import (
+    index_of as index_of_module,
+)
+from ansible_collections.ansible.utils.plugins.filter.index_by import _index_by
+
+
+class TestIndexBy(unittest.TestCase):
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        with self.assertRaises(AnsibleError) as error:
+            _index_by([1, 2], "ne", 1)
+        self.assertIn("value of test must be one of", str(error.exception))
+
+    def test_index_reused(self):
+        """Check the filter indexes the list once for many lookups"""
+
+        data = [{"name": "eth{0}".format(idx)} for idx in range(10)]
+        with patch.object(
+            index_of_module, "KeyIndex", wraps=index_of_module.KeyIndex
+        ) as key_index:
+            for idx in range(10):
+                name = "eth{0}".format(idx)
+                self.assertEqual(_index_by(data, "eq", name, "name"), idx)
+            self.assertEqual(key_index.call_count, 1)
+            self.assertEqual(
+                _index_by(data, "in", ["eth1", "eth3"], "name"), [1, 3]
+            )
+            self.assertEqual(key_index.call_count, 1)
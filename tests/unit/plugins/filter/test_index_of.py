@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for index_of filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from ansible.template import Templar
+from ansible_collections.ansible.utils.plugins.filter.index_of import _index_of
+
+
+class TestIndexOf(unittest.TestCase):
+    def setUp(self):
+        self._environment = Templar(loader=None).environment
+
+    def test_clause_key_not_converted(self):
+        """Check an int key of a clause is not converted to a string"""
+
+        data = [{0: "a", "0": "b"}, {0: "b", "0": "a"}]
+        clauses = [{"test": "eq", "value": "b", "key": 0}]
+        self.assertEqual(
+            _index_of(self._environment, data, clauses=clauses), 1
+        )
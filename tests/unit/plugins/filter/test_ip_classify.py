@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for ip_classify filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from ansible.errors import AnsibleFilterError
+from ansible_collections.ansible.utils.plugins.filter.ip_classify import (
+    _ip_classify,
+)
+from ansible_collections.ansible.utils.plugins.test.ipv4 import _ipv4
+from ansible_collections.ansible.utils.plugins.test.private import _private
+from ansible_collections.ansible.utils.plugins.test.public import _public
+
+DATA = [
+    "10.1.1.1",
+    "8.8.8.8",
+    "192.168.1.0/24",
+    "2001:db8::1",
+    "helloworld",
+    "10.1.1.1",
+    "",
+]
+
+
+class TestIpClassify(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_test(self):
+        """Check passing an unsupported test"""
+
+        with self.assertRaises(AnsibleFilterError) as error:
+            _ip_classify(DATA, "not_a_test")
+        self.assertIn("value of test must be one of", str(error.exception))
+
+    def test_invalid_data(self):
+        """Check passing something other than a list"""
+
+        with self.assertRaises(AnsibleFilterError) as error:
+            _ip_classify({"a": "b"}, "ip")
+        self.assertIn("argspec validation failed", str(error.exception))
+
+    def test_filter(self):
+        """Check the entries satisfying the test are returned"""
+
+        result = _ip_classify(DATA, "private")
+        self.assertEqual(result, ["10.1.1.1", "2001:db8::1", "10.1.1.1"])
+
+        result = _ip_classify(DATA, "ipv4")
+        self.assertEqual(
+            result, ["10.1.1.1", "8.8.8.8", "192.168.1.0/24", "10.1.1.1"]
+        )
+
+    def test_mask(self):
+        """Check a mask is returned"""
+
+        result = _ip_classify(DATA, "ip_address", mask=True)
+        self.assertEqual(result, [True, True, False, True, False, True, False])
+
+    def test_matches_individual_tests(self):
+        """Check the results match the individual test plugins"""
+
+        for test, func in (
+            ("private", _private),
+            ("public", _public),
+            ("ipv4", _ipv4),
+        ):
+            expected = [func(entry) for entry in DATA]
+            self.assertEqual(_ip_classify(DATA, test, mask=True), expected)
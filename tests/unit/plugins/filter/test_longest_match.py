@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for longest_match filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from ansible.errors import AnsibleError
+from ansible_collections.ansible.utils.plugins.filter.longest_match import (
+    _longest_match,
+)
+
+NETWORKS = [
+    "10.0.0.0/8",
+    "10.1.0.0/16",
+    "10.1.1.0/24",
+    "192.168.1.0/24",
+    "2001:db8::/32",
+    "2001:db8:a::/48",
+    "helloworld",
+]
+
+
+class TestLongestMatch(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        with self.assertRaises(AnsibleError) as error:
+            _longest_match(ip="10.1.1.1", networks={"a": "b"})
+        self.assertIn("unable to convert to list", str(error.exception))
+
+    def test_valid_data(self):
+        """Check the most specific network is returned"""
+
+        self.assertEqual(_longest_match("10.1.1.1", NETWORKS), "10.1.1.0/24")
+        self.assertEqual(_longest_match("10.1.2.1", NETWORKS), "10.1.0.0/16")
+        self.assertEqual(_longest_match("10.2.2.1", NETWORKS), "10.0.0.0/8")
+        self.assertEqual(
+            _longest_match("2001:db8:a::1", NETWORKS), "2001:db8:a::/48"
+        )
+        self.assertEqual(
+            _longest_match("2001:db8:b::1", NETWORKS), "2001:db8::/32"
+        )
+
+    def test_network_as_ip(self):
+        """Check a network only matches networks containing all of it"""
+
+        self.assertEqual(
+            _longest_match("10.1.0.0/16", NETWORKS), "10.1.0.0/16"
+        )
+        self.assertEqual(_longest_match("10.0.0.0/7", NETWORKS), None)
+
+    def test_no_match(self):
+        """Check None is returned when nothing matches"""
+
+        self.assertEqual(_longest_match("8.8.8.8", NETWORKS), None)
+        self.assertEqual(_longest_match("helloworld", NETWORKS), None)
+        self.assertEqual(_longest_match("10.1.1.1", []), None)
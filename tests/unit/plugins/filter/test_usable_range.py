@@ -123,3 +123,63 @@ class TestUsableRange(unittest.TestCase):
         ip = VALID_DATA[3]
         result = _usable_range(ip)
         self.assertEqual(result, VALID_OUTPUT_4)
+
+    def test_slice(self):
+        """Check passing offset, limit and step"""
+
+        result = _usable_range("10.0.0.8/30", offset=1, limit=2)
+        self.assertEqual(
+            result,
+            {"number_of_ips": 4, "usable_ips": ["10.0.0.9", "10.0.0.10"]},
+        )
+
+        result = _usable_range("10.0.0.8/30", step=2)
+        self.assertEqual(
+            result,
+            {"number_of_ips": 4, "usable_ips": ["10.0.0.8", "10.0.0.10"]},
+        )
+
+        result = _usable_range("10.0.0.8/30", offset=10)
+        self.assertEqual(result, {"number_of_ips": 4, "usable_ips": []})
+
+        result = _usable_range("10.0.0.8/30", limit="1")
+        self.assertEqual(
+            result, {"number_of_ips": 4, "usable_ips": ["10.0.0.8"]}
+        )
+
+    def test_slice_large_network(self):
+        """Check a slice of a large network is generated without expanding it"""
+
+        result = _usable_range("10.0.0.0/8", offset=16777214, limit=5)
+        self.assertEqual(
+            result,
+            {
+                "number_of_ips": 16777216,
+                "usable_ips": ["10.255.255.254", "10.255.255.255"],
+            },
+        )
+
+        result = _usable_range("2001:db8::/64", offset=1, limit=3, step=256)
+        self.assertEqual(
+            result,
+            {
+                "number_of_ips": 2 ** 64,
+                "usable_ips": [
+                    "2001:db8::1",
+                    "2001:db8::101",
+                    "2001:db8::201",
+                ],
+            },
+        )
+
+    def test_invalid_slice(self):
+        """Check passing an invalid offset, limit or step"""
+
+        for kwargs in ({"offset": -1}, {"limit": -1}, {"step": 0}):
+            with self.assertRaises(AnsibleError) as error:
+                _usable_range("10.0.0.8/30", **kwargs)
+            self.assertIn("step must be at least 1", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _usable_range("10.0.0.8/30", limit="many")
+        self.assertIn("argspec validation failed", str(error.exception))
@@ -7,9 +7,14 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
+import os
+import shutil
+import tempfile
 import unittest
 
 from ansible.errors import AnsibleLookupError
+from ansible.parsing.dataloader import DataLoader
 from ansible_collections.ansible.utils.plugins.lookup.validate import (
     LookupModule,
 )
@@ -172,3 +177,31 @@ class TestValidate(unittest.TestCase):
         variables = {}
         result = self._lp.run(terms, variables, **kwargs)
         self.assertEqual(result, [])
+
+    def test_data_file(self):
+        """Check each record of a data file is validated"""
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        data_file = os.path.join(tmpdir, "data.yaml")
+        with open(data_file, "w") as fhand:
+            fhand.write("---\n")
+            fhand.write(json.dumps(DATA) + "\n")
+            fhand.write("---\n")
+            fhand.write(json.dumps({}) + "\n")
+
+        lookup = LookupModule(loader=DataLoader())
+        terms = [CRITERIA_CRC_ERROR_CHECK]
+        kwargs = {"engine": "ansible.utils.jsonschema", "data_file": data_file}
+        result = lookup.run(terms, {}, **kwargs)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["record"], 0)
+        self.assertEqual(
+            result[0]["data_path"],
+            "GigabitEthernet0/0/0/1.counters.in_crc_errors",
+        )
+
+        kwargs["data_file"] = os.path.join(tmpdir, "missing.yaml")
+        with self.assertRaises(AnsibleLookupError) as error:
+            lookup.run(terms, {}, **kwargs)
+        self.assertIn("Unable to find data file", str(error.exception))
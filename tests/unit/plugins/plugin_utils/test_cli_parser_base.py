@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import io
+import unittest
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.cli_parser import (
+    iter_text_chunks,
+)
+
+TEXT = "one\ntwo\r\nthree\rfour\n\nfive\x0csix\n" * 20
+
+
+class TestIterText(unittest.TestCase):
+    def test_chunks_end_at_line_breaks(self):
+        """Check the chunks join back to the text and end at a line break"""
+        for chunk_size in [1, 7, 50, 65536]:
+            chunks = list(iter_text_chunks(TEXT, chunk_size))
+            self.assertEqual("".join(chunks), TEXT)
+            for chunk in chunks[:-1]:
+                self.assertTrue(chunk.endswith("\n"))
+            if chunk_size > 1:
+                self.assertLess(len(chunks), len(TEXT.splitlines()))
+
+    def test_empty(self):
+        """Check an empty text has no chunks"""
+        self.assertEqual(list(iter_text_chunks("")), [])
+        self.assertEqual(list(iter_text_chunks(None)), [])
+
+    def test_file_like(self):
+        """Check a file-like object is read a line at a time"""
+        text = "one\ntwo\n\nthree"
+        self.assertEqual(
+            list(iter_text_chunks(io.StringIO(text), chunk_size=5)),
+            ["one\ntwo\n", "\nthree\n"],
+        )
+
+    def test_line_iterator(self):
+        """Check lines without their line breaks are kept apart"""
+        lines = ["one", "two", "", "three"]
+        self.assertEqual(
+            list(iter_text_chunks(lines, chunk_size=5)),
+            ["one\ntwo\n", "\nthree\n"],
+        )
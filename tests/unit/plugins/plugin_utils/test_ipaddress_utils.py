@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for the netaddr test utils
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from ansible.errors import AnsibleError
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
+    NetworkIndex,
+    _compile_fast_validator,
+    _network_index,
+    _validate_args,
+)
+from ansible_collections.ansible.utils.plugins.test.in_any_network import (
+    DOCUMENTATION as IN_ANY_NETWORK_DOC,
+)
+from ansible_collections.ansible.utils.plugins.test.validate import (
+    DOCUMENTATION as VALIDATE_DOC,
+)
+
+
+class TestFastValidator(unittest.TestCase):
+    def test_simple_spec_compiles(self):
+        """Check a str/list required spec gets a fast path"""
+
+        validator = _compile_fast_validator(IN_ANY_NETWORK_DOC)
+        self.assertIsNotNone(validator)
+        self.assertTrue(
+            validator({"ip": "10.1.1.1", "networks": ["10.0.0.0/8"]})
+        )
+        self.assertTrue(validator({"ip": None, "networks": None}))
+
+    def test_fast_path_defers(self):
+        """Check anything unusual is left to the full validator"""
+
+        validator = _compile_fast_validator(IN_ANY_NETWORK_DOC)
+        # missing required
+        self.assertFalse(validator({"networks": ["10.0.0.0/8"]}))
+        # needs type conversion
+        self.assertFalse(validator({"ip": 10, "networks": "10.0.0.0/8"}))
+        # unsupported parameter
+        self.assertFalse(
+            validator({"ip": "10.1.1.1", "networks": [], "other": True})
+        )
+
+    def test_rich_spec_not_compiled(self):
+        """Check a spec with defaults does not get a fast path"""
+
+        self.assertIsNone(_compile_fast_validator(VALIDATE_DOC))
+
+    def test_error_message_unchanged(self):
+        """Check the full validator message is used on failure"""
+
+        with self.assertRaises(AnsibleError) as error:
+            _validate_args(
+                "in_any_network", IN_ANY_NETWORK_DOC, {"networks": []}
+            )
+        self.assertEqual(
+            "argspec validation failed for in_any_network test plugin"
+            " with errors: ['missing required arguments: ip']",
+            str(error.exception),
+        )
+
+
+class TestNetworkIndex(unittest.TestCase):
+    def test_matches(self):
+        """Check matches are returned longest prefix first"""
+
+        index = NetworkIndex(
+            ["10.0.0.0/8", "10.1.1.0/24", "10.0.0.0/8", "2001:db8::/32"]
+        )
+        self.assertEqual(
+            list(index.matches("10.1.1.1")),
+            [(1, "10.1.1.0/24"), (2, "10.0.0.0/8")],
+        )
+        self.assertEqual(index.match_count("10.1.1.1"), 3)
+        self.assertEqual(index.longest_match("10.2.0.0/16"), "10.0.0.0/8")
+        self.assertTrue(index.any_match("2001:db8::1"))
+        self.assertFalse(index.any_match("8.8.8.8"))
+        self.assertFalse(index.any_match("helloworld"))
+
+    def test_cached(self):
+        """Check the index is reused for the same or an equal list"""
+
+        networks = ["10.0.0.0/8", "192.168.1.0/24"]
+        index = _network_index(networks)
+        self.assertIs(_network_index(networks), index)
+        self.assertIs(_network_index(list(networks)), index)
+
+        networks.append("172.16.0.0/12")
+        self.assertIsNot(_network_index(networks), index)
+        self.assertTrue(_network_index(networks).any_match("172.16.1.1"))
+
+    def test_changed_in_place(self):
+        """Check a list changed in place without changing length is indexed again"""
+
+        networks = ["10.0.0.0/8", "192.168.1.0/24"]
+        self.assertFalse(_network_index(networks).any_match("172.16.1.1"))
+        networks[0] = "172.16.0.0/12"
+        self.assertTrue(_network_index(networks).any_match("172.16.1.1"))
+        self.assertEqual(
+            _network_index(networks).longest_match("172.16.1.1"),
+            "172.16.0.0/12",
+        )
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for the validate base class
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from ansible.errors import AnsibleError
+from ansible_collections.ansible.utils.tests.unit.compat.mock import patch
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import (
+    validate as validate_base,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.validate import (
+    _SUB_PLUGIN_OPTIONS,
+    _load_validator,
+    _read_records,
+)
+
+DATA = {"mtu": 1514}
+CRITERIA = {"type": "object", "properties": {"mtu": {"maximum": 9000}}}
+
+
+class TestValidateBaseOptions(unittest.TestCase):
+    def setUp(self):
+        _SUB_PLUGIN_OPTIONS.clear()
+
+    def _load(self, plugin_vars=None, kwargs=None, option_defaults=None):
+        validator, result = _load_validator(
+            engine="ansible.utils.jsonschema",
+            data=DATA,
+            criteria=CRITERIA,
+            plugin_vars=plugin_vars,
+            kwargs=kwargs,
+            option_defaults=option_defaults,
+        )
+        self.assertEqual(result, {})
+        return validator
+
+    def test_documentation_read_once(self):
+        """Check the engine documentation is only loaded on the first call"""
+        with patch.object(
+            validate_base.yaml, "load", wraps=validate_base.yaml.load
+        ) as mock_load:
+            self._load()
+            first_call_count = mock_load.call_count
+            for _i in range(3):
+                self._load()
+        self.assertGreater(first_call_count, 0)
+        self.assertEqual(mock_load.call_count, first_call_count)
+
+    def test_option_precedence(self):
+        """Check kwargs, then vars, then env are used per call"""
+        plugin_vars = {"ansible_validate_jsonschema_draft": "draft6"}
+        env = {"ANSIBLE_VALIDATE_JSONSCHEMA_DRAFT": "draft4"}
+        with patch.dict(os.environ, env):
+            validator = self._load()
+            self.assertEqual(
+                validator._get_sub_plugin_options("draft"), "draft4"
+            )
+            validator = self._load(plugin_vars=plugin_vars)
+            self.assertEqual(
+                validator._get_sub_plugin_options("draft"), "draft6"
+            )
+            validator = self._load(
+                plugin_vars=plugin_vars, kwargs={"draft": "draft3"}
+            )
+            self.assertEqual(
+                validator._get_sub_plugin_options("draft"), "draft3"
+            )
+        validator = self._load()
+        self.assertEqual(validator._get_sub_plugin_options("draft"), "draft7")
+
+    def test_option_defaults(self):
+        """Check the caller's defaults are only used when an option
+        is not passed, set as a var or env"""
+        defaults = {"fail_fast": True}
+        validator = self._load(option_defaults=defaults)
+        self.assertTrue(validator._get_sub_plugin_options("fail_fast"))
+        validator = self._load(
+            kwargs={"fail_fast": False}, option_defaults=defaults
+        )
+        self.assertFalse(validator._get_sub_plugin_options("fail_fast"))
+        plugin_vars = {"ansible_validate_jsonschema_fail_fast": False}
+        validator = self._load(
+            plugin_vars=plugin_vars, option_defaults=defaults
+        )
+        self.assertFalse(validator._get_sub_plugin_options("fail_fast"))
+        env = {"ANSIBLE_VALIDATE_JSONSCHEMA_FAIL_FAST": "false"}
+        with patch.dict(os.environ, env):
+            validator = self._load(option_defaults=defaults)
+        self.assertFalse(validator._get_sub_plugin_options("fail_fast"))
+
+    def test_invalid_option_value(self):
+        """Check an invalid option value still fails"""
+        validator, result = _load_validator(
+            engine="ansible.utils.jsonschema",
+            data=DATA,
+            criteria=CRITERIA,
+            kwargs={"draft": "draft0"},
+        )
+        self.assertIsNone(validator)
+        self.assertIn(
+            "value of draft must be one of: draft3, draft4, draft6, draft7",
+            result["msg"],
+        )
+
+    def test_invalid_documentation(self):
+        """Check a documentation with invalid vars fails every time"""
+        doc = """
+        options:
+          draft:
+            vars:
+            - ansible_validate_jsonschema_draft
+        """
+        validator = self._load()
+        for _i in range(2):
+            with self.assertRaises(AnsibleError) as error:
+                validator._set_sub_plugin_options(doc)
+            self.assertIn("should to be type dict", str(error.exception))
+
+
+class TestValidateRecords(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._tmpdir)
+
+    def _write(self, name, contents):
+        path = os.path.join(self._tmpdir, name)
+        with open(path, "w") as fhand:
+            fhand.write(contents)
+        return path
+
+    def _validate_records(self, records, **kwargs):
+        validator, result = _load_validator(
+            engine="ansible.utils.jsonschema",
+            data=None,
+            criteria=CRITERIA,
+            kwargs=kwargs,
+        )
+        return validator.validate_records(records)
+
+    def test_read_json_lines(self):
+        """Check a JSON Lines file is read one record at a time"""
+        path = self._write("data.jsonl", '{"mtu": 1}\n\n{"mtu": 2}\n')
+        records = _read_records(path)
+        self.assertEqual(next(records), {"mtu": 1})
+        self.assertEqual(list(records), [{"mtu": 2}])
+
+    def test_read_yaml(self):
+        """Check every document of a YAML file is a record"""
+        path = self._write("data.yml", "---\nmtu: 1\n---\nmtu: 2\n---\n")
+        self.assertEqual(list(_read_records(path)), [{"mtu": 1}, {"mtu": 2}])
+        path = self._write("data.txt", "mtu: 3\n")
+        self.assertEqual(
+            list(_read_records(path, data_format="yaml")), [{"mtu": 3}]
+        )
+
+    def test_read_invalid(self):
+        """Check a record that cannot be read fails with its index"""
+        path = self._write("data.jsonl", '{"mtu": 1}\n{"mtu": \n')
+        with self.assertRaises(AnsibleError) as error:
+            list(_read_records(path))
+        self.assertIn("Failed to read record 1", str(error.exception))
+        with self.assertRaises(AnsibleError) as error:
+            list(_read_records(os.path.join(self._tmpdir, "missing")))
+        self.assertIn("Failed to open data file", str(error.exception))
+
+    def test_validate_records(self):
+        """Check the errors have the index of their record"""
+        records = [{"mtu": 1500}, {"mtu": 9001}, {"mtu": 1}, {"mtu": 9002}]
+        expected = self._validate_records(iter(records))
+        self.assertEqual([e["record"] for e in expected["errors"]], [1, 3])
+        self.assertEqual(expected["errors"][0]["data_path"], "mtu")
+        self.assertEqual(expected["errors"][0]["json_path"], "$.mtu")
+        self.assertEqual(len(expected["msg"].splitlines()), 2)
+        self.assertTrue(expected["msg"].startswith("Record 1: At '"))
+
+        for worker_type in ["thread", "process"]:
+            result = self._validate_records(
+                iter(records), workers=2, worker_type=worker_type
+            )
+            self.assertEqual(result, expected)
+
+    def test_validate_records_fail_fast(self):
+        """Check fail_fast stops at the first invalid record"""
+        records = [{"mtu": 1500}, {"mtu": 9001}, {"mtu": 9002}]
+        for workers in [1, 2]:
+            result = self._validate_records(
+                iter(records), fail_fast=True, workers=workers
+            )
+            self.assertEqual([e["record"] for e in result["errors"]], [1])
+
+    def test_validate_records_string_error(self):
+        """Check an error that is not a dict has the index of its record"""
+        validator, result = _load_validator(
+            engine="ansible.utils.jsonschema", data=None, criteria=CRITERIA
+        )
+        with patch.object(
+            validator, "validate", return_value={"errors": "bad schema"}
+        ):
+            result = validator.validate_records(iter([{"mtu": 1}] * 2))
+        self.assertEqual(
+            result["errors"], [{"record": 0, "msg": "bad schema"}]
+        )
+        self.assertEqual(result["msg"], "Record 0: bad schema")
+
+    def test_validate_records_invalid_record(self):
+        """Check a record that is not json fails with its index"""
+        records = [{"mtu": 1500}, {"mtu": set([1])}]
+        for workers in [1, 2]:
+            with self.assertRaises(AnsibleError) as error:
+                self._validate_records(iter(records), workers=workers)
+            self.assertIn(
+                "Record 1: 'data' option value is invalid",
+                str(error.exception),
+            )
@@ -33,6 +33,13 @@ class TestJsonParser(unittest.TestCase):
         result = parser.parse()
         self.assertEqual(result, {"parsed": test_value})
 
+    def test_json_parser_structured(self):
+        task_args = {"text": {"a": (1, 2)}}
+        parser = CliParser(task_args=task_args, task_vars=[], debug=False)
+
+        result = parser.parse()
+        self.assertEqual(result, {"parsed": {"a": [1, 2]}})
+
     def test_invalid_json(self):
         task_args = {"text": "Definitely not JSON"}
         parser = CliParser(task_args=task_args, task_vars=[], debug=False)
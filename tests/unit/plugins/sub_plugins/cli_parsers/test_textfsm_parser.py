@@ -5,13 +5,18 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import io
 import os
+import shutil
+import tempfile
 
 import pytest
 
 from ansible_collections.ansible.utils.tests.unit.compat import unittest
 from ansible_collections.ansible.utils.plugins.sub_plugins.cli_parser.textfsm_parser import (
     CliParser,
+    _TEMPLATE_CACHE,
+    _parse_chunks,
 )
 
 textfsm = pytest.importorskip("textfsm")
@@ -69,3 +74,84 @@ class TestTextfsmParser(unittest.TestCase):
             )
         }
         self.assertEqual(result, errors)
+
+    def test_textfsm_parser_template_cache(self):
+        nxos_cfg_path = os.path.join(
+            os.path.dirname(__file__), "fixtures", "nxos_show_version.cfg"
+        )
+        nxos_template_path = os.path.join(
+            os.path.dirname(__file__), "fixtures", "nxos_show_version.textfsm"
+        )
+        with open(nxos_cfg_path) as fhand:
+            nxos_show_version_output = fhand.read()
+
+        task_args = {
+            "text": nxos_show_version_output,
+            "parser": {
+                "name": "ansible.utils.textfsm",
+                "command": "show version",
+                "template_path": nxos_template_path,
+            },
+        }
+        _TEMPLATE_CACHE.clear()
+        messages = []
+        parser = CliParser(
+            task_args=task_args, task_vars=[], debug=messages.append
+        )
+        first = parser.parse()
+        second = parser.parse()
+        self.assertEqual(first, second)
+        self.assertEqual(len(first["parsed"]), 1)
+        self.assertIn("miss", messages[0])
+        self.assertIn("hit", messages[1])
+
+    def test_textfsm_parser_template_changed(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        template_path = os.path.join(tmpdir, "test.textfsm")
+        with open(template_path, "w") as fhand:
+            fhand.write(
+                "Value NAME (\\S+)\n\nStart\n  ^name ${NAME} -> Record\n"
+            )
+        task_args = {
+            "text": "name one\nhost two\n",
+            "parser": {
+                "name": "ansible.utils.textfsm",
+                "command": "show names",
+                "template_path": template_path,
+            },
+        }
+        parser = CliParser(task_args=task_args, task_vars=[], debug=False)
+        self.assertEqual(parser.parse(), {"parsed": [{"NAME": "one"}]})
+
+        with open(template_path, "w") as fhand:
+            fhand.write(
+                "Value HOSTNAME (\\S+)\n\nStart\n  ^host ${HOSTNAME} -> Record\n"
+            )
+        result = parser.parse()
+        self.assertEqual(result, {"parsed": [{"HOSTNAME": "two"}]})
+
+    def test_textfsm_parser_chunks(self):
+        template = (
+            "Value NAME (\\S+)\nValue STATE (\\S+)\n\nStart\n"
+            "  ^${NAME} is ${STATE} -> Record\n  ^end -> End\n"
+        )
+        text = "".join(
+            "Ethernet1/{0} is {1}\r\n".format(
+                index, "up" if index % 2 else "down"
+            )
+            for index in range(50)
+        )
+        text += "end\nEthernet2/1 is up\n"
+
+        def parse(text, chunk_size):
+            re_table = textfsm.TextFSM(io.StringIO(template))
+            return _parse_chunks(re_table, text, chunk_size)
+
+        expected = textfsm.TextFSM(io.StringIO(template)).ParseText(text)
+        self.assertEqual(len(expected), 50)
+        for chunk_size in [1, 10, 100, 65536]:
+            self.assertEqual(parse(text, chunk_size), expected)
+        self.assertEqual(parse(io.StringIO(text), 10), expected)
+        self.assertEqual(parse(text.splitlines(), 10), expected)
+        self.assertEqual(parse(None, 10), [])
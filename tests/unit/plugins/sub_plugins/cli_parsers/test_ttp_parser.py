@@ -6,12 +6,15 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import os
+import shutil
+import tempfile
 
 import pytest
 
 from ansible_collections.ansible.utils.tests.unit.compat import unittest
 from ansible_collections.ansible.utils.plugins.sub_plugins.cli_parser.ttp_parser import (
     CliParser,
+    _TTP_CACHE,
 )
 
 textfsm = pytest.importorskip("ttp")
@@ -69,3 +72,84 @@ class TestTextfsmParser(unittest.TestCase):
             )
         }
         self.assertEqual(result, errors)
+
+    def _task_args(self, text=""):
+        nxos_template_path = os.path.join(
+            os.path.dirname(__file__), "fixtures", "nxos_show_version.ttp"
+        )
+        return {
+            "text": text,
+            "parser": {
+                "name": "ansible.utils.ttp",
+                "command": "show version",
+                "template_path": nxos_template_path,
+            },
+        }
+
+    def _nxos_output(self):
+        nxos_cfg_path = os.path.join(
+            os.path.dirname(__file__), "fixtures", "nxos_show_version.cfg"
+        )
+        with open(nxos_cfg_path) as fhand:
+            return fhand.read()
+
+    def test_ttp_parser_cache(self):
+        output = self._nxos_output()
+        _TTP_CACHE.clear()
+        messages = []
+        parser = CliParser(
+            task_args=self._task_args(output),
+            task_vars=[],
+            debug=messages.append,
+        )
+        first = parser.parse()
+        second = parser.parse()
+        self.assertEqual(first, second)
+        self.assertEqual(len(first["parsed"][0]), 1)
+        self.assertEqual(_TTP_CACHE.info()["size"], 1)
+        self.assertIn("miss", messages[0])
+        self.assertIn("hit", messages[1])
+
+    def test_ttp_parser_cache_vars(self):
+        task_args = self._task_args(self._nxos_output())
+        _TTP_CACHE.clear()
+        CliParser(task_args=task_args, task_vars=[], debug=False).parse()
+        task_args["parser"]["vars"] = {"ttp_vars": {"var": "value"}}
+        CliParser(task_args=task_args, task_vars=[], debug=False).parse()
+        self.assertEqual(_TTP_CACHE.info()["size"], 2)
+
+    def test_ttp_parser_cache_global_vars(self):
+        """ Check a value recorded while parsing one output is not used
+        when the cached ttp object parses the next output
+        """
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        template_path = os.path.join(tmpdir, "record.ttp")
+        with open(template_path, "w") as fhand:
+            fhand.write(
+                '<group name="system">\n'
+                'hostname {{ hostname | record("HOST") }}\n'
+                "</group>\n"
+                '<group name="interfaces">\n'
+                "interface {{ interface }}\n"
+                '{{ host | set("HOST") }}\n'
+                "</group>\n"
+            )
+        task_args = {
+            "text": "hostname r1\ninterface Eth1\n",
+            "parser": {
+                "name": "ansible.utils.ttp",
+                "template_path": template_path,
+            },
+        }
+        _TTP_CACHE.clear()
+        first = CliParser(task_args=task_args, task_vars=[], debug=False)
+        self.assertEqual(
+            first.parse()["parsed"][0][0]["interfaces"]["host"], "r1"
+        )
+        task_args["text"] = "interface Eth2\n"
+        second = CliParser(task_args=task_args, task_vars=[], debug=False)
+        self.assertEqual(
+            second.parse()["parsed"][0][0]["interfaces"],
+            {"interface": "Eth2", "host": "HOST"},
+        )
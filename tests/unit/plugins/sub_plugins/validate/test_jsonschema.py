@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from collections import OrderedDict
+
+import pytest
+
+from ansible.errors import AnsibleError
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.validate import (
+    _load_validator,
+)
+from ansible_collections.ansible.utils.plugins.sub_plugins.validate.jsonschema import (
+    clear_validator_cache,
+    validator_cache_info,
+)
+
+jsonschema = pytest.importorskip("jsonschema")
+
+DATA = {"name": "eth0", "mtu": 1514, "enabled": True}
+
+CRITERIA_MTU_CHECK = {
+    "type": "object",
+    "properties": {"mtu": {"type": "number", "maximum": 1500}},
+}
+
+
+def _validate(data, criteria, **kwargs):
+    validator, result = _load_validator(
+        engine="ansible.utils.jsonschema",
+        data=data,
+        criteria=criteria,
+        kwargs=kwargs,
+    )
+    return validator.validate()
+
+
+class TestJsonschemaValidatorCache(unittest.TestCase):
+    def setUp(self):
+        clear_validator_cache()
+
+    def tearDown(self):
+        clear_validator_cache()
+
+    def test_validator_reused(self):
+        """Check the schema is compiled once for many calls"""
+        for _i in range(5):
+            result = _validate(DATA, CRITERIA_MTU_CHECK)
+            self.assertEqual(result["errors"][0]["data_path"], "mtu")
+        info = validator_cache_info()
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["hits"], 4)
+        self.assertEqual(info["size"], 1)
+
+    def test_validator_key_ordered(self):
+        """Check the errors follow the order of the schema keywords"""
+        data = {"x": 1}
+        criteria = {"required": ["a", "b"], "minProperties": 2}
+        reordered = {"minProperties": 2, "required": ["a", "b"]}
+        result = _validate(data, criteria)
+        self.assertEqual(
+            [error["validator"] for error in result["errors"]],
+            ["required", "required", "minProperties"],
+        )
+        result = _validate(data, reordered)
+        self.assertEqual(
+            [error["validator"] for error in result["errors"]],
+            ["minProperties", "required", "required"],
+        )
+        self.assertEqual(validator_cache_info()["size"], 2)
+
+    def test_validator_key_draft(self):
+        """Check each draft gets its own validator"""
+        _validate(DATA, CRITERIA_MTU_CHECK, draft="draft4")
+        _validate(DATA, CRITERIA_MTU_CHECK, draft="draft7")
+        self.assertEqual(validator_cache_info()["size"], 2)
+
+    def test_validator_schema_copied(self):
+        """Check changing a schema after use does not change the
+        cached validator"""
+        criteria = {
+            "type": "object",
+            "properties": {"mtu": {"type": "number", "maximum": 1500}},
+        }
+        self.assertIn("errors", _validate(DATA, criteria))
+        criteria["properties"]["mtu"]["maximum"] = 9000
+        self.assertNotIn("errors", _validate(DATA, criteria))
+        criteria["properties"]["mtu"]["maximum"] = 1500
+        self.assertIn("errors", _validate(DATA, criteria))
+
+
+class TestJsonschemaCheckArgs(unittest.TestCase):
+    def _validator(self, data, criteria):
+        validator, result = _load_validator(
+            engine="ansible.utils.jsonschema", data=data, criteria=criteria
+        )
+        return validator
+
+    def test_native_data_not_copied(self):
+        """Check data made of native types is validated as is"""
+        validator = self._validator(DATA, [CRITERIA_MTU_CHECK])
+        validator._check_args()
+        self.assertIs(validator._data, DATA)
+        self.assertIs(validator._criteria[0], CRITERIA_MTU_CHECK)
+
+    def test_non_native_data_converted(self):
+        """Check tuples and OrderedDicts are converted"""
+        data = OrderedDict([("mtu", 1514), ("vlans", (10, 20))])
+        validator = self._validator(data, [CRITERIA_MTU_CHECK])
+        validator._check_args()
+        self.assertEqual(validator._data, {"mtu": 1514, "vlans": [10, 20]})
+        self.assertIs(type(validator._data), dict)
+
+    def test_invalid_data(self):
+        """Check data that is not json fails with the same error"""
+        validator = self._validator({"a": set([1])}, [CRITERIA_MTU_CHECK])
+        with self.assertRaises(AnsibleError) as error:
+            validator._check_args()
+        self.assertIn(
+            "'data' option value is invalid, value should a valid JSON",
+            str(error.exception),
+        )
+
+        data = {}
+        data["self"] = data
+        validator = self._validator(data, [CRITERIA_MTU_CHECK])
+        with self.assertRaises(AnsibleError) as error:
+            validator._check_args()
+        self.assertIn("'data' option value is invalid", str(error.exception))
+
+    def test_invalid_criteria(self):
+        """Check criteria that is not json fails with the same error"""
+        validator = self._validator(DATA, [{"type": set(["object"])}])
+        with self.assertRaises(AnsibleError) as error:
+            validator._check_args()
+        self.assertIn(
+            "'criteria' option value is invalid, value should a valid JSON",
+            str(error.exception),
+        )
+
+
+CRITERIA_NAME_CHECK = {
+    "type": "object",
+    "properties": {"name": {"type": "string", "pattern": "^Gig"}},
+}
+
+CRITERIA_ENABLED_CHECK = {
+    "type": "object",
+    "properties": {"enabled": {"enum": [False]}, "mtu": {"minimum": 9000}},
+}
+
+CRITERIA = [CRITERIA_MTU_CHECK, CRITERIA_NAME_CHECK, CRITERIA_ENABLED_CHECK]
+
+
+class TestJsonschemaFailFastWorkers(unittest.TestCase):
+    def test_fail_fast(self):
+        """Check only the first error is returned"""
+        result = _validate(DATA, CRITERIA)
+        self.assertEqual(len(result["errors"]), 4)
+        result = _validate(DATA, CRITERIA, fail_fast=True)
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertEqual(result["errors"][0]["data_path"], "mtu")
+        self.assertEqual(result["msg"].count("At '"), 1)
+
+    def test_fail_fast_valid(self):
+        """Check valid data has no errors with fail_fast"""
+        result = _validate({"mtu": 1500}, CRITERIA_MTU_CHECK, fail_fast=True)
+        self.assertEqual(result, {})
+
+    def test_workers(self):
+        """Check the workers return the same result in the same order"""
+        expected = _validate(DATA, CRITERIA)
+        for worker_type in ["thread", "process"]:
+            result = _validate(
+                DATA, CRITERIA, workers=3, worker_type=worker_type
+            )
+            self.assertEqual(result, expected)
+
+    def test_workers_fail_fast(self):
+        """Check the first error in criteria order is returned"""
+        result = _validate(DATA, CRITERIA, workers=3, fail_fast=True)
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertEqual(result["errors"][0]["data_path"], "mtu")
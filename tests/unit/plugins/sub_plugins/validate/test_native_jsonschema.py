@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+import pytest
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.validate import (
+    _load_validator,
+)
+from ansible_collections.ansible.utils.plugins.sub_plugins.validate.native_jsonschema import (
+    _compiled_check,
+    check_cache_info,
+    clear_check_cache,
+)
+
+jsonschema = pytest.importorskip("jsonschema")
+
+INTERFACE = {
+    "type": "object",
+    "required": ["name", "mtu", "speed"],
+    "properties": {
+        "name": {"type": "string", "pattern": "^(Gig|Ten)"},
+        "mtu": {"type": "integer", "minimum": 68, "maximum": 9216},
+        "enabled": {"type": "boolean"},
+        "mode": {"enum": ["access", "trunk", 1, None]},
+        "vlans": {
+            "type": "array",
+            "items": {"type": ["integer", "null"], "maximum": 4094},
+        },
+        "description": {"type": ["string", "null"]},
+        "shape": {
+            "type": "object",
+            "properties": {"rate": {"type": "number", "minimum": 0.5}},
+        },
+    },
+}
+
+# (criteria, data), each is validated by both engines
+CASES = [
+    (INTERFACE, {"name": "GigabitEthernet0/1", "mtu": 1500, "speed": 1}),
+    (INTERFACE, {"name": "eth0", "mtu": 1500.5, "enabled": 1}),
+    (INTERFACE, {"name": 1, "mtu": 10000, "mode": True, "speed": None}),
+    (INTERFACE, {"mtu": 1.0, "vlans": [1, 5000, None, "10", True, 2.0]}),
+    (INTERFACE, {"mtu": 60, "mode": 1.0, "shape": {"rate": 0}}),
+    (INTERFACE, {"mode": False, "shape": [], "description": 0}),
+    (INTERFACE, ["name", "mtu"]),
+    # string data is read as json
+    (INTERFACE, '"GigabitEthernet0/1"'),
+    (INTERFACE, None),
+    ({"enum": [[1, {"a": True}], 0]}, [1, {"a": 1}]),
+    ({"enum": [[1, {"a": True}], 0]}, [1, {"a": True}]),
+    ({"enum": [[1, {"a": True}], 0]}, False),
+    ({"type": "number", "maximum": 10}, True),
+    ({"type": "integer"}, 3.0),
+    ({"items": {"required": ["a"]}}, [{}, {"a": 1}, {}, 3]),
+    ({"title": "annotated", "description": "x", "type": "null"}, 0),
+    ({"type": "array", "required": ["a"]}, {"x": 1}),
+    ({"required": ["a"], "type": "array"}, {"x": 1}),
+]
+
+
+def _validate(engine, data, criteria, **kwargs):
+    validator, result = _load_validator(
+        engine=engine, data=data, criteria=criteria, kwargs=kwargs
+    )
+    return validator.validate()
+
+
+class TestNativeJsonschemaDifferential(unittest.TestCase):
+    def setUp(self):
+        clear_check_cache()
+
+    def _assert_same(self, data, criteria, **kwargs):
+        expected = _validate(
+            "ansible.utils.jsonschema", data, criteria, **kwargs
+        )
+        result = _validate(
+            "ansible.utils.native_jsonschema", data, criteria, **kwargs
+        )
+        self.assertEqual(result, expected)
+
+    def test_cases_compiled(self):
+        """Check each schema of the cases is compiled"""
+        for draft in ["draft4", "draft6", "draft7"]:
+            for criteria, _data in CASES:
+                self.assertIsNotNone(_compiled_check(draft, criteria))
+
+    def test_same_result(self):
+        """Check both engines return the same errors and messages"""
+        for draft in ["draft4", "draft6", "draft7"]:
+            for criteria, data in CASES:
+                self._assert_same(data, criteria, draft=draft)
+
+    def test_same_result_fail_fast(self):
+        """Check both engines return the same first error"""
+        for criteria, data in CASES:
+            self._assert_same(data, criteria, fail_fast=True)
+
+    def test_same_result_many_criteria(self):
+        """Check a list of criteria returns the errors in the same order"""
+        criteria = [case[0] for case in CASES]
+        for _criteria, data in CASES:
+            self._assert_same(data, criteria)
+
+    def test_fallback(self):
+        """Check schemas using other keywords are validated by jsonschema"""
+        fallback = [
+            {"type": "string", "minLength": 3},
+            {"$ref": "#/definitions/a", "definitions": {"a": {}}},
+            {"properties": {"a": True}},
+            {"items": [{"type": "string"}]},
+            {"type": "string", "format": "ipv4"},
+            {"minimum": 3, "exclusiveMinimum": True},
+            {"type": "object"},
+        ]
+        for criteria in fallback[:-1]:
+            self.assertIsNone(_compiled_check("draft7", criteria))
+        self.assertIsNone(_compiled_check("draft3", fallback[-1]))
+        for criteria in fallback[:-2]:
+            for data in ['"ab"', '"1.1.1.1"', {"a": 1}, [1]]:
+                self._assert_same(data, criteria)
+        self._assert_same(2, fallback[-2], draft="draft4")
+        self._assert_same([], fallback[-1], draft="draft3")
+
+    def test_check_reused(self):
+        """Check the schema is compiled once for many calls"""
+        for _i in range(5):
+            _validate("ansible.utils.native_jsonschema", {}, INTERFACE)
+        info = check_cache_info()
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["hits"], 4)
+        self.assertEqual(info["size"], 1)
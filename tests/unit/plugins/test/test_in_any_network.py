@@ -48,3 +48,14 @@ class TestInAnyNetwork(unittest.TestCase):
             ip="8.8.8.8", networks=["10.0.0.0/8", "192.168.1.0/24"]
         )
         self.assertEqual(result, False)
+
+    def test_nested_and_ipv6(self):
+        """Check nested networks, IPv6 and invalid entries"""
+
+        networks = ["helloworld", "10.0.0.0/8", "10.1.0.0/16", "2001:db8::/32"]
+        self.assertTrue(_in_any_network("10.1.1.1", networks))
+        self.assertTrue(_in_any_network("10.1.0.0/24", networks))
+        self.assertTrue(_in_any_network("2001:db8::1", networks))
+        self.assertFalse(_in_any_network("2001:db9::1", networks))
+        self.assertFalse(_in_any_network("10.0.0.0/7", networks))
+        self.assertFalse(_in_any_network("helloworld", networks))
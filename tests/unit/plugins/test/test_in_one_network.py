@@ -48,3 +48,13 @@ class TestInOneNetwork(unittest.TestCase):
             ip="8.8.8.8", networks=["10.0.0.0/8", "10.1.1.0/24"]
         )
         self.assertEqual(result, False)
+
+    def test_duplicates_and_ipv6(self):
+        """Check duplicate networks and IPv6 networks are counted"""
+
+        networks = ["10.0.0.0/8", "192.168.1.0/24", "2001:db8::/32"]
+        self.assertTrue(_in_one_network("2001:db8::1", networks))
+        self.assertFalse(_in_one_network("2001:db9::1", networks))
+
+        networks = ["10.0.0.0/8", "10.0.0.0/8"]
+        self.assertFalse(_in_one_network("10.1.1.1", networks))